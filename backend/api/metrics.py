@@ -0,0 +1,38 @@
+﻿from __future__ import annotations
+
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from fastapi import APIRouter, Request, Response
+
+from backend.utils.metrics import CONTENT_TYPE, HTTP_REQUEST_SECONDS, METRICS
+
+
+# Mounted without the /api prefix, where Prometheus looks by default.
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    return Response(METRICS.render(), media_type=CONTENT_TYPE)
+
+
+async def record_request_latency(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    """HTTP middleware timing each request under its route template, not the raw path.
+
+    Streamed responses are timed until their headers are sent.
+    """
+    started = perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            perf_counter() - started,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(status),
+        )
@@ -0,0 +1,129 @@
+﻿from __future__ import annotations
+
+import cProfile
+from contextvars import ContextVar
+import functools
+import inspect
+import logging
+import pstats
+from threading import Lock
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+
+from backend.config import PROFILE_ALL_REQUESTS, PROFILE_HEADER
+from backend.repositories.profile_store import PROFILE_STORE
+
+
+# Set on profiled responses: the id to download the profile with, or "busy"
+# when another request was being profiled.
+PROFILE_ID_HEADER = "X-ReviewPackets-Profile-Id"
+
+# Profiles taken in worker threads during the current profiled request.
+_THREAD_PROFILES: ContextVar[list[cProfile.Profile] | None] = ContextVar("thread_profiles", default=None)
+
+# One capture at a time: concurrent captures would record each other's work.
+_CAPTURE_LOCK = Lock()
+
+logger = logging.getLogger("collaborator")
+
+
+class ProfiledRoute(APIRoute):
+    """Route that profiles its handler with cProfile when asked to.
+
+    A request is profiled when ``REVIEWPACKETS_PROFILE=1`` or when it sends
+    the ``X-ReviewPackets-Profile`` header. The handler (body parsing, the
+    endpoint, response serialization) is profiled on the event loop thread,
+    sync endpoints get a second profiler in the worker thread they run on,
+    and both are merged and saved to ``PROFILE_STORE``. Other work running on
+    the event loop at the same time shows up in the profile too; bodies of
+    streamed responses are produced after the capture ends.
+
+    Requests without the opt-in go straight to the normal handler, and no
+    profiler is created.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        self.dependant.call = _profiled_endpoint(self.dependant.call)
+        handler = super().get_route_handler()
+        route = self.path
+
+        async def route_handler(request: Request) -> Response:
+            if not PROFILE_ALL_REQUESTS and request.headers.get(PROFILE_HEADER, "0") == "0":
+                return await handler(request)
+            if not _CAPTURE_LOCK.acquire(blocking=False):
+                response = await handler(request)
+                response.headers[PROFILE_ID_HEADER] = "busy"
+                return response
+            try:
+                return await _capture(handler, request, route)
+            finally:
+                _CAPTURE_LOCK.release()
+
+        return route_handler
+
+
+async def _capture(handler: Callable[[Request], Awaitable[Response]], request: Request, route: str) -> Response:
+    thread_profiles: list[cProfile.Profile] = []
+    token = _THREAD_PROFILES.set(thread_profiles)
+    profile = cProfile.Profile()
+    status: int | None = 500
+    response: Response | None = None
+    started = perf_counter()
+    profile.enable()
+    try:
+        response = await handler(request)
+        status = response.status_code
+        return response
+    except HTTPException as exc:
+        status = exc.status_code
+        raise
+    finally:
+        profile.disable()
+        elapsed_ms = (perf_counter() - started) * 1000
+        _THREAD_PROFILES.reset(token)
+        stats = pstats.Stats(profile)
+        for thread_profile in thread_profiles:
+            stats.add(thread_profile)
+        try:
+            record = await run_in_threadpool(
+                PROFILE_STORE.save, stats, request.method, route, request.url.path, status, elapsed_ms
+            )
+        except OSError as exc:
+            logger.warning("Could not save request profile: %s", str(exc))
+        else:
+            logger.info(
+                "Captured request profile.",
+                extra={"profile_id": record.profile_id, "route": route, "elapsed_ms": record.elapsed_ms},
+            )
+            if response is not None:
+                response.headers[PROFILE_ID_HEADER] = record.profile_id
+
+
+def _profiled_endpoint(call: Callable[..., Any]) -> Callable[..., Any]:
+    # Async endpoints run on the event loop thread, which the route handler
+    # already profiles.
+    if inspect.iscoroutinefunction(call):
+        return call
+
+    @functools.wraps(call)
+    def endpoint(*args: Any, **kwargs: Any) -> Any:
+        thread_profiles = _THREAD_PROFILES.get()
+        if thread_profiles is None:
+            return call(*args, **kwargs)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ allows one active profiler, which then sees every thread.
+            return call(*args, **kwargs)
+        try:
+            return call(*args, **kwargs)
+        finally:
+            profile.disable()
+            thread_profiles.append(profile)
+
+    return endpoint
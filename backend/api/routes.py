@@ -1,49 +1,245 @@
 ﻿from __future__ import annotations
 
-import io
+import json
 import logging
-from pathlib import Path
+import os
+from typing import TYPE_CHECKING, Iterable, Iterator, Literal, Sequence
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Request
+from fastapi.responses import FileResponse, StreamingResponse
 
 from backend.config import DEFAULT_FILTERS
 from backend.models.schemas import (
     DumpUploadResponse,
+    DumpCacheStatsResponse,
+    DumpCacheClearResponse,
     KeysUploadResponse,
     PreviewRequest,
     PreviewResponse,
+    PreviewPageRequest,
+    PreviewPageResponse,
+    PreviewCacheStatsResponse,
     KeysTextRequest,
+    HealthResponse,
+    WarmupStatusResponse,
+    ProfileItem,
+    ProfileListResponse,
     CollaboratorConfigResponse,
+    ConfigStatsResponse,
     ReviewIdsResponse,
     ParseValidateRequest,
     ParseValidateResponse,
+    FetchJobRequest,
+    ParseCacheStatsResponse,
+    ParseCacheClearResponse,
+    ExtractionPlanStatsResponse,
+    ExtractionPlanClearResponse,
+    ParseJobStatusResponse,
+    ParseJobListResponse,
+    ResultRunSummary,
+    ResultRunListResponse,
+    ResultRunPageResponse,
     ValidationResultItem,
     ExportValidationCsvRequest,
     PdfPlanRequest,
     PdfPlanResponse,
     PdfPlanItem,
 )
-from backend.services.dump_service import DumpService
-from backend.services.keys_service import KeysService
-from backend.services.preview_service import PreviewService
-from backend.services.collaborator_service import CollaboratorService
-from backend.services.parser_service import ParserService
-from backend.services.validation_service import ValidationService
-from backend.services.pdf_service import PDFService
-from backend.services.config_service import ConfigService
-
-router = APIRouter()
+from backend.api.profiling import ProfiledRoute
+from backend.repositories.profile_store import PROFILE_FORMATS, PROFILE_STORE, ProfileNotFoundError, ProfileRecord
+from backend.repositories.result_store import RESULT_STORE, ResultRun, RunNotFoundError
+from backend.services.job_service import JobNotFoundError
+from backend.services.warmup_service import WarmupService, WarmupStatus
+from backend.utils.lazy import LazyService
+from backend.utils.ndjson import UnsupportedEncodingError
+from backend.utils.uploads import UploadTooLargeError, received_upload
+
+if TYPE_CHECKING:
+    from backend.services.collaborator_service import CollaboratorService
+    from backend.services.config_service import ConfigService
+    from backend.services.dump_service import DumpService
+    from backend.services.export_service import ExportService
+    from backend.services.fetch_service import FetchService
+    from backend.services.ingest_service import IngestService
+    from backend.services.job_service import JobService, ParseJob
+    from backend.services.keys_service import KeysService
+    from backend.services.parse_engine import ParseEngine, ReviewOutcome
+    from backend.services.pdf_service import PDFService
+    from backend.services.preview_service import PreviewService
+    from backend.services.validation_service import ValidationRow
+
+router = APIRouter(route_class=ProfiledRoute)
 logger = logging.getLogger("collaborator")
 
-dump_service = DumpService()
-keys_service = KeysService()
-preview_service = PreviewService()
-collaborator_service = CollaboratorService()
-parser_service = ParserService()
-validation_service = ValidationService()
-pdf_service = PDFService()
-config_service = ConfigService()
+
+# Services are built on first use (or by the warm-up) and import their
+# modules inside the factories, so importing this module stays cheap and the
+# backend answers the health check before pandas and the parsers are loaded.
+def _config_service() -> ConfigService:
+    from backend.services.config_service import ConfigService
+
+    return ConfigService()
+
+
+def _dump_service() -> DumpService:
+    from backend.services.dump_service import DumpService
+
+    return DumpService()
+
+
+def _keys_service() -> KeysService:
+    from backend.services.keys_service import KeysService
+
+    return KeysService()
+
+
+def _preview_service() -> PreviewService:
+    from backend.services.preview_service import PreviewService
+
+    return PreviewService()
+
+
+def _collaborator_service() -> CollaboratorService:
+    from backend.services.collaborator_service import CollaboratorService
+
+    return CollaboratorService(config_service.instance())
+
+
+def _pdf_service() -> PDFService:
+    from backend.services.pdf_service import PDFService
+
+    return PDFService()
+
+
+def _export_service() -> ExportService:
+    from backend.services.export_service import ExportService
+
+    return ExportService()
+
+
+def _parse_engine() -> ParseEngine:
+    from backend.services.parse_engine import ParseEngine
+
+    return ParseEngine(config_service=config_service.instance())
+
+
+def _job_service() -> JobService:
+    from backend.services.job_service import JobService
+
+    return JobService(parse_engine.instance())
+
+
+def _ingest_service() -> IngestService:
+    from backend.services.ingest_service import IngestService
+
+    return IngestService(parse_engine.instance())
+
+
+def _fetch_service() -> FetchService:
+    from backend.services.fetch_service import FetchService
+
+    return FetchService(parse_engine.instance(), config_service.instance())
+
+
+config_service: LazyService[ConfigService] = LazyService("config", _config_service)
+dump_service: LazyService[DumpService] = LazyService("dump", _dump_service)
+keys_service: LazyService[KeysService] = LazyService("keys", _keys_service)
+preview_service: LazyService[PreviewService] = LazyService("preview", _preview_service)
+collaborator_service: LazyService[CollaboratorService] = LazyService("collaborator", _collaborator_service)
+pdf_service: LazyService[PDFService] = LazyService("pdf", _pdf_service)
+export_service: LazyService[ExportService] = LazyService("export", _export_service)
+parse_engine: LazyService[ParseEngine] = LazyService("parse_engine", _parse_engine)
+job_service: LazyService[JobService] = LazyService("jobs", _job_service)
+ingest_service: LazyService[IngestService] = LazyService("ingest", _ingest_service)
+fetch_service: LazyService[FetchService] = LazyService("fetch", _fetch_service)
+
+warmup_service = WarmupService(
+    [
+        config_service,
+        dump_service,
+        keys_service,
+        preview_service,
+        collaborator_service,
+        pdf_service,
+        export_service,
+        parse_engine,
+        job_service,
+        ingest_service,
+        fetch_service,
+    ]
+)
+
+
+def _warmup_status(status: WarmupStatus) -> WarmupStatusResponse:
+    return WarmupStatusResponse(
+        state=status.state,
+        built=status.built,
+        pending=status.pending,
+        elapsed_ms=status.elapsed_ms,
+        error=status.error,
+    )
+
+
+def _profile_item(record: ProfileRecord) -> ProfileItem:
+    return ProfileItem(
+        profile_id=record.profile_id,
+        method=record.method,
+        route=record.route,
+        path=record.path,
+        status=record.status,
+        elapsed_ms=record.elapsed_ms,
+        created_at=record.created_at,
+        size_bytes=record.size_bytes,
+    )
+
+
+def _shutdown_services() -> None:
+    if job_service.is_built:
+        job_service.shutdown()
+    if parse_engine.is_built:
+        parse_engine.shutdown()
+
+
+router.add_event_handler("shutdown", _shutdown_services)
+
+ExportFormat = Literal["csv", "xlsx"]
+EventFormat = Literal["ndjson", "sse"]
+ValidationStatus = Literal["Complete", "Incomplete"]
+ProfileFormat = Literal["prof", "txt"]
+
+EVENT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+@router.get("/health", response_model=HealthResponse)
+def get_health() -> HealthResponse:
+    return HealthResponse(status="ok")
+
+
+@router.get("/warmup", response_model=WarmupStatusResponse)
+def get_warmup_status() -> WarmupStatusResponse:
+    return _warmup_status(warmup_service.status())
+
+
+@router.post("/warmup", response_model=WarmupStatusResponse, status_code=202)
+def start_warmup() -> WarmupStatusResponse:
+    return _warmup_status(warmup_service.start())
+
+
+@router.get("/profiles", response_model=ProfileListResponse)
+def list_profiles() -> ProfileListResponse:
+    return ProfileListResponse(profiles=[_profile_item(record) for record in PROFILE_STORE.list_profiles()])
+
+
+@router.get("/profiles/{profile_id}")
+def download_profile(profile_id: str, profile_format: ProfileFormat = Query("prof", alias="format")) -> FileResponse:
+    try:
+        path = PROFILE_STORE.file_path(profile_id, profile_format)
+    except ProfileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    return FileResponse(path, media_type=PROFILE_FORMATS[profile_format], filename=path.name)
 
 
 @router.get("/default-filters", response_model=list[str])
@@ -57,21 +253,42 @@ def get_headers() -> list[str]:
 
 
 @router.post("/dump", response_model=DumpUploadResponse)
-async def upload_dump(file: UploadFile = File(...)) -> DumpUploadResponse:
+def upload_dump(file: UploadFile = File(...)) -> DumpUploadResponse:
     try:
-        temp_path = _save_upload(file)
-        df = dump_service.load_dump(temp_path)
+        with received_upload(file.file, file.filename or "") as upload:
+            df = dump_service.load_dump(upload.path, content_hash=upload.sha256)
         return DumpUploadResponse(rows=len(df), columns=list(df.columns))
+    except UploadTooLargeError as exc:
+        raise HTTPException(status_code=413, detail=str(exc))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
 
+@router.get("/dump/cache", response_model=DumpCacheStatsResponse)
+def get_dump_cache_stats() -> DumpCacheStatsResponse:
+    stats = dump_service.get_cache_stats()
+    return DumpCacheStatsResponse(
+        entries=stats.entries,
+        size_bytes=stats.size_bytes,
+        max_bytes=stats.max_bytes,
+        hits=stats.hits,
+        misses=stats.misses,
+    )
+
+
+@router.delete("/dump/cache", response_model=DumpCacheClearResponse)
+def clear_dump_cache() -> DumpCacheClearResponse:
+    return DumpCacheClearResponse(removed=dump_service.clear_cache())
+
+
 @router.post("/keys/file", response_model=KeysUploadResponse)
-async def upload_keys(file: UploadFile = File(...)) -> KeysUploadResponse:
+def upload_keys(file: UploadFile = File(...)) -> KeysUploadResponse:
     try:
-        temp_path = _save_upload(file)
-        keys = keys_service.load_keys(temp_path)
+        with received_upload(file.file, file.filename or "") as upload:
+            keys = keys_service.load_keys(upload.path)
         return KeysUploadResponse(count=len(keys))
+    except UploadTooLargeError as exc:
+        raise HTTPException(status_code=413, detail=str(exc))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
@@ -92,31 +309,85 @@ def preview(payload: PreviewRequest) -> PreviewResponse:
         raise HTTPException(status_code=400, detail=str(exc))
 
 
+@router.post("/preview/page", response_model=PreviewPageResponse)
+def preview_page(payload: PreviewPageRequest) -> PreviewPageResponse:
+    try:
+        page = preview_service.build_preview_page(
+            payload.filters,
+            offset=payload.offset,
+            limit=payload.limit,
+            cursor=payload.cursor,
+            sort_by=payload.sort_by,
+            sort_desc=payload.sort_desc,
+            search=payload.search,
+            incomplete_only=payload.incomplete_only,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    return PreviewPageResponse(
+        total=page.total,
+        offset=page.offset,
+        limit=page.limit,
+        columns=page.columns,
+        rows=page.rows.to_dict(orient="records"),
+        next_cursor=page.next_cursor,
+        version=page.version,
+    )
+
+
+@router.get("/preview/cache", response_model=PreviewCacheStatsResponse)
+def get_preview_cache_stats() -> PreviewCacheStatsResponse:
+    stats = preview_service.get_cache_stats()
+    return PreviewCacheStatsResponse(
+        entries=stats.entries,
+        size_bytes=stats.size_bytes,
+        max_bytes=stats.max_bytes,
+        hits=stats.hits,
+        misses=stats.misses,
+        evictions=stats.evictions,
+    )
+
+
 @router.post("/export")
-def export_csv(payload: PreviewRequest) -> StreamingResponse:
+def export_csv(payload: PreviewRequest, export_format: ExportFormat = Query("csv", alias="format")) -> StreamingResponse:
     try:
         df = preview_service.build_preview(payload.filters)
-        buffer = io.StringIO()
-        df.to_csv(buffer, index=False)
-        buffer.seek(0)
-        headers = {
-            "Content-Disposition": "attachment; filename=review_packets.csv"
-        }
-        return StreamingResponse(buffer, media_type="text/csv", headers=headers)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
+    rows = export_service.frame_rows(df)
+    return _export_response(
+        [str(column) for column in df.columns],
+        rows,
+        export_format,
+        "review_packets",
+        line_terminator=os.linesep,
+    )
+
 
 @router.get("/collaborator/config", response_model=CollaboratorConfigResponse)
 def get_collaborator_config() -> CollaboratorConfigResponse:
     config = config_service.get_collaborator_config()
-    logger.info("Loaded Collaborator config.")
     return CollaboratorConfigResponse(
         base_url=config.base_url,
         review_path_template=config.review_path_template,
         request_timeout_seconds=config.request_timeout_seconds,
         max_retries=config.max_retries,
         batch_size=config.batch_size,
+        retry_backoff_seconds=config.retry_backoff_seconds,
+    )
+
+
+@router.get("/collaborator/config/stats", response_model=ConfigStatsResponse)
+def get_collaborator_config_stats() -> ConfigStatsResponse:
+    stats = config_service.stats()
+    return ConfigStatsResponse(
+        source=stats.source,
+        loads=stats.loads,
+        reloads=stats.reloads,
+        unchanged=stats.unchanged,
+        failures=stats.failures,
     )
 
 
@@ -142,69 +413,285 @@ def parse_and_validate_reviews(payload: ParseValidateRequest) -> ParseValidateRe
         extra={"reviews": len(payload.reviews), "selected_fields": payload.selected_fields},
     )
 
-    results: list[ValidationResultItem] = []
-    available_fields_set: set[str] = set()
+    outcomes = parse_engine.run(
+        [(review.review_id, review.html) for review in payload.reviews],
+        payload.selected_fields,
+    )
+    return _batch_response(outcomes, payload.selected_fields, source="parse-validate")
 
-    for review in payload.reviews:
-        parsed_fields = parser_service.parse_review_html(review.html)
-        available_fields_set.update(parsed_fields.keys())
-        validation_row = validation_service.validate(
-            review_id=review.review_id,
-            selected_fields=payload.selected_fields,
-            parsed_fields=parsed_fields,
-        )
-        results.append(
-            ValidationResultItem(
-                review_id=validation_row.review_id,
-                field_values=validation_row.field_values,
-                missing_fields=validation_row.missing_fields,
-                comment=validation_row.comment,
-                status=validation_row.status,
-            )
-        )
 
-    complete_count = sum(1 for row in results if row.status == "Complete")
+@router.post("/collaborator/parse-validate/ndjson", response_model=ParseValidateResponse)
+async def parse_and_validate_ndjson(
+    request: Request,
+    selected_fields: list[str] = Query(...),
+) -> ParseValidateResponse:
+    selected_fields = [field for field in selected_fields if field.strip()]
+    if not selected_fields:
+        logger.error("NDJSON parse/validate rejected: no selected fields.")
+        raise HTTPException(status_code=400, detail="At least one field must be selected.")
+
+    content_encoding = request.headers.get("content-encoding", "identity")
     logger.info(
-        "Completed parse/validate batch.",
-        extra={"total": len(results), "complete": complete_count, "incomplete": len(results) - complete_count},
+        "Starting NDJSON parse/validate stream.",
+        extra={"encoding": content_encoding, "selected_fields": selected_fields},
+    )
+    try:
+        outcomes = await ingest_service.parse_stream(request.stream(), content_encoding, selected_fields)
+    except UnsupportedEncodingError as exc:
+        raise HTTPException(status_code=415, detail=str(exc))
+    except ValueError as exc:
+        logger.error("NDJSON parse/validate failed: %s", str(exc))
+        raise HTTPException(status_code=400, detail=str(exc))
+    return _batch_response(outcomes, selected_fields, source="ndjson")
+
+
+@router.post("/collaborator/jobs", response_model=ParseJobStatusResponse, status_code=202)
+def submit_parse_job(payload: ParseValidateRequest) -> ParseJobStatusResponse:
+    if not payload.selected_fields:
+        logger.error("Parse/validate job rejected: no selected fields.")
+        raise HTTPException(status_code=400, detail="At least one field must be selected.")
+
+    job = job_service.submit(
+        [(review.review_id, review.html) for review in payload.reviews],
+        payload.selected_fields,
     )
+    return _job_status(job)
+
+
+@router.post("/collaborator/fetch-jobs", response_model=ParseJobStatusResponse, status_code=202)
+def submit_fetch_job(payload: FetchJobRequest) -> ParseJobStatusResponse:
+    if not payload.selected_fields:
+        logger.error("Fetch job rejected: no selected fields.")
+        raise HTTPException(status_code=400, detail="At least one field must be selected.")
+
+    try:
+        review_ids = payload.review_ids if payload.review_ids is not None else collaborator_service.extract_review_ids()
+    except ValueError as exc:
+        logger.error("Fetch job rejected: %s", str(exc))
+        raise HTTPException(status_code=400, detail=str(exc))
+    review_urls = collaborator_service.build_review_urls(review_ids)
+    if not review_urls:
+        raise HTTPException(status_code=400, detail="No review IDs to fetch.")
+    try:
+        fetch_service.check_review_urls(review_urls)
+    except ValueError as exc:
+        logger.error("Fetch job rejected: %s", str(exc))
+        raise HTTPException(status_code=400, detail=str(exc))
 
+    selected_fields = payload.selected_fields
+    cookies = dict(payload.cookies)
+    job = job_service.submit_outcomes(
+        len(review_urls),
+        selected_fields,
+        lambda cancelled: fetch_service.iter_outcomes(review_urls, selected_fields, cookies, cancelled),
+        source="fetch-job",
+    )
+    return _job_status(job)
+
+
+@router.get("/collaborator/jobs", response_model=ParseJobListResponse)
+def list_parse_jobs() -> ParseJobListResponse:
+    return ParseJobListResponse(jobs=[_job_status(job) for job in job_service.list_jobs()])
+
+
+@router.get("/collaborator/jobs/{job_id}", response_model=ParseJobStatusResponse)
+def get_parse_job(job_id: str) -> ParseJobStatusResponse:
+    return _job_status(_get_job(job_id))
+
+
+@router.post("/collaborator/jobs/{job_id}/cancel", response_model=ParseJobStatusResponse)
+def cancel_parse_job(job_id: str) -> ParseJobStatusResponse:
+    try:
+        job = job_service.cancel(job_id)
+    except JobNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    logger.info("Cancellation requested for parse/validate job.", extra={"job_id": job_id})
+    return _job_status(job)
+
+
+@router.delete("/collaborator/jobs/{job_id}", response_model=ParseJobStatusResponse)
+def delete_parse_job(job_id: str) -> ParseJobStatusResponse:
+    try:
+        job = job_service.delete(job_id)
+    except JobNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    return _job_status(job)
+
+
+@router.get("/collaborator/jobs/{job_id}/events")
+def stream_parse_job(
+    job_id: str,
+    event_format: EventFormat = Query("ndjson", alias="format"),
+    start: int = Query(0, ge=0),
+) -> StreamingResponse:
+    job = _get_job(job_id)
+    events = _job_events(job, start, event_format)
+    return StreamingResponse(
+        events,
+        media_type=EVENT_MEDIA_TYPES[event_format],
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.get("/collaborator/jobs/{job_id}/results", response_model=ParseValidateResponse)
+def get_parse_job_results(job_id: str, status: ValidationStatus | None = None) -> ParseValidateResponse:
+    job = _get_job(job_id)
+    outcomes = job.outcomes()
+    available_fields = sorted({field for outcome in outcomes for field in outcome.available_fields})
+    cache_hits = sum(1 for outcome in outcomes if outcome.cache_hit)
     return ParseValidateResponse(
-        available_fields=sorted(available_fields_set),
-        results=results,
+        available_fields=available_fields,
+        results=[_result_item(outcome.row) for outcome in outcomes if status is None or outcome.row.status == status],
+        cache_hits=cache_hits,
+        cache_misses=len(outcomes) - cache_hits,
+        cache_hit_ratio=_ratio(cache_hits, len(outcomes)),
+    )
+
+
+@router.get("/collaborator/jobs/{job_id}/export")
+def export_parse_job(
+    job_id: str,
+    export_format: ExportFormat = Query("csv", alias="format"),
+    status: ValidationStatus | None = None,
+) -> StreamingResponse:
+    job = _get_job(job_id)
+    rows = (_result_item(outcome.row) for outcome in job.outcomes() if status is None or outcome.row.status == status)
+    headers = ["Review ID", *job.selected_fields, "Missing Fields", "Comment", "Status"]
+    logger.info("Exporting parse/validate job.", extra={"job_id": job_id, "status_filter": status})
+    return _export_response(
+        headers,
+        _validation_rows(rows, job.selected_fields),
+        export_format,
+        "collaborator_validation",
+        quote_all=True,
+    )
+
+
+@router.get("/collaborator/parse-cache", response_model=ParseCacheStatsResponse)
+def get_parse_cache_stats() -> ParseCacheStatsResponse:
+    stats = parse_engine.cache_stats()
+    return ParseCacheStatsResponse(
+        entries=stats.disk.entries,
+        size_bytes=stats.disk.size_bytes,
+        max_bytes=stats.disk.max_bytes,
+        hits=stats.hits,
+        misses=stats.misses,
+        hit_ratio=_ratio(stats.hits, stats.hits + stats.misses),
+    )
+
+
+@router.delete("/collaborator/parse-cache", response_model=ParseCacheClearResponse)
+def clear_parse_cache() -> ParseCacheClearResponse:
+    return ParseCacheClearResponse(removed=parse_engine.clear_cache())
+
+
+@router.get("/collaborator/extraction-plans", response_model=ExtractionPlanStatsResponse)
+def get_extraction_plan_stats() -> ExtractionPlanStatsResponse:
+    stats = parse_engine.plan_stats()
+    return ExtractionPlanStatsResponse(
+        templates=stats.store.templates,
+        steps=stats.store.steps,
+        max_templates=stats.store.max_templates,
+        hits=stats.hits,
+        fallbacks=stats.fallbacks,
+        hit_ratio=_ratio(stats.hits, stats.hits + stats.fallbacks),
     )
 
 
+@router.delete("/collaborator/extraction-plans", response_model=ExtractionPlanClearResponse)
+def clear_extraction_plans() -> ExtractionPlanClearResponse:
+    return ExtractionPlanClearResponse(removed=parse_engine.clear_plans())
+
+
 @router.post("/collaborator/export-csv")
-def export_collaborator_csv(payload: ExportValidationCsvRequest) -> StreamingResponse:
+def export_collaborator_csv(
+    payload: ExportValidationCsvRequest,
+    export_format: ExportFormat = Query("csv", alias="format"),
+) -> StreamingResponse:
     logger.info(
         "Exporting collaborator CSV.",
         extra={"rows": len(payload.results), "selected_fields": payload.selected_fields},
     )
 
-    buffer = io.StringIO()
     headers = ["Review ID", *payload.selected_fields, "Missing Fields", "Comment", "Status"]
-    buffer.write(",".join(_csv_escape(header) for header in headers) + "\n")
-
-    for row in payload.results:
-        values = [row.review_id]
-        values.extend(row.field_values.get(field, "") for field in payload.selected_fields)
-        values.append(", ".join(row.missing_fields))
-        values.append(row.comment)
-        values.append(row.status)
-        buffer.write(",".join(_csv_escape(value) for value in values) + "\n")
-
-    buffer.seek(0)
-    response_headers = {
-        "Content-Disposition": "attachment; filename=collaborator_validation.csv"
-    }
-    return StreamingResponse(buffer, media_type="text/csv", headers=response_headers)
+    rows = _validation_rows(payload.results, payload.selected_fields)
+    return _export_response(headers, rows, export_format, "collaborator_validation", quote_all=True)
 
 
 @router.post("/collaborator/pdf-plan", response_model=PdfPlanResponse)
 def get_pdf_plan(payload: PdfPlanRequest) -> PdfPlanResponse:
+    return _pdf_plan(payload.eligible_review_ids)
+
+
+@router.get("/collaborator/runs", response_model=ResultRunListResponse)
+def list_result_runs() -> ResultRunListResponse:
+    return ResultRunListResponse(runs=[_run_summary(run) for run in RESULT_STORE.list_runs()])
+
+
+@router.get("/collaborator/runs/{run_id}", response_model=ResultRunPageResponse)
+def get_result_run(
+    run_id: str,
+    status: ValidationStatus | None = None,
+    missing_field: str | None = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=10_000),
+) -> ResultRunPageResponse:
+    run = _get_run(run_id)
+    rows = list(run.select(status=status, missing_field=missing_field))
+    return ResultRunPageResponse(
+        run_id=run.run_id,
+        selected_fields=list(run.selected_fields),
+        available_fields=list(run.available_fields),
+        total=len(rows),
+        offset=offset,
+        limit=limit,
+        results=[_result_item(row) for row in rows[offset : offset + limit]],
+    )
+
+
+@router.get("/collaborator/runs/{run_id}/export")
+def export_result_run(
+    run_id: str,
+    export_format: ExportFormat = Query("csv", alias="format"),
+    status: ValidationStatus | None = None,
+    missing_field: str | None = None,
+) -> StreamingResponse:
+    run = _get_run(run_id)
+    selected_fields = list(run.selected_fields)
+    logger.info(
+        "Exporting result run.",
+        extra={"run_id": run_id, "status_filter": status, "missing_field": missing_field},
+    )
+    headers = ["Review ID", *selected_fields, "Missing Fields", "Comment", "Status"]
+    rows = (_result_item(row) for row in run.select(status=status, missing_field=missing_field))
+    return _export_response(
+        headers,
+        _validation_rows(rows, selected_fields),
+        export_format,
+        "collaborator_validation",
+        quote_all=True,
+    )
+
+
+@router.post("/collaborator/runs/{run_id}/pdf-plan", response_model=PdfPlanResponse)
+def get_result_run_pdf_plan(
+    run_id: str,
+    status: Literal["Complete", "Incomplete", "all"] = "Complete",
+) -> PdfPlanResponse:
+    run = _get_run(run_id)
+    return _pdf_plan([row.review_id for row in run.select(status=None if status == "all" else status)])
+
+
+@router.delete("/collaborator/runs/{run_id}", response_model=ResultRunSummary)
+def delete_result_run(run_id: str) -> ResultRunSummary:
+    run = _get_run(run_id)
+    RESULT_STORE.delete(run_id)
+    return _run_summary(run)
+
+
+def _pdf_plan(eligible_review_ids: list[str]) -> PdfPlanResponse:
     output_dir = pdf_service.build_download_folder()
-    review_urls = collaborator_service.build_review_urls(payload.eligible_review_ids)
+    review_urls = collaborator_service.build_review_urls(eligible_review_ids)
 
     jobs = [
         PdfPlanItem(
@@ -217,21 +704,183 @@ def get_pdf_plan(payload: PdfPlanRequest) -> PdfPlanResponse:
 
     logger.info(
         "Generated PDF plan.",
-        extra={"eligible_ids": len(payload.eligible_review_ids), "jobs": len(jobs), "output_dir": str(output_dir)},
+        extra={"eligible_ids": len(eligible_review_ids), "jobs": len(jobs), "output_dir": str(output_dir)},
     )
 
     return PdfPlanResponse(output_dir=str(output_dir), jobs=jobs)
 
 
-def _save_upload(file: UploadFile) -> Path:
-    temp_dir = Path(__file__).resolve().parent.parent / "uploads"
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    temp_path = temp_dir / file.filename
-    with temp_path.open("wb") as target:
-        target.write(file.file.read())
-    return temp_path
+def _get_run(run_id: str) -> ResultRun:
+    try:
+        return RESULT_STORE.get(run_id)
+    except RunNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+
+def _run_summary(run: ResultRun) -> ResultRunSummary:
+    complete = run.complete
+    return ResultRunSummary(
+        run_id=run.run_id,
+        source=run.source,
+        created_at=run.created_at,
+        selected_fields=list(run.selected_fields),
+        total=len(run.rows),
+        complete=complete,
+        incomplete=len(run.rows) - complete,
+    )
+
+
+def _batch_response(outcomes: list[ReviewOutcome], selected_fields: list[str], source: str) -> ParseValidateResponse:
+    results: list[ValidationResultItem] = []
+    available_fields_set: set[str] = set()
+    cache_hits = plan_hits = plan_fallbacks = 0
+    for outcome in outcomes:
+        if outcome.cache_hit:
+            cache_hits += 1
+        plan_hits += outcome.plan_hits
+        plan_fallbacks += outcome.plan_fallbacks
+        if outcome.error:
+            logger.error("Failed to parse review %s: %s", outcome.review_id, outcome.error)
+        available_fields_set.update(outcome.available_fields)
+        results.append(_result_item(outcome.row))
+
+    run = RESULT_STORE.save(
+        [outcome.row for outcome in outcomes],
+        selected_fields,
+        available_fields=available_fields_set,
+        source=source,
+    )
+    complete_count = sum(1 for row in results if row.status == "Complete")
+    cache_misses = len(outcomes) - cache_hits
+    logger.info(
+        "Completed parse/validate batch.",
+        extra={
+            "run_id": run.run_id,
+            "total": len(results),
+            "complete": complete_count,
+            "incomplete": len(results) - complete_count,
+            "cache_hits": cache_hits,
+            "cache_misses": cache_misses,
+            "plan_hits": plan_hits,
+            "plan_fallbacks": plan_fallbacks,
+        },
+    )
+
+    return ParseValidateResponse(
+        available_fields=sorted(available_fields_set),
+        results=results,
+        cache_hits=cache_hits,
+        cache_misses=cache_misses,
+        cache_hit_ratio=_ratio(cache_hits, len(outcomes)),
+        plan_hits=plan_hits,
+        plan_fallbacks=plan_fallbacks,
+        run_id=run.run_id,
+    )
+
+
+def _get_job(job_id: str) -> ParseJob:
+    try:
+        return job_service.get(job_id)
+    except JobNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+
+def _job_status(job: ParseJob) -> ParseJobStatusResponse:
+    progress = job.progress()
+    return ParseJobStatusResponse(
+        job_id=progress.job_id,
+        status=progress.status,
+        total=progress.total,
+        completed=progress.completed,
+        complete=progress.complete,
+        incomplete=progress.incomplete,
+        failed=progress.failed,
+        cache_hits=progress.cache_hits,
+        avg_review_ms=progress.avg_review_ms,
+        max_review_ms=progress.max_review_ms,
+        created_at=progress.created_at,
+        finished_at=progress.finished_at,
+        error=progress.error,
+    )
+
+
+def _job_events(job: ParseJob, start: int, event_format: str) -> Iterator[str]:
+    """Serialize a job's outcomes as NDJSON lines or server-sent events as they arrive.
+
+    A ``progress`` event is sent while nothing new has completed and a final
+    ``end`` event carries the job status.
+    """
+    completed = start
+    for item in job_service.iter_results(job.job_id, start=start):
+        if item is None:
+            yield _format_event("progress", {"completed": completed, "total": job.total, "status": job.status}, event_format)
+            continue
+        position, outcome = item
+        completed += 1
+        yield _format_event("result", _result_event(position, outcome, completed, job.total), event_format)
+    yield _format_event("end", _job_status(job).model_dump(mode="json"), event_format)
+
+
+def _result_event(position: int, outcome: ReviewOutcome, completed: int, total: int) -> dict:
+    return {
+        "index": position,
+        "completed": completed,
+        "total": total,
+        "elapsed_ms": round(outcome.elapsed_ms, 3),
+        "cache_hit": outcome.cache_hit,
+        "error": outcome.error,
+        "available_fields": outcome.available_fields,
+        "result": _result_item(outcome.row).model_dump(),
+    }
+
+
+def _format_event(event_type: str, data: dict, event_format: str) -> str:
+    if event_format == "sse":
+        return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+    return json.dumps({"type": event_type, **data}) + "\n"
+
+
+def _result_item(row: ValidationRow) -> ValidationResultItem:
+    return ValidationResultItem(
+        review_id=row.review_id,
+        field_values=row.field_values,
+        missing_fields=row.missing_fields,
+        comment=row.comment,
+        status=row.status,
+        rule_failures=row.rule_failures,
+    )
+
+
+def _ratio(part: int, total: int) -> float:
+    return round(part / total, 4) if total else 0.0
 
 
-def _csv_escape(value: str) -> str:
-    text = str(value).replace('"', '""')
-    return f'"{text}"'
+def _validation_rows(results: Iterable[ValidationResultItem], selected_fields: list[str]) -> Iterator[list[str]]:
+    for row in results:
+        values = [row.review_id]
+        values.extend(row.field_values.get(field, "") for field in selected_fields)
+        values.append(", ".join(row.missing_fields))
+        values.append(row.comment)
+        values.append(row.status)
+        yield values
+
+
+def _export_response(
+    header: list[str],
+    rows: Iterable[Sequence[object]],
+    export_format: str,
+    basename: str,
+    quote_all: bool = False,
+    line_terminator: str = "\n",
+) -> StreamingResponse:
+    content = export_service.stream(
+        header,
+        rows,
+        export_format=export_format,
+        quote_all=quote_all,
+        line_terminator=line_terminator,
+    )
+    headers = {
+        "Content-Disposition": f"attachment; filename={basename}.{export_format}"
+    }
+    return StreamingResponse(content, media_type=export_service.MEDIA_TYPES[export_format], headers=headers)
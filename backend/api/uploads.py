@@ -0,0 +1,54 @@
+﻿from __future__ import annotations
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.utils.uploads import MAX_UPLOAD_BYTES, upload_limit_message
+
+
+# Room for the multipart boundaries and part headers around the file itself;
+# save_upload enforces the exact limit on the file content.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadLimitMiddleware:
+    """Rejects multipart uploads over ``max_bytes`` before they are spooled.
+
+    Starlette reads the whole multipart body into a spooled temp file before
+    the endpoint runs. Requests that declare a larger ``Content-Length`` get a
+    413 without their body being read; for the others the body is counted as
+    it arrives and parsing stops with a 413 once the limit is passed.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int = MAX_UPLOAD_BYTES) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers = Headers(scope=scope) if scope["type"] == "http" else None
+        if headers is None or not headers.get("content-type", "").startswith("multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.max_bytes + MULTIPART_OVERHEAD_BYTES
+        declared = headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > limit:
+            response = JSONResponse({"detail": upload_limit_message(self.max_bytes)}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside the body parser, which lets HTTPException through.
+                    raise HTTPException(status_code=413, detail=upload_limit_message(self.max_bytes))
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,55 @@
+﻿"""Benchmark the duplicate-column merge engines.
+
+Run with ``python -m backend.benchmarks.bench_merge``.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+from time import perf_counter
+
+import pandas as pd
+
+from backend.utils.merge import merge_duplicate_columns
+
+
+DEFAULT_CELLS = [10_000, 100_000, 1_000_000]
+
+
+def build_frame(cells: int, duplicates: int = 10, blank_rate: float = 0.5, seed: int = 7) -> pd.DataFrame:
+    rng = random.Random(seed)
+    rows = max(1, cells // duplicates)
+    vocabulary = ["Done", "Reviewed by QA", "Pending sign-off", "See CR-1042", "N/A"]
+    data = {"Issue Key": [f"RP-{index}" for index in range(rows)]}
+    for copy in range(duplicates):
+        name = "Custom field" if copy == 0 else f"Custom field.{copy}"
+        data[name] = [
+            "" if rng.random() < blank_rate else rng.choice(vocabulary)
+            for _ in range(rows)
+        ]
+    return pd.DataFrame(data)
+
+
+def run(cells_list: list[int], engines: list[str]) -> list[dict]:
+    results = []
+    for cells in cells_list:
+        df = build_frame(cells)
+        for engine in engines:
+            started = perf_counter()
+            merge_duplicate_columns(df, engine=engine)
+            elapsed = perf_counter() - started
+            results.append({"cells": cells, "engine": engine, "seconds": elapsed})
+            print(f"{cells:>10,} cells  {engine:<10}  {elapsed:8.3f}s")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cells", type=int, nargs="+", default=DEFAULT_CELLS)
+    parser.add_argument("--engines", nargs="+", default=["python", "vectorized"])
+    args = parser.parse_args()
+    run(args.cells, args.engines)
+
+
+if __name__ == "__main__":
+    main()
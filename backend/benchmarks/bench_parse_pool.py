@@ -0,0 +1,74 @@
+﻿"""Compare serial and process-pool parse/validate throughput.
+
+Run with ``python -m backend.benchmarks.bench_parse_pool``.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from time import perf_counter
+
+from backend.services.parse_engine import ParseEngine
+
+
+SELECTED_FIELDS = ["Role", "Project", "Overview", "Participants"]
+
+
+def build_review_page(review_id: str, comment_rows: int = 400, metadata_last: bool = False) -> str:
+    """A review page with a comment table; ``metadata_last`` puts the field table after it."""
+    comments = "\n".join(
+        f"<tr><td>{review_id}-C{index}</td><td>Reviewer {index % 7}</td>"
+        f"<td>Comment text {index} about ledger posting and reconciliation.</td></tr>"
+        for index in range(comment_rows)
+    )
+    metadata = """<table>
+      <tr><th>Role</th><td>Author</td></tr>
+      <tr><th>Project</th><td>Core Banking</td></tr>
+      <tr><th>Overview</th><td>Validate transaction posting flow.</td></tr>
+    </table>"""
+    comment_section = f"<h2>Comments</h2>\n    <table>{comments}</table>"
+    body = [metadata, comment_section][:: -1 if metadata_last else 1]
+    return f"""<!doctype html>
+<html>
+  <head><title>{review_id} - Payments review</title></head>
+  <body>
+    <h1>Payments API Review {review_id}</h1>
+    <dl><dt>Participants</dt><dd>Alice, Bob</dd><dt>Defects</dt><dd>None</dd></dl>
+    {body[0]}
+    {body[1]}
+  </body>
+</html>"""
+
+
+def run(reviews: int, worker_counts: list[int], chunk_size: int, comment_rows: int) -> list[dict]:
+    batch = [(f"CR-{index}", build_review_page(f"CR-{index}", comment_rows)) for index in range(reviews)]
+    results = []
+    baseline = None
+    for workers in worker_counts:
+        engine = ParseEngine(max_workers=workers, chunk_size=chunk_size, parallel_threshold=0, use_cache=False)
+        try:
+            if workers > 1:
+                engine.run(batch[:workers], SELECTED_FIELDS)  # start the pool outside the timing
+            started = perf_counter()
+            engine.run(batch, SELECTED_FIELDS)
+            elapsed = perf_counter() - started
+        finally:
+            engine.shutdown()
+        baseline = baseline or elapsed
+        results.append({"workers": workers, "reviews": reviews, "seconds": elapsed, "speedup": baseline / elapsed})
+        print(f"{workers:>2} worker(s)  {reviews} reviews  {elapsed:8.3f}s  speedup x{baseline / elapsed:.2f}")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reviews", type=int, default=300)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, max(2, os.cpu_count() or 2)])
+    parser.add_argument("--chunk-size", type=int, default=4)
+    parser.add_argument("--comment-rows", type=int, default=400)
+    args = parser.parse_args()
+    run(args.reviews, args.workers, args.chunk_size, args.comment_rows)
+
+
+if __name__ == "__main__":
+    main()
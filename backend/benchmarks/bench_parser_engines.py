@@ -0,0 +1,85 @@
+﻿"""Per-page timing of the Collaborator parser engines.
+
+Each engine is timed on a full parse and on the targeted ``parse_selected``
+path that the parse/validate batch uses. Engines that support extraction
+plans are also timed on ``parse_selected`` with a plan learned from a first
+parse ("planned"); plans are off in the app (``REVIEWPACKETS_EXTRACTION_PLANS``)
+and this row shows why.
+
+Run with ``python -m backend.benchmarks.bench_parser_engines``.
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import tempfile
+from time import perf_counter
+
+from backend.benchmarks.bench_parse_pool import SELECTED_FIELDS, build_review_page
+from backend.repositories.extraction_plans import ExtractionPlanStore
+from backend.services.parser_engines import PARSER_ENGINES, LxmlParserEngine, create_parser_engine
+
+
+FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "collaborator_mock.html"
+
+
+def run(repeat: int, comment_rows: int, engines: list[str]) -> list[dict]:
+    pages = {
+        "fixture": FIXTURE.read_text(encoding="utf-8"),
+        f"synthetic-{comment_rows}-rows": build_review_page("CR-1", comment_rows),
+        f"synthetic-{comment_rows}-late": build_review_page("CR-1", comment_rows, metadata_last=True),
+    }
+    results = []
+    for page_name, html in pages.items():
+        reference = None
+        for engine_name in engines:
+            engine = create_parser_engine(engine_name)
+            fields = engine.parse(html)
+            reference = reference or fields
+            started = perf_counter()
+            for _ in range(repeat):
+                engine.parse(html)
+            per_page_ms = (perf_counter() - started) * 1000 / repeat
+            results.append({"page": page_name, "engine": engine_name, "mode": "full", "ms_per_page": per_page_ms})
+            same = "same fields" if fields == reference else "FIELDS DIFFER"
+            print(f"{page_name:<24} {engine_name:<6} full     {per_page_ms:9.3f} ms/page  ({len(html):,} chars, {same})")
+
+            parsed = engine.parse_selected(html, SELECTED_FIELDS)
+            started = perf_counter()
+            for _ in range(repeat):
+                engine.parse_selected(html, SELECTED_FIELDS)
+            per_page_ms = (perf_counter() - started) * 1000 / repeat
+            results.append({"page": page_name, "engine": engine_name, "mode": "selected", "ms_per_page": per_page_ms})
+            expected = {field: reference[field] for field in SELECTED_FIELDS if field in reference}
+            same = "same fields" if parsed.fields == expected and parsed.available_fields == list(reference) else "FIELDS DIFFER"
+            print(f"{page_name:<24} {engine_name:<6} selected {per_page_ms:9.3f} ms/page  ({len(SELECTED_FIELDS)} fields, {same})")
+
+            if engine_name != LxmlParserEngine.name:
+                continue
+            with tempfile.TemporaryDirectory() as plans_dir:
+                planned_engine = create_parser_engine(engine_name, ExtractionPlanStore(Path(plans_dir) / "plans.json"))
+                planned_engine.parse_selected(html, SELECTED_FIELDS)
+                started = perf_counter()
+                for _ in range(repeat):
+                    planned = planned_engine.parse_selected(html, SELECTED_FIELDS)
+                per_page_ms = (perf_counter() - started) * 1000 / repeat
+            results.append({"page": page_name, "engine": engine_name, "mode": "planned", "ms_per_page": per_page_ms})
+            same = "same fields" if planned.fields == parsed.fields else "FIELDS DIFFER"
+            print(
+                f"{page_name:<24} {engine_name:<6} planned  {per_page_ms:9.3f} ms/page  "
+                f"({planned.plan_hits} plan hits, {planned.plan_fallbacks} fallbacks, {same})"
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--comment-rows", type=int, default=400)
+    parser.add_argument("--engines", nargs="+", default=list(PARSER_ENGINES))
+    args = parser.parse_args()
+    run(args.repeat, args.comment_rows, args.engines)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+﻿"""Cold-start time of the backend app: ``import backend.main`` in a fresh interpreter.
+
+For each startup mode (``REVIEWPACKETS_STARTUP=lazy`` or ``eager``) it reports
+the median wall time of the import over ``--repeat`` fresh processes, then the
+time of the service warm-up that follows, and one ``python -X importtime``
+breakdown: every ``backend`` module and the heaviest other top-level packages by
+their own import time.
+
+Run with ``python -m backend.benchmarks.bench_startup``.
+"""
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+TIMING_SCRIPT = """
+from time import perf_counter
+started = perf_counter()
+import backend.main
+imported = perf_counter()
+backend.main.warmup_service.run()
+print(imported - started, perf_counter() - imported)
+"""
+
+
+def _run_python(args: list[str], mode: str, log_dir: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, REVIEWPACKETS_STARTUP=mode, REVIEWPACKETS_LOG_DIR=log_dir)
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def measure_wall(mode: str, repeat: int, log_dir: str) -> tuple[float, float]:
+    imports, warmups = [], []
+    for _ in range(repeat):
+        output = _run_python(["-c", TIMING_SCRIPT], mode, log_dir).stdout.split()
+        imports.append(float(output[-2]))
+        warmups.append(float(output[-1]))
+    return statistics.median(imports), statistics.median(warmups)
+
+
+def import_breakdown(mode: str, log_dir: str) -> list[tuple[str, int, int]]:
+    """``(module, self_us, cumulative_us)`` for every module imported by ``backend.main``."""
+    stderr = _run_python(["-X", "importtime", "-c", "import backend.main"], mode, log_dir).stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def run(modes: list[str], repeat: int, top: int) -> list[dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as log_dir:
+        for mode in modes:
+            import_seconds, warmup_seconds = measure_wall(mode, repeat, log_dir)
+            results.append({"mode": mode, "import_seconds": import_seconds, "warmup_seconds": warmup_seconds})
+            print(f"{mode:<6} import backend.main {import_seconds * 1000:8.1f} ms   warm-up {warmup_seconds * 1000:8.1f} ms")
+
+            modules = import_breakdown(mode, log_dir)
+            packages: dict[str, int] = defaultdict(int)
+            for name, self_us, cumulative_us in modules:
+                if name.startswith("backend"):
+                    print(f"    {name:<45} self {self_us / 1000:8.1f} ms  cumulative {cumulative_us / 1000:8.1f} ms")
+                else:
+                    packages[name.split(".")[0]] += self_us
+            for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+                print(f"    {package + ' (package)':<45} self {self_us / 1000:8.1f} ms")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modes", nargs="+", choices=["lazy", "eager"], default=["lazy", "eager"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="non-backend packages to list")
+    args = parser.parse_args()
+    run(args.modes, args.repeat, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+﻿"""Benchmark suite for the dump and review pipelines on synthetic data.
+
+For each dump size it generates a dump with ``backend.benchmarks.synthetic``
+and times:
+
+- ``load_table``: reading the CSV (and the XLSX, up to ``--xlsx-max-rows``)
+  with the streaming reader, including the duplicate-column merge.
+- ``merge_duplicate_columns``: the merge alone, on the frame as read.
+- ``build_preview``: ``PreviewService.build_preview`` with the preview cache
+  cleared, over all rows and with an issue-key filter of 10% of the rows.
+- ``export``: ``POST /api/export`` through the app, CSV and XLSX. The preview
+  is already cached, so this is the encoding and streaming cost.
+
+It also times ``ParserService.parse_review_html`` per engine on the
+Collaborator fixture and on synthetic pages of ``--page-kb`` kilobytes.
+
+Every measurement is run ``--repeat`` times. The median, the fastest run and
+the environment are written as JSON to ``--output``. With ``--baseline`` the
+run is compared with an earlier results file from the same machine and exits
+with status 1 when a measurement's fastest run is more than ``--threshold``
+slower (and at least ``--min-delta-ms`` slower). The fastest run is compared
+rather than the median because machine noise only ever adds time.
+
+Run with ``python -m backend.benchmarks.bench_suite``; for a quick check use
+``--rows 10000 --repeat 3``.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import json
+import logging
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+from time import perf_counter
+from typing import Callable
+
+import pandas as pd
+
+from backend.benchmarks.synthetic import FIXTURE, build_dump_frame, build_fixture_page, write_dump
+from backend.repositories.data_store import DATA_STORE
+from backend.repositories.preview_cache import PREVIEW_CACHE
+from backend.services.parser_engines import PARSER_ENGINES
+from backend.services.parser_service import ParserService
+from backend.services.preview_service import PreviewService
+from backend.utils.file_loader import load_table
+from backend.utils.merge import merge_duplicate_columns
+
+
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000]
+DEFAULT_PAGE_KB = [50, 250]
+
+PREVIEW_FILTERS = ["Summary", "Review Info", "Solution", "Status", "Acceptance Criteria", "Epic Link"]
+
+
+def _measure(func: Callable[[], object], repeat: int, before: Callable[[], None] | None = None) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        started = perf_counter()
+        func()
+        timings.append(perf_counter() - started)
+    return timings
+
+
+def _result(stage: str, size: str, variant: str, timings: list[float], items: int) -> dict:
+    median = statistics.median(timings)
+    result = {
+        "key": f"{stage}/{size}/{variant}",
+        "stage": stage,
+        "size": size,
+        "variant": variant,
+        "median_seconds": median,
+        "min_seconds": min(timings),
+        "runs": timings,
+        "items": items,
+        "items_per_second": items / median if median else None,
+    }
+    print(f"{result['key']:<52} {median * 1000:11.2f} ms  {result['items_per_second'] or 0:14,.0f} items/s")
+    return result
+
+
+def run_dump_stages(
+    rows: int,
+    repeat: int,
+    duplicate_columns: int,
+    copies: int,
+    blank_rate: float,
+    xlsx_max_rows: int,
+    work_dir: Path,
+) -> list[dict]:
+    from fastapi.testclient import TestClient
+
+    from backend.main import app
+
+    size = f"{rows}-rows"
+    started = perf_counter()
+    generated = build_dump_frame(rows, duplicate_columns, copies, blank_rate)
+    formats = ["csv", "xlsx"] if rows <= xlsx_max_rows else ["csv"]
+    paths = {export_format: write_dump(generated, work_dir / f"dump_{rows}.{export_format}") for export_format in formats}
+    del generated
+    print(f"-- {rows:,} rows: generated {', '.join(formats)} in {perf_counter() - started:.1f}s")
+
+    results = []
+    for file_format, path in paths.items():
+        timings = _measure(lambda: load_table(path, streaming=True), repeat)
+        results.append(_result("load_table", size, file_format, timings, rows))
+
+    raw = pd.read_csv(paths["csv"], dtype=str, keep_default_na=False)
+    timings = _measure(lambda: merge_duplicate_columns(raw), repeat)
+    results.append(_result("merge_duplicate_columns", size, "vectorized", timings, rows))
+    merged = merge_duplicate_columns(raw)
+    del raw
+
+    preview_service = PreviewService()
+    issue_keys = merged["Issue Key"].iloc[::10].tolist()
+    DATA_STORE.publish(dump_df=merged, issue_keys=[])
+    for variant, keys in (("all", []), ("keys-10pct", issue_keys)):
+        DATA_STORE.publish(issue_keys=keys)
+        timings = _measure(lambda: preview_service.build_preview(PREVIEW_FILTERS), repeat, before=PREVIEW_CACHE.clear)
+        results.append(_result("build_preview", size, variant, timings, rows))
+
+    DATA_STORE.publish(issue_keys=[])
+    preview_service.build_preview(PREVIEW_FILTERS)
+    client = TestClient(app)
+    for export_format in formats:
+
+        def export() -> None:
+            response = client.post("/api/export", params={"format": export_format}, json={"filters": PREVIEW_FILTERS})
+            response.raise_for_status()
+
+        timings = _measure(export, repeat)
+        results.append(_result("export", size, export_format, timings, rows))
+
+    # Release this size's frames before the next one is generated.
+    DATA_STORE.publish(dump_df=merged.iloc[:0], issue_keys=[])
+    PREVIEW_CACHE.clear()
+    return results
+
+
+def run_parse_stage(page_kbs: list[int], repeat: int, loops: int, engines: list[str]) -> list[dict]:
+    pages = {"fixture": FIXTURE.read_text(encoding="utf-8")}
+    pages.update({f"{kb}kb": build_fixture_page(target_kb=kb) for kb in page_kbs})
+    results = []
+    for engine in engines:
+        service = ParserService(engine=engine, plans=None)
+        for size, html in pages.items():
+            service.parse_review_html(html)
+
+            def parse_pages() -> None:
+                for _ in range(loops):
+                    service.parse_review_html(html)
+
+            timings = [seconds / loops for seconds in _measure(parse_pages, repeat)]
+            results.append(_result("parse_review_html", size, engine, timings, 1))
+    return results
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float, min_delta_seconds: float) -> list[str]:
+    """Describe every result whose fastest run is slower than the baseline's by more than both limits."""
+    previous = {result["key"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(result["key"])
+        if before is None:
+            print(f"{result['key']:<52} not in baseline")
+            continue
+        ratio = result["min_seconds"] / before["min_seconds"] if before["min_seconds"] else 1.0
+        delta = result["min_seconds"] - before["min_seconds"]
+        slower = ratio > 1 + threshold and delta > min_delta_seconds
+        print(f"{result['key']:<52} x{ratio:6.2f}  {delta * 1000:+11.2f} ms{'  REGRESSION' if slower else ''}")
+        if slower:
+            regressions.append(
+                f"{result['key']}: {before['min_seconds'] * 1000:.2f} ms -> {result['min_seconds'] * 1000:.2f} ms"
+                f" (x{ratio:.2f})"
+            )
+    return regressions
+
+
+def environment() -> dict:
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "pandas": pd.__version__,
+    }
+
+
+def run(args: argparse.Namespace) -> dict:
+    results = []
+    if "dump" in args.suites:
+        with tempfile.TemporaryDirectory() as work_dir:
+            for rows in args.rows:
+                results.extend(
+                    run_dump_stages(
+                        rows,
+                        args.repeat,
+                        args.duplicate_columns,
+                        args.copies,
+                        args.blank_rate,
+                        args.xlsx_max_rows,
+                        Path(work_dir),
+                    )
+                )
+    if "parse" in args.suites:
+        print("-- review pages")
+        results.extend(run_parse_stage(args.page_kb, args.repeat, args.parse_loops, args.engines))
+    options = {
+        name: getattr(args, name)
+        for name in ("rows", "repeat", "duplicate_columns", "copies", "blank_rate", "xlsx_max_rows", "page_kb")
+    }
+    return {"environment": environment(), "options": options, "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suites", nargs="+", choices=["dump", "parse"], default=["dump", "parse"])
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--duplicate-columns", type=int, default=2, help="headers that appear more than once")
+    parser.add_argument("--copies", type=int, default=2, help="times each duplicated header appears")
+    parser.add_argument("--blank-rate", type=float, default=0.3)
+    parser.add_argument("--xlsx-max-rows", type=int, default=100_000, help="largest dump also timed as XLSX")
+    parser.add_argument("--page-kb", type=int, nargs="+", default=DEFAULT_PAGE_KB)
+    parser.add_argument("--parse-loops", type=int, default=20, help="parses per timed run")
+    parser.add_argument("--engines", nargs="+", default=list(PARSER_ENGINES))
+    parser.add_argument("--output", type=Path, default=Path("bench_results.json"))
+    parser.add_argument("--baseline", type=Path, help="earlier results file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    # Keep the app's per-chunk progress logging off the console and out of the log files.
+    logging.basicConfig(level=logging.WARNING)
+    report = run(args)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Wrote {args.output}")
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        print(f"-- compared with {args.baseline} ({baseline['environment']['created_at']})")
+        regressions = compare(report["results"], baseline["results"], args.threshold, args.min_delta_ms / 1000)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+﻿"""Throughput of ValidationService on parsed review fields.
+
+Compares validating reviews one at a time with ``validate`` against one
+``validate_batch`` pass, for the default non-empty rule and for a set of
+configured rules (pattern, allowed values, min length, cross-field).
+
+Run with ``python -m backend.benchmarks.bench_validation``.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+from time import perf_counter
+
+from backend.services.config_service import ValidationRuleConfig
+from backend.services.validation_service import ValidationService
+
+
+SELECTED_FIELDS = ["Review ID", "Role", "Project", "Overview", "Participants", "Defects"]
+
+RULES = [
+    {"field": "Review ID", "pattern": r"CR-\d{4,}"},
+    {"field": "Role", "allowedValues": ["Author", "Reviewer", "Moderator"], "ignoreCase": True},
+    {"field": "Overview", "minLength": 12},
+    {"field": "Defects", "pattern": r"None|\d+ closed", "when": {"field": "Status", "equals": ["Closed"]}},
+]
+
+
+def build_parsed_fields(reviews: int, blank_rate: float = 0.1, seed: int = 7) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+
+    def value(text: str) -> str:
+        return "" if rng.random() < blank_rate else text
+
+    return [
+        {
+            "Review ID": value(f"CR-{1000 + index}" if index % 50 else str(index)),
+            "Role": value(rng.choice(["Author", "reviewer", "Moderator", "Lead"])),
+            "Project": value("Core Banking"),
+            "Overview": value(rng.choice(["Validate transaction posting flow.", "Quick fix"])),
+            "Participants": value("Alice, Bob"),
+            "Defects": value(rng.choice(["None", "2 closed", "1 open"])),
+            "Status": rng.choice(["Closed", "Open"]),
+        }
+        for index in range(reviews)
+    ]
+
+
+def run(review_counts: list[int], repeat: int) -> list[dict]:
+    service = ValidationService()
+    rule_sets = {
+        "default": None,
+        "rules": service.compile_rules([ValidationRuleConfig.model_validate(rule) for rule in RULES], SELECTED_FIELDS),
+    }
+    results = []
+    for reviews in review_counts:
+        parsed = build_parsed_fields(reviews)
+        review_ids = [f"CR-{index}" for index in range(reviews)]
+        for rules_name, rules in rule_sets.items():
+            timings = {}
+            outputs = {}
+            for mode in ("per-review", "batch"):
+                started = perf_counter()
+                for _ in range(repeat):
+                    if mode == "batch":
+                        rows = service.validate_batch(review_ids, SELECTED_FIELDS, parsed, rules)
+                    else:
+                        rows = [
+                            service.validate(review_id, SELECTED_FIELDS, fields, rules)
+                            for review_id, fields in zip(review_ids, parsed)
+                        ]
+                timings[mode] = (perf_counter() - started) / repeat
+                outputs[mode] = rows
+            same = "same rows" if outputs["batch"] == outputs["per-review"] else "ROWS DIFFER"
+            incomplete = sum(1 for row in outputs["batch"] if row.status == "Incomplete")
+            for mode, seconds in timings.items():
+                results.append(
+                    {
+                        "reviews": reviews,
+                        "rules": rules_name,
+                        "mode": mode,
+                        "seconds": seconds,
+                        "reviews_per_second": reviews / seconds,
+                    }
+                )
+                print(
+                    f"{reviews:>8} reviews  {rules_name:<8} {mode:<10} {seconds * 1000:9.2f} ms  "
+                    f"{reviews / seconds:12,.0f} reviews/s  ({incomplete} incomplete, {same})"
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reviews", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.reviews, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
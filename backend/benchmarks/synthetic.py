@@ -0,0 +1,183 @@
+﻿"""Synthetic Jira dumps and Collaborator review pages for benchmarks.
+
+Dumps have the columns of ``scripts/create_sample_excel.py``, some of them
+repeated under the same header the way Jira exports them, and a configurable
+share of blank cells. Review pages start from
+``tests/fixtures/collaborator_mock.html`` and are grown with extra metadata
+rows and a comment thread until they reach a target size.
+
+Write files for manual testing with, for example::
+
+    python -m backend.benchmarks.synthetic dump --rows 100000 --format xlsx --output sample/dump_100k.xlsx
+    python -m backend.benchmarks.synthetic page --kb 250 --output sample/review_250kb.html
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+
+FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "collaborator_mock.html"
+
+DUMP_COLUMNS = [
+    "Issue Key",
+    "Summary",
+    "Affects Version/s",
+    "Components/s",
+    "Priority",
+    "Status",
+    "Fix Version/s",
+    "Labels",
+    "Description",
+    "Category of Task",
+    "Affected Subsystem/s",
+    "Epic Link",
+    "Acceptance Criteria",
+    "Solution",
+    "Review Info",
+    "Issue Links",
+]
+
+# Columns repeated first when duplicate headers are requested; Jira repeats
+# free-text and multi-value fields.
+DUPLICATED_COLUMNS = ["Summary", "Review Info", "Solution", "Labels", "Issue Links", "Components/s"]
+
+_VOCABULARY = {
+    "Summary": ["Login fails", "Export CSV", "Filter issue keys", "Large file support", "Duplicate headers"],
+    "Affects Version/s": ["1.0", "1.1", "2.0", "2.1"],
+    "Components/s": ["Auth", "UI", "API", "Core", "ETL"],
+    "Priority": ["High", "Medium", "Low"],
+    "Status": ["Open", "In Progress", "In Review", "Done"],
+    "Fix Version/s": ["1.1", "1.2", "2.0", "2.2"],
+    "Labels": ["login,auth", "export", "perf", "headers", "review"],
+    "Description": [
+        "User cannot login after the password reset flow.",
+        "Add an export button to the packets view.",
+        "Handle dumps with 1000+ rows without freezing the UI.",
+    ],
+    "Category of Task": ["Bug", "Feature", "Task"],
+    "Affected Subsystem/s": ["Auth", "UI", "API", "Core"],
+    "Epic Link": ["EP-1", "EP-2", "EP-3", "EP-4"],
+    "Acceptance Criteria": ["Must accept terms", "CSV format", "Merge correctly", "Performance"],
+    "Solution": ["Implemented", "Done", "Solution text"],
+    "Review Info": ["Reviewed", "Complete", "See CR-1042"],
+    "Issue Links": ["REL-1", "REL-4", "REL-8", "REL-9"],
+}
+
+
+def dump_headers(duplicate_columns: int = 2, copies: int = 2) -> list[str]:
+    """Header row with the first ``duplicate_columns`` of ``DUPLICATED_COLUMNS`` appearing ``copies`` times."""
+    if not 0 <= duplicate_columns <= len(DUPLICATED_COLUMNS):
+        raise ValueError(f"duplicate_columns must be between 0 and {len(DUPLICATED_COLUMNS)}")
+    extra = [name for name in DUPLICATED_COLUMNS[:duplicate_columns] for _ in range(copies - 1)]
+    return DUMP_COLUMNS + extra
+
+
+def build_dump_frame(
+    rows: int,
+    duplicate_columns: int = 2,
+    copies: int = 2,
+    blank_rate: float = 0.3,
+    seed: int = 7,
+) -> pd.DataFrame:
+    """A dump as Jira exports it, with repeated headers left as they are.
+
+    Every cell except the issue key is blank with probability ``blank_rate``.
+    """
+    rng = np.random.default_rng(seed)
+    headers = dump_headers(duplicate_columns, copies)
+    columns = [np.char.add("RP-", np.arange(1, rows + 1).astype(str)).astype(object)]
+    for name in headers[1:]:
+        vocabulary = np.array(_VOCABULARY[name], dtype=object)
+        values = vocabulary[rng.integers(0, len(vocabulary), size=rows)]
+        values[rng.random(rows) < blank_rate] = ""
+        columns.append(values)
+    df = pd.DataFrame(dict(enumerate(columns)))
+    df.columns = headers
+    return df
+
+
+def write_dump(df: pd.DataFrame, path: Path) -> Path:
+    """Write ``df`` as ``.csv`` or ``.xlsx``, keeping repeated headers."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        df.to_csv(path, index=False)
+    elif suffix == ".xlsx":
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title="Issues")
+        sheet.append([str(column) for column in df.columns])
+        for row in df.itertuples(index=False, name=None):
+            sheet.append(row)
+        workbook.save(path)
+    else:
+        raise ValueError("Unsupported dump format. Use .csv or .xlsx")
+    return path
+
+
+def build_fixture_page(review_id: str = "CR-1001", target_kb: int = 250, extra_fields: int = 20, seed: int = 7) -> str:
+    """The Collaborator fixture page grown to about ``target_kb`` kilobytes.
+
+    The fixture's fields are kept, ``extra_fields`` labeled rows are added to
+    its metadata table, and a comment thread fills the page up to the target
+    size, the part that dominates real review pages.
+    """
+    rng = np.random.default_rng(seed)
+    html = FIXTURE.read_text(encoding="utf-8").replace("CR-1001", review_id)
+    extra_rows = "".join(
+        f"\n      <tr><th>Custom Field {index}</th><td>Value {index} for {review_id}</td></tr>"
+        for index in range(1, extra_fields + 1)
+    )
+    html = html.replace("\n    </table>", f"{extra_rows}\n    </table>", 1)
+
+    target_chars = target_kb * 1024
+    comments: list[str] = []
+    size = len(html)
+    index = 0
+    while size < target_chars:
+        index += 1
+        reviewer = f"Reviewer {int(rng.integers(1, 9))}"
+        row = (
+            f"\n      <tr><td>{review_id}-C{index}</td><td>{reviewer}</td><td>2024-03-{index % 28 + 1:02d}</td>"
+            f"<td>Comment {index} on ledger posting: check the reconciliation totals before sign-off.</td></tr>"
+        )
+        comments.append(row)
+        size += len(row)
+    thread = f"\n    <h2>Comments</h2>\n    <table class=\"comments\">{''.join(comments)}\n    </table>\n  </body>"
+    return html.replace("\n  </body>", thread, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    dump = commands.add_parser("dump", help="write a synthetic dump")
+    dump.add_argument("--rows", type=int, default=10_000)
+    dump.add_argument("--duplicate-columns", type=int, default=2)
+    dump.add_argument("--copies", type=int, default=2)
+    dump.add_argument("--blank-rate", type=float, default=0.3)
+    dump.add_argument("--format", choices=["csv", "xlsx"], default="xlsx")
+    dump.add_argument("--output", type=Path)
+    page = commands.add_parser("page", help="write a synthetic review page")
+    page.add_argument("--kb", type=int, default=250)
+    page.add_argument("--extra-fields", type=int, default=20)
+    page.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    if args.command == "dump":
+        output = (args.output or Path(f"synthetic_dump_{args.rows}")).with_suffix(f".{args.format}")
+        df = build_dump_frame(args.rows, args.duplicate_columns, args.copies, args.blank_rate)
+        write_dump(df, output)
+        print(f"Wrote {output} ({args.rows:,} rows, {len(df.columns)} columns)")
+    else:
+        output = args.output or Path(f"synthetic_review_{args.kb}kb.html")
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(build_fixture_page(target_kb=args.kb, extra_fields=args.extra_fields), encoding="utf-8")
+        print(f"Wrote {output} ({output.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,22 @@
-﻿from pathlib import Path
+﻿import logging
+import os
+from pathlib import Path
+
+
+def _env_int(name: str, default: int) -> int:
+    """Non-negative integer from the environment; bad values fall back to ``default`` with a warning."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        logging.getLogger(__name__).warning("Ignoring %s=%r: expected a non-negative integer.", name, value)
+        return default
+    return number
+
 
 APP_NAME = "ReviewPackets"
 DEFAULT_FILTERS = [
@@ -15,5 +33,50 @@ MAX_UPLOAD_MB = 200
 DATA_DIR = Path(__file__).resolve().parent / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+DUMP_CACHE_DIR = DATA_DIR / "dump_cache"
+DUMP_CACHE_MAX_MB = 1024
+
+PREVIEW_CACHE_MAX_MB = 256
+
+# 0 (the default) picks one worker per spare CPU, up to 8.
+PARSE_MAX_WORKERS = _env_int("REVIEWPACKETS_PARSE_WORKERS", 0) or max(1, min(8, (os.cpu_count() or 1) - 1))
+PARSE_CHUNK_SIZE = 4
+PARSE_PARALLEL_MIN_REVIEWS = 8
+
+# Decoded reviews waiting for a parse worker during NDJSON ingestion.
+INGEST_QUEUE_REVIEWS = 8
+
+JOB_MAX_RUNNING = 2
+JOB_MAX_RETAINED = 20
+JOB_RETENTION_SECONDS = 60 * 60
+
+RESULT_STORE_MAX_RUNS = 20
+RESULT_STORE_MAX_ROWS = 200_000
+RESULT_STORE_RETENTION_SECONDS = 4 * 60 * 60
+
+PARSE_CACHE_DIR = DATA_DIR / "parse_cache"
+PARSE_CACHE_MAX_MB = 256
+
+# Learned per-template extraction plans (lxml engine only). Off by default:
+# a plan hit still has to be checked against the higher-precedence sources,
+# so it costs about as much as the selected-field walk it replaces.
+EXTRACTION_PLANS_ENABLED = os.getenv("REVIEWPACKETS_EXTRACTION_PLANS", "0") == "1"
+EXTRACTION_PLAN_PATH = DATA_DIR / "extraction_plans.json"
+EXTRACTION_PLAN_MAX_TEMPLATES = 200
+
+# "lazy" builds the API services on first use (or on POST /api/warmup) so the
+# backend answers its health check quickly; "eager" builds them all at startup.
+STARTUP_MODE = os.getenv("REVIEWPACKETS_STARTUP", "lazy")
+
+# Opt-in request profiling. "1" profiles every API request; otherwise only
+# requests sent with the X-ReviewPackets-Profile header are profiled.
+PROFILE_ALL_REQUESTS = os.getenv("REVIEWPACKETS_PROFILE", "0") == "1"
+PROFILE_HEADER = "X-ReviewPackets-Profile"
+PROFILE_MAX_KEPT = 50
+PROFILE_TOP_FUNCTIONS = 30
+
+# "auto" uses lxml when it is installed and falls back to BeautifulSoup.
+PARSER_ENGINE = os.getenv("REVIEWPACKETS_PARSER_ENGINE", "auto")
+
 DEFAULT_COLLABORATOR_CONFIG_PATH = Path(__file__).resolve().parent / "collaborator_config.json"
 DEFAULT_DOWNLOADS_DIR = Path(__file__).resolve().parent.parent / "Downloads"
@@ -1,9 +1,14 @@
 ﻿from __future__ import annotations
 
+import multiprocessing
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.api.routes import router
+from backend.api.metrics import record_request_latency, router as metrics_router
+from backend.api.routes import router, warmup_service
+from backend.api.uploads import UploadLimitMiddleware
+from backend.config import STARTUP_MODE
 from backend.utils.logger import setup_logging
 from backend.utils.uvicorn_logging import build_uvicorn_log_config
 
@@ -12,6 +17,8 @@ def create_app() -> FastAPI:
     setup_logging()
     app = FastAPI(title="ReviewPackets API")
 
+    # Added first so it sits inside CORS and its 413 still carries the CORS headers.
+    app.add_middleware(UploadLimitMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["http://localhost:4200", "http://localhost:5173"],
@@ -20,7 +27,12 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    app.middleware("http")(record_request_latency)
+
     app.include_router(router, prefix="/api")
+    app.include_router(metrics_router)
+    if STARTUP_MODE == "eager":
+        warmup_service.run()
     return app
 
 
@@ -39,4 +51,6 @@ def run() -> None:
 
 
 if __name__ == "__main__":
+    # Required for the parse worker pool in the frozen (PyInstaller) build.
+    multiprocessing.freeze_support()
     run()
@@ -1,6 +1,8 @@
 ﻿from __future__ import annotations
 
-from pydantic import BaseModel
+from datetime import datetime
+
+from pydantic import BaseModel, Field
 
 
 class DumpUploadResponse(BaseModel):
@@ -8,6 +10,18 @@ class DumpUploadResponse(BaseModel):
     columns: list[str]
 
 
+class DumpCacheStatsResponse(BaseModel):
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+
+
+class DumpCacheClearResponse(BaseModel):
+    removed: int
+
+
 class KeysUploadResponse(BaseModel):
     count: int
 
@@ -20,6 +34,36 @@ class PreviewResponse(BaseModel):
     rows: list[dict]
 
 
+class PreviewCacheStatsResponse(BaseModel):
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class PreviewPageRequest(BaseModel):
+    filters: list[str]
+    offset: int = Field(default=0, ge=0)
+    limit: int = Field(default=100, ge=1, le=1000)
+    cursor: str | None = None
+    sort_by: str | None = None
+    sort_desc: bool = False
+    search: str | None = None
+    incomplete_only: bool = False
+
+
+class PreviewPageResponse(BaseModel):
+    total: int
+    offset: int
+    limit: int
+    columns: list[str]
+    rows: list[dict]
+    next_cursor: str | None
+    version: int
+
+
 class KeysTextRequest(BaseModel):
     keys: str
 
@@ -28,12 +72,48 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
+class HealthResponse(BaseModel):
+    status: str
+
+
+class ProfileItem(BaseModel):
+    profile_id: str
+    method: str
+    route: str
+    path: str
+    status: int | None
+    elapsed_ms: float
+    created_at: datetime
+    size_bytes: int
+
+
+class ProfileListResponse(BaseModel):
+    profiles: list[ProfileItem]
+
+
+class WarmupStatusResponse(BaseModel):
+    state: str
+    built: list[str]
+    pending: list[str]
+    elapsed_ms: float | None
+    error: str | None
+
+
 class CollaboratorConfigResponse(BaseModel):
     base_url: str
     review_path_template: str
     request_timeout_seconds: int
     max_retries: int
     batch_size: int
+    retry_backoff_seconds: float
+
+
+class ConfigStatsResponse(BaseModel):
+    source: str | None
+    loads: int
+    reloads: int
+    unchanged: int
+    failures: int
 
 
 class ReviewIdsResponse(BaseModel):
@@ -50,17 +130,100 @@ class ParseValidateRequest(BaseModel):
     reviews: list[ReviewHtmlItem]
 
 
+class FetchJobRequest(BaseModel):
+    selected_fields: list[str]
+    review_ids: list[str] | None = None
+    cookies: dict[str, str] = Field(default_factory=dict)
+
+
 class ValidationResultItem(BaseModel):
     review_id: str
     field_values: dict[str, str]
     missing_fields: list[str]
     comment: str
     status: str
+    rule_failures: list[str] = Field(default_factory=list)
 
 
 class ParseValidateResponse(BaseModel):
     available_fields: list[str]
     results: list[ValidationResultItem]
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_hit_ratio: float = 0.0
+    plan_hits: int = 0
+    plan_fallbacks: int = 0
+    run_id: str | None = None
+
+
+class ResultRunSummary(BaseModel):
+    run_id: str
+    source: str
+    created_at: datetime
+    selected_fields: list[str]
+    total: int
+    complete: int
+    incomplete: int
+
+
+class ResultRunListResponse(BaseModel):
+    runs: list[ResultRunSummary]
+
+
+class ResultRunPageResponse(BaseModel):
+    run_id: str
+    selected_fields: list[str]
+    available_fields: list[str]
+    total: int
+    offset: int
+    limit: int
+    results: list[ValidationResultItem]
+
+
+class ParseJobStatusResponse(BaseModel):
+    job_id: str
+    status: str
+    total: int
+    completed: int
+    complete: int
+    incomplete: int
+    failed: int
+    cache_hits: int
+    avg_review_ms: float
+    max_review_ms: float
+    created_at: datetime
+    finished_at: datetime | None = None
+    error: str | None = None
+
+
+class ParseJobListResponse(BaseModel):
+    jobs: list[ParseJobStatusResponse]
+
+
+class ParseCacheStatsResponse(BaseModel):
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    hit_ratio: float
+
+
+class ParseCacheClearResponse(BaseModel):
+    removed: int
+
+
+class ExtractionPlanStatsResponse(BaseModel):
+    templates: int
+    steps: int
+    max_templates: int
+    hits: int
+    fallbacks: int
+    hit_ratio: float
+
+
+class ExtractionPlanClearResponse(BaseModel):
+    removed: int
 
 
 class ExportValidationCsvRequest(BaseModel):
@@ -1,15 +1,96 @@
 ﻿from __future__ import annotations
 
-from dataclasses import dataclass, field
-from threading import Lock
+from dataclasses import dataclass, replace
+import hashlib
+from threading import RLock
+from typing import Callable, Iterable
 import pandas as pd
 
+from backend.utils.headers import HeaderIndex
 
-@dataclass
-class DataStore:
+
+@dataclass(frozen=True)
+class DumpSnapshot:
+    """Immutable view of the loaded dump and issue keys.
+
+    A snapshot is never modified after it is published, so readers can hold a
+    reference without copying. The frame is shared, not copied: writers hand
+    over ownership when they publish and readers must derive new frames
+    instead of assigning into ``dump_df``.
+
+    ``version`` increases on every publish and ``dump_version`` only when the
+    dump frame itself is replaced. ``keys_digest`` identifies the normalized
+    issue-key set, so caches can key on it without hashing the keys again.
+    """
+
+    version: int = 0
+    dump_version: int = 0
     dump_df: pd.DataFrame | None = None
-    issue_keys: list[str] = field(default_factory=list)
-    lock: Lock = field(default_factory=Lock)
+    issue_keys: tuple[str, ...] = ()
+    keys_digest: str = ""
+    header_index: HeaderIndex | None = None
+
+
+class DataStore:
+    def __init__(self) -> None:
+        self.lock = RLock()
+        self._snapshot = DumpSnapshot()
+        self._listeners: list[Callable[[DumpSnapshot], None]] = []
+
+    def snapshot(self) -> DumpSnapshot:
+        return self._snapshot
+
+    def publish(
+        self,
+        dump_df: pd.DataFrame | None = None,
+        issue_keys: Iterable[str] | None = None,
+        header_index: HeaderIndex | None = None,
+    ) -> DumpSnapshot:
+        with self.lock:
+            current = self._snapshot
+            changes: dict = {"version": current.version + 1}
+            if dump_df is not None:
+                changes["dump_df"] = dump_df
+                changes["dump_version"] = current.version + 1
+                changes["header_index"] = header_index or HeaderIndex.for_frame(dump_df)
+            if issue_keys is not None:
+                changes["issue_keys"] = tuple(issue_keys)
+                changes["keys_digest"] = _keys_digest(changes["issue_keys"])
+            snapshot = replace(current, **changes)
+            self._snapshot = snapshot
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            listener(snapshot)
+        return snapshot
+
+    def subscribe(self, listener: Callable[[DumpSnapshot], None]) -> None:
+        """Call ``listener`` with every newly published snapshot."""
+        with self.lock:
+            self._listeners.append(listener)
+
+    @property
+    def dump_df(self) -> pd.DataFrame | None:
+        return self._snapshot.dump_df
+
+    @dump_df.setter
+    def dump_df(self, value: pd.DataFrame) -> None:
+        self.publish(dump_df=value)
+
+    @property
+    def issue_keys(self) -> list[str]:
+        return list(self._snapshot.issue_keys)
+
+    @issue_keys.setter
+    def issue_keys(self, value: Iterable[str]) -> None:
+        self.publish(issue_keys=value)
+
+
+def _keys_digest(issue_keys: tuple[str, ...]) -> str:
+    if not issue_keys:
+        return ""
+    normalized = sorted({key.strip() for key in issue_keys if key.strip()})
+    return hashlib.sha256("\n".join(normalized).encode("utf-8")).hexdigest()
 
 
 DATA_STORE = DataStore()
@@ -0,0 +1,134 @@
+﻿from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Callable
+import uuid
+
+
+@dataclass
+class DiskCacheStats:
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+
+
+class DiskCache:
+    """Directory of content-addressed files with an LRU size budget.
+
+    Entries are plain files named ``<key><suffix>``. Reads refresh the file's
+    mtime, and writes evict the least recently used entries until the total
+    size fits ``max_bytes``. Writes go through a temp file and ``os.replace``
+    so a crash never leaves a half-written entry behind.
+    """
+
+    def __init__(self, root: Path, max_bytes: int, suffix: str) -> None:
+        self._root = root
+        self._max_bytes = max_bytes
+        self._suffix = suffix
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, key: str) -> Path | None:
+        path = self._path_for(key)
+        with self._lock:
+            if not path.exists():
+                self._misses += 1
+                return None
+            self._hits += 1
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return path
+
+    def get_bytes(self, key: str) -> bytes | None:
+        path = self.lookup(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def store(self, key: str, writer: Callable[[Path], None], evict: bool = True) -> Path:
+        """Write an entry; pass ``evict=False`` to defer the size check to a later ``evict()``."""
+        self._root.mkdir(parents=True, exist_ok=True)
+        target = self._path_for(key)
+        temp_path = self._root / f".{uuid.uuid4().hex}.tmp"
+        try:
+            writer(temp_path)
+            os.replace(temp_path, target)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        if evict:
+            self.evict()
+        return target
+
+    def put_bytes(self, key: str, data: bytes, evict: bool = True) -> Path:
+        return self.store(key, lambda path: path.write_bytes(data), evict=evict)
+
+    def discard(self, key: str) -> None:
+        self._path_for(key).unlink(missing_ok=True)
+
+    def evict(self) -> int:
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+                if total <= self._max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            return removed
+
+    def clear(self) -> int:
+        with self._lock:
+            removed = 0
+            for path, _, _ in self._entries():
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    continue
+            return removed
+
+    def stats(self) -> DiskCacheStats:
+        with self._lock:
+            entries = self._entries()
+            return DiskCacheStats(
+                entries=len(entries),
+                size_bytes=sum(size for _, size, _ in entries),
+                max_bytes=self._max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+            )
+
+    def _path_for(self, key: str) -> Path:
+        safe = "".join(ch for ch in key if ch.isalnum() or ch in {"-", "_", "."})
+        if not safe:
+            raise ValueError("Cache key must contain at least one safe character.")
+        return self._root / f"{safe}{self._suffix}"
+
+    def _entries(self) -> list[tuple[Path, int, float]]:
+        if not self._root.exists():
+            return []
+        entries = []
+        for path in self._root.glob(f"*{self._suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
@@ -0,0 +1,52 @@
+﻿from __future__ import annotations
+
+import logging
+import pickle
+
+import pandas as pd
+
+from backend.config import DUMP_CACHE_DIR, DUMP_CACHE_MAX_MB
+from backend.repositories.disk_cache import DiskCache
+
+
+# Bump when load_table / merge_duplicate_columns change what they produce.
+DUMP_CACHE_FORMAT = "1"
+
+logger = logging.getLogger(__name__)
+
+
+class DumpCache:
+    """Post-merge dump frames keyed by the uploaded file's content hash."""
+
+    def __init__(self, cache: DiskCache) -> None:
+        self._cache = cache
+
+    @property
+    def disk(self) -> DiskCache:
+        return self._cache
+
+    def get(self, content_hash: str, suffix: str) -> pd.DataFrame | None:
+        path = self._cache.lookup(self._key(content_hash, suffix))
+        if path is None:
+            return None
+        try:
+            return pd.read_pickle(path)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError) as exc:
+            logger.warning("Discarding unreadable dump cache entry %s: %s", path.name, str(exc))
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, content_hash: str, suffix: str, df: pd.DataFrame) -> None:
+        try:
+            self._cache.store(
+                self._key(content_hash, suffix),
+                lambda path: df.to_pickle(path, compression=None, protocol=pickle.HIGHEST_PROTOCOL),
+            )
+        except OSError as exc:
+            logger.warning("Could not write dump cache entry: %s", str(exc))
+
+    def _key(self, content_hash: str, suffix: str) -> str:
+        return f"{content_hash}-{suffix.lower().lstrip('.')}-v{DUMP_CACHE_FORMAT}"
+
+
+DUMP_CACHE = DumpCache(DiskCache(DUMP_CACHE_DIR, DUMP_CACHE_MAX_MB * 1024 * 1024, ".pkl"))
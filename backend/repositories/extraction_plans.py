@@ -0,0 +1,137 @@
+﻿from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+from threading import Lock
+import uuid
+
+from backend.config import EXTRACTION_PLAN_MAX_TEMPLATES, EXTRACTION_PLAN_PATH
+
+
+# Bump when the fingerprint or step format changes; older plan files are ignored.
+EXTRACTION_PLAN_FORMAT = "1"
+
+# One plan step: the source a field came from ("section", "dt", "tr" or
+# "title") and the child-index path from the root to the element holding
+# its key.
+PlanStep = tuple[str, str]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExtractionPlanStats:
+    templates: int
+    steps: int
+    max_templates: int
+
+
+class ExtractionPlanStore:
+    """Learned extraction plans per page template, persisted as one JSON file.
+
+    A plan maps field names to the ``PlanStep`` where the field was last
+    found on a page with the same template fingerprint. The file is shared by
+    every process that parses pages: it is re-read whenever its mtime changes,
+    so a learn first picks up what other processes saved, and it is
+    rewritten through a temp file and ``os.replace``. At most
+    ``max_templates`` templates are kept; the least recently learned are
+    dropped first.
+    """
+
+    def __init__(self, path: Path, max_templates: int = EXTRACTION_PLAN_MAX_TEMPLATES) -> None:
+        self._path = path
+        self._max_templates = max_templates
+        self._plans: dict[str, dict[str, PlanStep]] = {}
+        self._loaded_mtime: int | None = None
+        self._lock = Lock()
+
+    def get(self, fingerprint: str) -> dict[str, PlanStep]:
+        with self._lock:
+            self._reload_if_changed()
+            return dict(self._plans.get(fingerprint, {}))
+
+    def learn(self, fingerprint: str, steps: dict[str, PlanStep]) -> None:
+        if not steps:
+            return
+        with self._lock:
+            self._reload_if_changed()
+            plan = self._plans.pop(fingerprint, {})
+            changed = any(plan.get(field) != step for field, step in steps.items())
+            plan.update(steps)
+            self._plans[fingerprint] = plan
+            while len(self._plans) > self._max_templates:
+                del self._plans[next(iter(self._plans))]
+            if changed:
+                self._save()
+
+    def stats(self) -> ExtractionPlanStats:
+        with self._lock:
+            self._reload_if_changed()
+            return ExtractionPlanStats(
+                templates=len(self._plans),
+                steps=sum(len(plan) for plan in self._plans.values()),
+                max_templates=self._max_templates,
+            )
+
+    def clear(self) -> int:
+        with self._lock:
+            self._reload_if_changed()
+            removed = len(self._plans)
+            self._plans.clear()
+            try:
+                self._path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning("Could not remove extraction plans: %s", str(exc))
+            self._loaded_mtime = None
+            return removed
+
+    def _reload_if_changed(self) -> None:
+        try:
+            mtime = self._path.stat().st_mtime_ns
+        except OSError:
+            if self._loaded_mtime is not None:
+                # Another process cleared the plans.
+                self._plans.clear()
+                self._loaded_mtime = None
+            return
+        if mtime == self._loaded_mtime:
+            return
+        self._loaded_mtime = mtime
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+            if payload.get("format") != EXTRACTION_PLAN_FORMAT:
+                return
+            loaded = {
+                fingerprint: {field: (str(step[0]), str(step[1])) for field, step in plan.items()}
+                for fingerprint, plan in payload["plans"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, IndexError, AttributeError) as exc:
+            logger.warning("Ignoring unreadable extraction plans at %s: %s", str(self._path), str(exc))
+            return
+        self._plans = loaded
+
+    def _save(self) -> None:
+        payload = {
+            "format": EXTRACTION_PLAN_FORMAT,
+            "plans": {
+                fingerprint: {field: list(step) for field, step in plan.items()}
+                for fingerprint, plan in self._plans.items()
+            },
+        }
+        tmp_path = self._path.with_name(f"{self._path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self._path)
+            self._loaded_mtime = self._path.stat().st_mtime_ns
+        except OSError as exc:
+            logger.warning("Could not save extraction plans: %s", str(exc))
+            tmp_path.unlink(missing_ok=True)
+
+
+EXTRACTION_PLANS = ExtractionPlanStore(EXTRACTION_PLAN_PATH)
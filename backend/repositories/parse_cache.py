@@ -0,0 +1,64 @@
+﻿from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import zlib
+
+from backend.config import PARSE_CACHE_DIR, PARSE_CACHE_MAX_MB
+from backend.repositories.disk_cache import DiskCache
+
+
+# Bump when the parser engines change what they extract.
+PARSE_CACHE_FORMAT = "1"
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """Parsed review fields keyed by the review HTML's content hash.
+
+    An entry holds the values extracted so far plus the page's full list of
+    available field names, as zlib-compressed JSON. Because absent fields are
+    known from that list, an entry answers any field selection whose present
+    fields it already holds. Writes skip the size check; call ``evict()`` once
+    a batch is done.
+    """
+
+    def __init__(self, cache: DiskCache) -> None:
+        self._cache = cache
+
+    @property
+    def disk(self) -> DiskCache:
+        return self._cache
+
+    def key_for(self, html: str, parser_version: str) -> str:
+        digest = hashlib.sha256(html.encode("utf-8", "surrogatepass")).hexdigest()
+        return f"{digest}-{parser_version}-v{PARSE_CACHE_FORMAT}"
+
+    def get(self, key: str) -> tuple[dict[str, str], list[str]] | None:
+        """Return ``(fields, available_fields)`` for ``key``, or ``None`` on a miss."""
+        data = self._cache.get_bytes(key)
+        if data is None:
+            return None
+        try:
+            entry = json.loads(zlib.decompress(data))
+            return dict(entry["fields"]), list(entry["available_fields"])
+        except (zlib.error, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Discarding unreadable parse cache entry %s: %s", key, str(exc))
+            self._cache.discard(key)
+            return None
+
+    def put(self, key: str, fields: dict[str, str], available_fields: list[str]) -> None:
+        entry = {"fields": fields, "available_fields": available_fields}
+        data = zlib.compress(json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        try:
+            self._cache.put_bytes(key, data, evict=False)
+        except OSError as exc:
+            logger.warning("Could not write parse cache entry: %s", str(exc))
+
+    def evict(self) -> int:
+        return self._cache.evict()
+
+
+PARSE_CACHE = ParseCache(DiskCache(PARSE_CACHE_DIR, PARSE_CACHE_MAX_MB * 1024 * 1024, ".json.z"))
@@ -0,0 +1,101 @@
+﻿from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Hashable, Union
+
+import numpy as np
+import pandas as pd
+
+from backend.config import PREVIEW_CACHE_MAX_MB
+from backend.repositories.data_store import DATA_STORE, DumpSnapshot
+
+
+# Preview frames, and the row order of a filtered, searched or sorted page query.
+CachedValue = Union[pd.DataFrame, np.ndarray]
+
+
+@dataclass
+class PreviewCacheStats:
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class PreviewCache:
+    """In-memory LRU of built preview frames and page row orders with a byte budget.
+
+    Keys start with the snapshot's ``dump_version``; entries for any other
+    dump version are dropped as soon as a new dump is published. Cached
+    values are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[CachedValue, int]] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> CachedValue | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: CachedValue) -> None:
+        if isinstance(value, np.ndarray):
+            size = value.nbytes
+        else:
+            size = int(value.memory_usage(index=True, deep=True).sum())
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self._max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def invalidate(self, snapshot: DumpSnapshot) -> None:
+        """Drop entries built for another dump or another issue-key set; they can never be hit again."""
+        with self._lock:
+            stale = [
+                key for key in self._entries if key[0] != snapshot.dump_version or key[1] != snapshot.keys_digest
+            ]
+            for key in stale:
+                self._size -= self._entries.pop(key)[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> PreviewCacheStats:
+        with self._lock:
+            return PreviewCacheStats(
+                entries=len(self._entries),
+                size_bytes=self._size,
+                max_bytes=self._max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+
+PREVIEW_CACHE = PreviewCache(PREVIEW_CACHE_MAX_MB * 1024 * 1024)
+DATA_STORE.subscribe(PREVIEW_CACHE.invalidate)
@@ -0,0 +1,140 @@
+﻿from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import io
+import json
+import logging
+from pathlib import Path
+import pstats
+import re
+from threading import Lock
+import uuid
+
+from backend.config import PROFILE_MAX_KEPT, PROFILE_TOP_FUNCTIONS
+from backend.utils.logger import LOG_DIR
+
+
+PROFILE_DIR = LOG_DIR / "profiles"
+
+# Files written per profile: the raw pstats dump (for snakeviz or
+# ``python -m pstats``) and a plain-text summary of the hottest functions.
+PROFILE_FORMATS = {"prof": "application/octet-stream", "txt": "text/plain; charset=utf-8"}
+
+# Microseconds in the timestamp keep ids of profiles saved within a second in
+# order, so sorting by id is sorting by age.
+_PROFILE_ID = re.compile(r"^\d{8}T\d{12}Z-[0-9a-f]{8}$")
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileNotFoundError(LookupError):
+    pass
+
+
+@dataclass(frozen=True)
+class ProfileRecord:
+    profile_id: str
+    method: str
+    route: str
+    path: str
+    status: int | None
+    elapsed_ms: float
+    created_at: datetime
+    size_bytes: int
+
+
+class ProfileStore:
+    """Captured request profiles, kept as files next to the backend logs.
+
+    Each profile is saved as ``<id>.prof``, ``<id>.txt`` and a ``<id>.json``
+    metadata file. Only the newest ``max_kept`` profiles are kept.
+    """
+
+    def __init__(
+        self,
+        directory: Path = PROFILE_DIR,
+        max_kept: int = PROFILE_MAX_KEPT,
+        top_functions: int = PROFILE_TOP_FUNCTIONS,
+    ) -> None:
+        self._directory = directory
+        self._max_kept = max_kept
+        self._top_functions = top_functions
+        self._lock = Lock()
+
+    def save(
+        self,
+        stats: pstats.Stats,
+        method: str,
+        route: str,
+        path: str,
+        status: int | None,
+        elapsed_ms: float,
+    ) -> ProfileRecord:
+        created_at = datetime.now(timezone.utc)
+        profile_id = f"{created_at:%Y%m%dT%H%M%S%fZ}-{uuid.uuid4().hex[:8]}"
+        with self._lock:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            prof_path = self._file(profile_id, "prof")
+            stats.dump_stats(prof_path)
+            record = ProfileRecord(
+                profile_id=profile_id,
+                method=method,
+                route=route,
+                path=path,
+                status=status,
+                elapsed_ms=round(elapsed_ms, 3),
+                created_at=created_at,
+                size_bytes=prof_path.stat().st_size,
+            )
+            self._file(profile_id, "txt").write_text(self._summary(record, stats), encoding="utf-8")
+            metadata = {**asdict(record), "created_at": created_at.isoformat()}
+            self._file(profile_id, "json").write_text(json.dumps(metadata), encoding="utf-8")
+            self._prune()
+        return record
+
+    def list_profiles(self) -> list[ProfileRecord]:
+        records = []
+        for metadata_path in sorted(self._directory.glob("*.json"), reverse=True):
+            try:
+                records.append(self._read(metadata_path))
+            except (OSError, ValueError, KeyError, TypeError) as exc:
+                logger.warning("Ignoring unreadable profile metadata %s: %s", str(metadata_path), str(exc))
+        return records
+
+    def get(self, profile_id: str) -> ProfileRecord:
+        metadata_path = self._file(profile_id, "json") if _PROFILE_ID.match(profile_id) else None
+        if metadata_path is None or not metadata_path.exists():
+            raise ProfileNotFoundError(f"Profile not found: {profile_id}")
+        return self._read(metadata_path)
+
+    def file_path(self, profile_id: str, profile_format: str) -> Path:
+        self.get(profile_id)
+        return self._file(profile_id, profile_format)
+
+    def _summary(self, record: ProfileRecord, stats: pstats.Stats) -> str:
+        output = io.StringIO()
+        output.write(f"{record.method} {record.path} (route {record.route})\n")
+        output.write(f"Status {record.status}, {record.elapsed_ms} ms, captured {record.created_at.isoformat()}\n")
+        stats.stream = output
+        for sort_key, title in (("cumulative", "cumulative time"), ("tottime", "own time")):
+            output.write(f"\nTop {self._top_functions} functions by {title}:\n")
+            stats.sort_stats(sort_key).print_stats(self._top_functions)
+        return output.getvalue()
+
+    def _prune(self) -> None:
+        metadata_paths = sorted(self._directory.glob("*.json"), reverse=True)
+        for metadata_path in metadata_paths[self._max_kept :]:
+            for profile_format in ("json", *PROFILE_FORMATS):
+                self._file(metadata_path.stem, profile_format).unlink(missing_ok=True)
+
+    def _read(self, metadata_path: Path) -> ProfileRecord:
+        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+        metadata["created_at"] = datetime.fromisoformat(metadata["created_at"])
+        return ProfileRecord(**metadata)
+
+    def _file(self, profile_id: str, profile_format: str) -> Path:
+        return self._directory / f"{profile_id}.{profile_format}"
+
+
+PROFILE_STORE = ProfileStore()
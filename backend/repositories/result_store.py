@@ -0,0 +1,148 @@
+﻿from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Iterator, Sequence
+import uuid
+
+from backend.config import RESULT_STORE_MAX_ROWS, RESULT_STORE_MAX_RUNS, RESULT_STORE_RETENTION_SECONDS
+
+if TYPE_CHECKING:
+    from backend.services.validation_service import ValidationRow
+
+
+class RunNotFoundError(LookupError):
+    pass
+
+
+@dataclass(frozen=True)
+class ResultRun:
+    run_id: str
+    source: str
+    selected_fields: tuple[str, ...]
+    available_fields: tuple[str, ...]
+    rows: tuple[ValidationRow, ...]
+    created_at: datetime
+    stored_at: float = field(default_factory=monotonic, compare=False)
+
+    @property
+    def complete(self) -> int:
+        return sum(1 for row in self.rows if row.status == "Complete")
+
+    def select(self, status: str | None = None, missing_field: str | None = None) -> Iterator[ValidationRow]:
+        for row in self.rows:
+            if status is not None and row.status != status:
+                continue
+            if missing_field is not None and missing_field not in row.missing_fields:
+                continue
+            yield row
+
+
+@dataclass
+class ResultStoreStats:
+    runs: int
+    rows: int
+    max_runs: int
+    max_rows: int
+    evictions: int
+
+
+class ResultStore:
+    """Validation results kept server-side so clients can refer to them by run id.
+
+    Runs are immutable once saved. The store keeps at most ``max_runs`` runs
+    and ``max_rows`` rows in total, dropping the oldest first, and forgets
+    runs older than ``retention_seconds``.
+    """
+
+    def __init__(
+        self,
+        max_runs: int = RESULT_STORE_MAX_RUNS,
+        max_rows: int = RESULT_STORE_MAX_ROWS,
+        retention_seconds: float = RESULT_STORE_RETENTION_SECONDS,
+    ) -> None:
+        self._max_runs = max_runs
+        self._max_rows = max_rows
+        self._retention_seconds = retention_seconds
+        self._runs: OrderedDict[str, ResultRun] = OrderedDict()
+        self._rows = 0
+        self._evictions = 0
+        self._lock = Lock()
+
+    def save(
+        self,
+        rows: Sequence[ValidationRow],
+        selected_fields: Sequence[str],
+        available_fields: Sequence[str] = (),
+        source: str = "parse-validate",
+        run_id: str | None = None,
+    ) -> ResultRun:
+        run = ResultRun(
+            run_id=run_id or uuid.uuid4().hex,
+            source=source,
+            selected_fields=tuple(selected_fields),
+            available_fields=tuple(sorted(set(available_fields))),
+            rows=tuple(rows),
+            created_at=datetime.now(timezone.utc),
+        )
+        with self._lock:
+            previous = self._runs.pop(run.run_id, None)
+            if previous is not None:
+                self._rows -= len(previous.rows)
+            self._runs[run.run_id] = run
+            self._rows += len(run.rows)
+            self._prune(keep=run.run_id)
+        return run
+
+    def get(self, run_id: str) -> ResultRun:
+        with self._lock:
+            self._prune()
+            run = self._runs.get(run_id)
+        if run is None:
+            raise RunNotFoundError(f"Unknown or expired run: {run_id}")
+        return run
+
+    def list_runs(self) -> list[ResultRun]:
+        with self._lock:
+            self._prune()
+            return list(self._runs.values())
+
+    def delete(self, run_id: str) -> bool:
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+            if run is None:
+                return False
+            self._rows -= len(run.rows)
+            return True
+
+    def stats(self) -> ResultStoreStats:
+        with self._lock:
+            return ResultStoreStats(
+                runs=len(self._runs),
+                rows=self._rows,
+                max_runs=self._max_runs,
+                max_rows=self._max_rows,
+                evictions=self._evictions,
+            )
+
+    def _prune(self, keep: str | None = None) -> None:
+        now = monotonic()
+        for run_id, run in list(self._runs.items()):
+            if run_id != keep and now - run.stored_at > self._retention_seconds:
+                self._drop(run_id)
+        for run_id in list(self._runs):
+            if len(self._runs) <= self._max_runs and self._rows <= self._max_rows:
+                break
+            if run_id != keep:
+                self._drop(run_id)
+
+    def _drop(self, run_id: str) -> None:
+        run = self._runs.pop(run_id)
+        self._rows -= len(run.rows)
+        self._evictions += 1
+
+
+RESULT_STORE = ResultStore()
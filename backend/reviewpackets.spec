@@ -22,6 +22,8 @@ hidden_imports = [
     'python_multipart',
     'pandas',
     'openpyxl',
+    'lxml.etree',
+    'zstandard',
 ]
 
 
@@ -3,8 +3,6 @@
 import re
 from typing import Iterable
 
-import pandas as pd
-
 from backend.repositories.data_store import DATA_STORE
 from backend.services.config_service import ConfigService
 
@@ -12,16 +10,16 @@ from backend.services.config_service import ConfigService
 class CollaboratorService:
     REVIEW_INFO_COLUMN = "Review Info"
 
-    def __init__(self) -> None:
-        self._config_service = ConfigService()
+    def __init__(self, config_service: ConfigService | None = None) -> None:
+        self._config_service = config_service or ConfigService()
 
     def extract_review_ids(self) -> list[str]:
-        with DATA_STORE.lock:
-            if DATA_STORE.dump_df is None:
-                raise ValueError("No dump loaded. Upload the dump file first.")
-            dump_df = DATA_STORE.dump_df.copy()
+        snapshot = DATA_STORE.snapshot()
+        dump_df = snapshot.dump_df
+        if dump_df is None:
+            raise ValueError("No dump loaded. Upload the dump file first.")
 
-        review_info_col = self._find_column(dump_df, self.REVIEW_INFO_COLUMN)
+        review_info_col = snapshot.header_index.find(self.REVIEW_INFO_COLUMN)
         if review_info_col is None:
             raise ValueError("Column 'Review Info' not found in dump.")
 
@@ -30,20 +28,10 @@ class CollaboratorService:
         return sorted(set(review_ids), key=review_ids.index)
 
     def build_review_url(self, review_id: str) -> str:
-        config = self._config_service.get_collaborator_config()
-        base = config.base_url.rstrip("/")
-        review_path = config.review_path_template.format(reviewId=review_id.strip())
-        return f"{base}{review_path}"
+        return self._config_service.get_review_url_builder().build(review_id)
 
     def build_review_urls(self, review_ids: Iterable[str]) -> dict[str, str]:
-        return {review_id: self.build_review_url(review_id) for review_id in review_ids if review_id.strip()}
-
-    def _find_column(self, df: pd.DataFrame, name: str) -> str | None:
-        target = name.strip().lower()
-        for col in df.columns:
-            if str(col).strip().lower() == target:
-                return col
-        return None
+        return self._config_service.get_review_url_builder().build_many(review_ids)
 
     def _normalize_review_ids(self, values: Iterable[str]) -> list[str]:
         review_ids: list[str] = []
@@ -1,13 +1,47 @@
 ﻿from __future__ import annotations
 
+from dataclasses import dataclass
+import hashlib
 import json
 import logging
 from pathlib import Path
+import re
+from string import Formatter
 import sys
+from threading import Lock
+from typing import Iterable
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from backend.config import DEFAULT_COLLABORATOR_CONFIG_PATH
+from backend.utils.metrics import CONFIG_RELOADS
+
+
+class RuleConditionConfig(BaseModel):
+    """Applies a rule only when ``field`` equals one of ``equals``, or is non-empty when ``equals`` is omitted."""
+
+    field: str
+    equals: list[str] | None = None
+
+
+class ValidationRuleConfig(BaseModel):
+    field: str
+    pattern: str | None = None
+    allowed_values: list[str] | None = Field(default=None, alias="allowedValues")
+    min_length: int | None = Field(default=None, alias="minLength", ge=0)
+    ignore_case: bool = Field(default=False, alias="ignoreCase")
+    when: RuleConditionConfig | None = None
+    message: str | None = None
+
+    @field_validator("pattern")
+    @classmethod
+    def _check_pattern(cls, pattern: str | None) -> str | None:
+        if pattern is not None:
+            try:
+                re.compile(pattern)
+            except re.error as exc:
+                raise ValueError(f"Invalid pattern {pattern!r}: {exc}") from exc
+        return pattern
 
 
 class CollaboratorConfig(BaseModel):
@@ -16,6 +50,20 @@ class CollaboratorConfig(BaseModel):
     request_timeout_seconds: int = Field(default=30, alias="requestTimeoutSeconds")
     max_retries: int = Field(default=2, alias="maxRetries")
     batch_size: int = Field(default=10, alias="batchSize")
+    retry_backoff_seconds: float = Field(default=1.0, alias="retryBackoffSeconds")
+    validation_rules: list[ValidationRuleConfig] = Field(default_factory=list, alias="validationRules")
+
+    @field_validator("review_path_template")
+    @classmethod
+    def _check_review_path_template(cls, template: str) -> str:
+        try:
+            fields = [name for _, name, _, _ in Formatter().parse(template) if name is not None]
+        except ValueError as exc:
+            raise ValueError(f"Invalid reviewPathTemplate {template!r}: {exc}") from exc
+        unknown = sorted({name for name in fields if name != "reviewId"})
+        if unknown:
+            raise ValueError(f"reviewPathTemplate only supports {{reviewId}}, found: {', '.join(unknown)}")
+        return template
 
 
 DEFAULT_COLLABORATOR_CONFIG = CollaboratorConfig.model_validate(
@@ -25,28 +73,167 @@ DEFAULT_COLLABORATOR_CONFIG = CollaboratorConfig.model_validate(
         "requestTimeoutSeconds": 30,
         "maxRetries": 2,
         "batchSize": 10,
+        "retryBackoffSeconds": 1.0,
     }
 )
 
 
+class ReviewUrlBuilder:
+    """Builds review URLs from ``baseUrl`` and a precompiled ``reviewPathTemplate``.
+
+    The template is split once into the literal pieces around each
+    ``{reviewId}``, so building a URL is a single ``str.join``. Templates with
+    a format spec or conversion (``{reviewId!s}``, ``{reviewId:>8}``) fall
+    back to ``str.format``.
+    """
+
+    def __init__(self, base_url: str, review_path_template: str) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._template = review_path_template
+        self._pieces = _template_pieces(review_path_template)
+
+    def build(self, review_id: str) -> str:
+        review_id = review_id.strip()
+        if self._pieces is None:
+            return f"{self._base_url}{self._template.format(reviewId=review_id)}"
+        return f"{self._base_url}{review_id.join(self._pieces)}"
+
+    def build_many(self, review_ids: Iterable[str]) -> dict[str, str]:
+        """Map each non-blank review id to its URL, keeping the ids as given."""
+        build = self.build
+        return {review_id: build(review_id) for review_id in review_ids if review_id.strip()}
+
+
+def _template_pieces(template: str) -> list[str] | None:
+    pieces = [""]
+    for literal, name, spec, conversion in Formatter().parse(template):
+        pieces[-1] += literal
+        if name is None:
+            continue
+        if spec or conversion:
+            return None
+        pieces.append("")
+    return pieces
+
+
+_DEFAULT_URL_BUILDER = ReviewUrlBuilder(
+    DEFAULT_COLLABORATOR_CONFIG.base_url, DEFAULT_COLLABORATOR_CONFIG.review_path_template
+)
+
+
+@dataclass
+class ConfigStats:
+    source: str | None
+    loads: int
+    reloads: int
+    unchanged: int
+    failures: int
+
+
+@dataclass
+class _LoadedConfig:
+    config: CollaboratorConfig
+    url_builder: ReviewUrlBuilder
+    source: Path | None
+    digest: str | None
+
+
 class ConfigService:
+    """Loads the Collaborator config once and reloads it only when a file changes.
+
+    Every call stats the candidate files; the cached config is returned as
+    long as their mtimes and sizes are unchanged. When one changes, the file
+    is re-read, and it is only re-validated when its contents differ from
+    what was loaded. Reloads are logged and counted in ``stats``.
+    """
+
     def __init__(self, config_path: Path = DEFAULT_COLLABORATOR_CONFIG_PATH) -> None:
         self._config_path = config_path
         self._logger = logging.getLogger("collaborator")
+        self._lock = Lock()
+        self._candidates = self._candidate_paths()
+        self._signature: tuple[tuple[int, int] | None, ...] | None = None
+        self._loaded: _LoadedConfig | None = None
+        self._loads = 0
+        self._reloads = 0
+        self._unchanged = 0
+        self._failures = 0
 
     def get_collaborator_config(self) -> CollaboratorConfig:
-        for candidate in self._candidate_paths():
+        return self._current().config
+
+    def get_review_url_builder(self) -> ReviewUrlBuilder:
+        return self._current().url_builder
+
+    def stats(self) -> ConfigStats:
+        with self._lock:
+            source = self._loaded.source if self._loaded is not None else None
+            return ConfigStats(
+                source=str(source) if source is not None else None,
+                loads=self._loads,
+                reloads=self._reloads,
+                unchanged=self._unchanged,
+                failures=self._failures,
+            )
+
+    def _current(self) -> _LoadedConfig:
+        with self._lock:
+            signature = self._file_signature()
+            if self._loaded is None or signature != self._signature:
+                self._signature = signature
+                self._load()
+            return self._loaded
+
+    def _file_signature(self) -> tuple[tuple[int, int] | None, ...]:
+        signature = []
+        for candidate in self._candidates:
+            try:
+                stat = candidate.stat()
+            except OSError:
+                signature.append(None)
+                continue
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _load(self) -> None:
+        previous = self._loaded
+        for candidate in self._candidates:
             try:
-                if candidate.exists():
-                    payload = json.loads(candidate.read_text(encoding="utf-8-sig"))
-                    config = CollaboratorConfig.model_validate(payload)
-                    self._logger.info("Loaded Collaborator config from %s", str(candidate))
-                    return config
+                if not candidate.exists():
+                    continue
+                raw = candidate.read_bytes()
+                digest = hashlib.sha1(raw).hexdigest()
+                if previous is not None and previous.source == candidate and previous.digest == digest:
+                    self._unchanged += 1
+                    return
+                config = CollaboratorConfig.model_validate(json.loads(raw.decode("utf-8-sig")))
             except Exception as exc:  # noqa: BLE001
+                self._failures += 1
                 self._logger.error("Failed to parse Collaborator config at %s: %s", str(candidate), str(exc))
+                continue
+            builder = ReviewUrlBuilder(config.base_url, config.review_path_template)
+            self._store(_LoadedConfig(config, builder, candidate, digest))
+            return
 
+        if previous is not None and previous.source is None:
+            return
         self._logger.warning("Using default Collaborator config because no valid config file was found.")
-        return DEFAULT_COLLABORATOR_CONFIG
+        self._store(_LoadedConfig(DEFAULT_COLLABORATOR_CONFIG, _DEFAULT_URL_BUILDER, None, None))
+
+    def _store(self, loaded: _LoadedConfig) -> None:
+        source = str(loaded.source) if loaded.source is not None else "defaults"
+        if self._loaded is None:
+            self._logger.info("Loaded Collaborator config from %s", source)
+        else:
+            self._reloads += 1
+            CONFIG_RELOADS.inc()
+            self._logger.info(
+                "Reloaded Collaborator config from %s",
+                source,
+                extra={"previous_source": str(self._loaded.source or "defaults"), "reloads": self._reloads},
+            )
+        self._loads += 1
+        self._loaded = loaded
 
     def _candidate_paths(self) -> list[Path]:
         candidates: list[Path] = []
@@ -66,3 +253,4 @@ class ConfigService:
             seen.add(key)
             unique.append(path)
         return unique
+
@@ -4,30 +4,39 @@ from pathlib import Path
 import pandas as pd
 
 from backend.repositories.data_store import DATA_STORE
+from backend.repositories.disk_cache import DiskCacheStats
+from backend.repositories.dump_cache import DUMP_CACHE
 from backend.utils.file_loader import load_table
+from backend.utils.hashing import file_sha256
+from backend.utils.headers import HeaderIndex
 
 
 class DumpService:
     ISSUE_KEY_COLUMN = "Issue Key"
 
-    def load_dump(self, file_path: Path) -> pd.DataFrame:
-        df = load_table(file_path)
-        if self._find_column(df, self.ISSUE_KEY_COLUMN) is None:
-            raise ValueError(f"Missing required column: {self.ISSUE_KEY_COLUMN}")
-
-        with DATA_STORE.lock:
-            DATA_STORE.dump_df = df
+    def load_dump(self, file_path: Path, content_hash: str | None = None) -> pd.DataFrame:
+        content_hash = content_hash or file_sha256(file_path)
+        df = DUMP_CACHE.get(content_hash, file_path.suffix)
+        if df is None:
+            df = load_table(file_path, streaming=True)
+            header_index = HeaderIndex.for_frame(df)
+            if header_index.find(self.ISSUE_KEY_COLUMN) is None:
+                raise ValueError(f"Missing required column: {self.ISSUE_KEY_COLUMN}")
+            DUMP_CACHE.put(content_hash, file_path.suffix, df)
+        else:
+            header_index = HeaderIndex.for_frame(df)
+
+        DATA_STORE.publish(dump_df=df, header_index=header_index)
         return df
 
     def get_headers(self) -> list[str]:
-        with DATA_STORE.lock:
-            if DATA_STORE.dump_df is None:
-                return []
-            return list(DATA_STORE.dump_df.columns)
-
-    def _find_column(self, df: pd.DataFrame, name: str) -> str | None:
-        target = name.strip().lower()
-        for col in df.columns:
-            if str(col).strip().lower() == target:
-                return col
-        return None
+        dump_df = DATA_STORE.snapshot().dump_df
+        if dump_df is None:
+            return []
+        return list(dump_df.columns)
+
+    def get_cache_stats(self) -> DiskCacheStats:
+        return DUMP_CACHE.disk.stats()
+
+    def clear_cache(self) -> int:
+        return DUMP_CACHE.disk.clear()
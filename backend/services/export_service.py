@@ -0,0 +1,111 @@
+﻿from __future__ import annotations
+
+import csv
+import io
+import tempfile
+from typing import Iterable, Iterator, Sequence
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+
+EXPORT_BATCH_ROWS = 2_000
+XLSX_CHUNK_BYTES = 64 * 1024
+
+
+class ExportService:
+    """Encodes tabular results as CSV or XLSX byte streams.
+
+    CSV is produced in batches of ``EXPORT_BATCH_ROWS`` rows, so the header is
+    sent before any row is formatted and memory stays bounded by one batch.
+    XLSX is written with openpyxl's write-only mode into a temp file and then
+    streamed, because the zip container can only be finalized at the end.
+    """
+
+    MEDIA_TYPES = {
+        "csv": "text/csv",
+        "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    }
+
+    def stream(
+        self,
+        header: Sequence[str],
+        rows: Iterable[Sequence[object]],
+        export_format: str = "csv",
+        quote_all: bool = False,
+        line_terminator: str = "\n",
+    ) -> Iterator[bytes]:
+        if export_format == "csv":
+            return self.iter_csv(header, rows, quote_all=quote_all, line_terminator=line_terminator)
+        if export_format == "xlsx":
+            return self.iter_xlsx(header, rows)
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    def iter_csv(
+        self,
+        header: Sequence[str],
+        rows: Iterable[Sequence[object]],
+        quote_all: bool = False,
+        line_terminator: str = "\n",
+        batch_rows: int = EXPORT_BATCH_ROWS,
+    ) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(
+            buffer,
+            quoting=csv.QUOTE_ALL if quote_all else csv.QUOTE_MINIMAL,
+            lineterminator=line_terminator,
+        )
+        writer.writerow(header)
+        yield self._drain(buffer)
+
+        pending = 0
+        for row in rows:
+            writer.writerow(row)
+            pending += 1
+            if pending >= batch_rows:
+                yield self._drain(buffer)
+                pending = 0
+        if pending:
+            yield self._drain(buffer)
+
+    def iter_xlsx(
+        self,
+        header: Sequence[str],
+        rows: Iterable[Sequence[object]],
+        sheet_title: str = "Export",
+    ) -> Iterator[bytes]:
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title=sheet_title)
+        sheet.append([self._xlsx_cell(sheet, value) for value in header])
+        for row in rows:
+            sheet.append([self._xlsx_cell(sheet, value) for value in row])
+
+        with tempfile.TemporaryFile() as target:
+            workbook.save(target)
+            target.seek(0)
+            while True:
+                chunk = target.read(XLSX_CHUNK_BYTES)
+                if not chunk:
+                    break
+                yield chunk
+
+    def frame_rows(self, df: pd.DataFrame, batch_rows: int = EXPORT_BATCH_ROWS) -> Iterator[tuple]:
+        for start in range(0, len(df), batch_rows):
+            batch = df.iloc[start : start + batch_rows].fillna("")
+            yield from batch.itertuples(index=False, name=None)
+
+    def _drain(self, buffer: io.StringIO) -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+        return data
+
+    def _xlsx_cell(self, sheet, value: object) -> WriteOnlyCell:
+        text = ILLEGAL_CHARACTERS_RE.sub("", str(value)) if value is not None else ""
+        cell = WriteOnlyCell(sheet, value=text)
+        # Keep values such as "=SUM(A1)" as text instead of formulas.
+        cell.data_type = "s"
+        return cell
+
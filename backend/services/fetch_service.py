@@ -0,0 +1,188 @@
+﻿from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import logging
+from threading import Event
+from time import perf_counter
+from typing import Iterator, Mapping
+from urllib.parse import urlsplit
+
+from backend.services.config_service import CollaboratorConfig, ConfigService
+from backend.services.parse_engine import ParseEngine, ReviewOutcome, failed_outcome
+from backend.utils.http_client import HttpFetchError, PooledHttpClient
+
+
+BROWSER_ONLY_URL_MESSAGE = (
+    "Review URLs route through a URL fragment ('#...'), which only a browser renders; "
+    "the backend fetcher needs a server-rendered review URL. Fetch the pages in the app instead."
+)
+
+
+@dataclass
+class FetchedPage:
+    review_id: str
+    url: str
+    html: str | None
+    elapsed_ms: float
+    attempts: int
+    error: str | None = None
+
+
+class ReviewFetcher:
+    """Fetches review pages concurrently over one pooled keep-alive client.
+
+    At most ``concurrency`` requests are in flight; pages are yielded in
+    completion order as soon as they arrive, so a slow page does not hold
+    back the rest.
+    """
+
+    CANCEL_POLL_SECONDS = 0.2
+
+    def __init__(self, client: PooledHttpClient, concurrency: int) -> None:
+        self._client = client
+        self._concurrency = max(1, concurrency)
+
+    @classmethod
+    def from_config(cls, config: CollaboratorConfig, cookies: Mapping[str, str]) -> ReviewFetcher:
+        headers = {"Cookie": "; ".join(f"{name}={value}" for name, value in cookies.items())} if cookies else {}
+        client = PooledHttpClient(
+            timeout_seconds=config.request_timeout_seconds,
+            max_retries=config.max_retries,
+            max_connections=config.batch_size,
+            backoff_seconds=config.retry_backoff_seconds,
+            headers=headers,
+        )
+        return cls(client, config.batch_size)
+
+    @property
+    def client(self) -> PooledHttpClient:
+        return self._client
+
+    def fetch(self, review_id: str, url: str) -> FetchedPage:
+        started = perf_counter()
+        try:
+            response = self._client.get(url)
+        except HttpFetchError as exc:
+            return FetchedPage(review_id, url, None, (perf_counter() - started) * 1000, exc.attempts, str(exc))
+        except ValueError as exc:
+            # http.client rejects a malformed host, port or header (cookie) value
+            # with ValueError before anything is sent; fail this page, not the job.
+            message = f"Request to {url} failed: {exc}"
+            return FetchedPage(review_id, url, None, (perf_counter() - started) * 1000, 1, message)
+        return FetchedPage(review_id, url, response.text(), response.elapsed_ms, response.attempts)
+
+    def iter_pages(self, review_urls: Mapping[str, str], cancelled: Event | None = None) -> Iterator[FetchedPage]:
+        """Yield fetched pages in completion order until all are done or ``cancelled`` is set.
+
+        On cancel it returns at once: queued fetches are dropped and the ones
+        in flight finish (or time out) in the background without being waited for.
+        """
+        cancelled = cancelled or Event()
+        pending = iter(review_urls.items())
+        in_flight: set[Future] = set()
+        executor = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="review-fetch")
+        try:
+            while not cancelled.is_set():
+                while len(in_flight) < self._concurrency:
+                    item = next(pending, None)
+                    if item is None:
+                        break
+                    in_flight.add(executor.submit(self.fetch, *item))
+                if not in_flight:
+                    return
+                done, in_flight = wait(in_flight, timeout=self.CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if cancelled.is_set():
+                        return
+                    yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class FetchService:
+    """Fetches review pages on the backend and pipes each one straight into parse/validate.
+
+    An optional alternative to the renderer fetching HTML through Electron
+    and posting it back: the session cookies are passed in once, pages are
+    downloaded with ``ReviewFetcher`` and handed to ``ParseEngine`` as they
+    arrive, so only the pages in flight are held in memory. Pages that cannot
+    be fetched become Incomplete rows.
+    """
+
+    def __init__(self, engine: ParseEngine, config_service: ConfigService | None = None) -> None:
+        self._engine = engine
+        self._config_service = config_service or ConfigService()
+        self._logger = logging.getLogger("collaborator")
+
+    def check_review_urls(self, review_urls: Mapping[str, str]) -> None:
+        """Raise ``ValueError`` when the review URLs cannot be fetched without a browser.
+
+        The fragment never reaches the server, so a single-page template such
+        as ``/ui#review:id={reviewId}`` would fetch the same empty app shell
+        for every review.
+        """
+        if any(urlsplit(url).fragment for url in review_urls.values()):
+            raise ValueError(BROWSER_ONLY_URL_MESSAGE)
+
+    def iter_outcomes(
+        self,
+        review_urls: Mapping[str, str],
+        selected_fields: list[str],
+        cookies: Mapping[str, str],
+        cancelled: Event | None = None,
+    ) -> Iterator[tuple[int, ReviewOutcome]]:
+        """Yield ``(position, outcome)`` in completion order; positions follow ``review_urls``."""
+        self.check_review_urls(review_urls)
+        cancelled = cancelled or Event()
+        positions = {review_id: position for position, review_id in enumerate(review_urls)}
+        fetcher = ReviewFetcher.from_config(self._config_service.get_collaborator_config(), cookies)
+        fetched: list[str] = []
+        failures: list[FetchedPage] = []
+        fetch_ms = 0.0
+
+        def pages() -> Iterator[tuple[str, str]]:
+            nonlocal fetch_ms
+            for page in fetcher.iter_pages(review_urls, cancelled):
+                fetch_ms += page.elapsed_ms
+                if page.html is None:
+                    failures.append(page)
+                    continue
+                fetched.append(page.review_id)
+                yield page.review_id, page.html
+
+        def drain_failures() -> Iterator[tuple[int, ReviewOutcome]]:
+            while failures:
+                page = failures.pop()
+                comment = f"Failed to fetch review page: {page.error}"
+                yield positions[page.review_id], failed_outcome(
+                    page.review_id, selected_fields, comment, page.error or "", page.elapsed_ms
+                )
+
+        started = perf_counter()
+        failed = 0
+        try:
+            for position, outcome in self._engine.iter_outcomes(pages(), selected_fields, cancelled):
+                yield positions[fetched[position]], outcome
+                for item in drain_failures():
+                    failed += 1
+                    yield item
+            for item in drain_failures():
+                failed += 1
+                yield item
+        finally:
+            stats = fetcher.client.stats()
+            fetcher.client.close()
+            self._logger.info(
+                "Fetched review pages.",
+                extra={
+                    "reviews": len(review_urls),
+                    "fetched": len(fetched),
+                    "fetch_failed": failed,
+                    "requests": stats.requests,
+                    "retries": stats.retries,
+                    "connections": stats.connections_opened,
+                    "avg_fetch_ms": round(fetch_ms / max(1, len(fetched) + failed), 3),
+                    "elapsed_ms": round((perf_counter() - started) * 1000, 3),
+                },
+            )
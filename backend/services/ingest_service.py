@@ -0,0 +1,100 @@
+﻿from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+from threading import Event
+from typing import AsyncIterable, Iterator
+
+from backend.config import INGEST_QUEUE_REVIEWS
+from backend.services.parse_engine import ParseEngine, ReviewOutcome
+from backend.utils.metrics import BYTES_INGESTED
+from backend.utils.ndjson import NdjsonDecodeError, NdjsonDecoder
+
+
+_END = object()
+BACKPRESSURE_POLL_SECONDS = 0.01
+
+
+class IngestService:
+    """Parse and validate reviews while their NDJSON request body streams in.
+
+    The event loop decodes body chunks into ``(review_id, html)`` records and
+    hands them to a worker thread through a queue of ``queue_size`` reviews.
+    The worker feeds them to ``ParseEngine.iter_outcomes``, which keeps only
+    a small window in flight, so at most a few pages' HTML is held at once no
+    matter how large the batch is. When the queue is full, reading the body
+    pauses until the worker catches up.
+    """
+
+    def __init__(self, engine: ParseEngine, queue_size: int = INGEST_QUEUE_REVIEWS) -> None:
+        self._engine = engine
+        self._queue_size = max(1, queue_size)
+        self._logger = logging.getLogger("collaborator")
+
+    async def parse_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        content_encoding: str,
+        selected_fields: list[str],
+    ) -> list[ReviewOutcome]:
+        decoder = NdjsonDecoder(content_encoding)
+        records: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        cancelled = Event()
+        loop = asyncio.get_running_loop()
+        worker = loop.run_in_executor(None, self._consume, records, selected_fields, cancelled)
+
+        received = 0
+        try:
+            async for chunk in chunks:
+                received += len(chunk)
+                for record in decoder.feed(chunk):
+                    await self._put(records, _review_from_record(record), worker)
+            for record in decoder.close():
+                await self._put(records, _review_from_record(record), worker)
+        except BaseException:
+            cancelled.set()
+            raise
+        finally:
+            await self._put(records, _END, worker)
+            if cancelled.is_set():
+                await asyncio.wait({worker})
+
+        outcomes = await worker
+        BYTES_INGESTED.inc(received, source="ndjson")
+        self._logger.info(
+            "Ingested NDJSON review stream.",
+            extra={"reviews": len(outcomes), "bytes": received, "encoding": content_encoding or "identity"},
+        )
+        return outcomes
+
+    async def _put(self, records: queue.Queue, item: object, worker: asyncio.Future) -> None:
+        while True:
+            try:
+                records.put_nowait(item)
+                return
+            except queue.Full:
+                if worker.done():
+                    return
+                await asyncio.sleep(BACKPRESSURE_POLL_SECONDS)
+
+    def _consume(self, records: queue.Queue, selected_fields: list[str], cancelled: Event) -> list[ReviewOutcome]:
+        def reviews() -> Iterator[tuple[str, str]]:
+            while True:
+                item = records.get()
+                if item is _END or cancelled.is_set():
+                    return
+                yield item
+
+        by_position: dict[int, ReviewOutcome] = {}
+        for position, outcome in self._engine.iter_outcomes(reviews(), selected_fields, cancelled):
+            by_position[position] = outcome
+        return [by_position[position] for position in sorted(by_position)]
+
+
+def _review_from_record(record: dict) -> tuple[str, str]:
+    review_id = record.get("review_id")
+    html = record.get("html")
+    if not isinstance(review_id, (str, int)) or not isinstance(html, str):
+        raise NdjsonDecodeError("Each line must be an object with a 'review_id' and an 'html' string.")
+    return str(review_id), html
@@ -0,0 +1,276 @@
+﻿from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import logging
+from threading import Condition, Event, Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Sequence
+import uuid
+
+from backend.config import JOB_MAX_RETAINED, JOB_MAX_RUNNING, JOB_RETENTION_SECONDS
+from backend.repositories.result_store import RESULT_STORE, ResultStore
+
+if TYPE_CHECKING:
+    from backend.services.parse_engine import ParseEngine, ReviewOutcome
+
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_CANCELLED = "cancelled"
+JOB_FAILED = "failed"
+
+FINISHED_STATUSES = frozenset({JOB_COMPLETED, JOB_CANCELLED, JOB_FAILED})
+
+OutcomeSource = Callable[[Event], Iterable[tuple[int, "ReviewOutcome"]]]
+
+
+class JobNotFoundError(LookupError):
+    pass
+
+
+@dataclass
+class JobProgress:
+    job_id: str
+    status: str
+    total: int
+    completed: int
+    complete: int
+    incomplete: int
+    failed: int
+    cache_hits: int
+    avg_review_ms: float
+    max_review_ms: float
+    created_at: datetime
+    finished_at: datetime | None
+    error: str | None
+
+
+class ParseJob:
+    """One submitted parse/validate batch and the outcomes it has produced so far.
+
+    Outcomes are appended in completion order together with their input
+    position; readers wait on the job's condition for new ones.
+    """
+
+    def __init__(self, job_id: str, selected_fields: list[str], total: int) -> None:
+        self.job_id = job_id
+        self.selected_fields = list(selected_fields)
+        self.total = total
+        self.status = JOB_QUEUED
+        self.error: str | None = None
+        self.created_at = datetime.now(timezone.utc)
+        self.finished_at: datetime | None = None
+        self.cancel_event = Event()
+        self._finished_monotonic: float | None = None
+        self._results: list[tuple[int, ReviewOutcome]] = []
+        self._changed = Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def add_result(self, position: int, outcome: ReviewOutcome) -> None:
+        with self._changed:
+            self._results.append((position, outcome))
+            self._changed.notify_all()
+
+    def set_status(self, status: str, error: str | None = None) -> None:
+        with self._changed:
+            self.status = status
+            self.error = error
+            if status in FINISHED_STATUSES:
+                self.finished_at = datetime.now(timezone.utc)
+                self._finished_monotonic = monotonic()
+            self._changed.notify_all()
+
+    def wait_for_results(self, seen: int, timeout: float) -> tuple[list[tuple[int, ReviewOutcome]], bool]:
+        """Return the outcomes after the first ``seen`` and whether the job has finished.
+
+        Blocks up to ``timeout`` seconds while there is nothing new.
+        """
+        with self._changed:
+            if len(self._results) <= seen and not self.finished:
+                self._changed.wait(timeout)
+            return self._results[seen:], self.finished
+
+    def outcomes(self) -> list[ReviewOutcome]:
+        """Outcomes so far, in input order."""
+        with self._changed:
+            results = sorted(self._results, key=lambda item: item[0])
+        return [outcome for _, outcome in results]
+
+    def finished_for(self) -> float:
+        if self._finished_monotonic is None:
+            return 0.0
+        return monotonic() - self._finished_monotonic
+
+    def progress(self) -> JobProgress:
+        with self._changed:
+            outcomes = [outcome for _, outcome in self._results]
+            status, error = self.status, self.error
+        complete = sum(1 for outcome in outcomes if outcome.row.status == "Complete")
+        latencies = [outcome.elapsed_ms for outcome in outcomes]
+        return JobProgress(
+            job_id=self.job_id,
+            status=status,
+            total=self.total,
+            completed=len(outcomes),
+            complete=complete,
+            incomplete=len(outcomes) - complete,
+            failed=sum(1 for outcome in outcomes if outcome.error),
+            cache_hits=sum(1 for outcome in outcomes if outcome.cache_hit),
+            avg_review_ms=round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            max_review_ms=round(max(latencies), 3) if latencies else 0.0,
+            created_at=self.created_at,
+            finished_at=self.finished_at,
+            error=error,
+        )
+
+
+class JobService:
+    """Runs parse/validate batches in the background and keeps their results.
+
+    Jobs run on a small thread pool (``max_running`` at a time) that drives
+    the shared ``ParseEngine``. Finished jobs are kept for
+    ``retention_seconds`` and at most ``max_retained`` of them are retained;
+    older ones are dropped whenever a job is submitted or listed. When a job
+    stops, whatever it produced is saved to ``result_store`` with the job id
+    as run id.
+    """
+
+    def __init__(
+        self,
+        engine: ParseEngine,
+        max_running: int = JOB_MAX_RUNNING,
+        max_retained: int = JOB_MAX_RETAINED,
+        retention_seconds: float = JOB_RETENTION_SECONDS,
+        result_store: ResultStore = RESULT_STORE,
+    ) -> None:
+        self._engine = engine
+        self._result_store = result_store
+        self._max_retained = max_retained
+        self._retention_seconds = retention_seconds
+        self._jobs: OrderedDict[str, ParseJob] = OrderedDict()
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_running), thread_name_prefix="parse-job")
+        self._logger = logging.getLogger("collaborator")
+
+    def submit(self, reviews: Sequence[tuple[str, str]], selected_fields: list[str]) -> ParseJob:
+        return self.submit_outcomes(
+            len(reviews),
+            selected_fields,
+            lambda cancelled: self._engine.iter_outcomes(reviews, selected_fields, cancelled),
+        )
+
+    def submit_outcomes(
+        self,
+        total: int,
+        selected_fields: list[str],
+        produce: OutcomeSource,
+        source: str = "job",
+    ) -> ParseJob:
+        """Run ``produce(cancel_event)`` as a job; it yields ``(position, outcome)`` pairs."""
+        job = ParseJob(uuid.uuid4().hex, selected_fields, total)
+        with self._lock:
+            self._prune()
+            self._jobs[job.job_id] = job
+        self._executor.submit(self._run, job, produce, source)
+        self._logger.info("Queued parse/validate job.", extra={"job_id": job.job_id, "reviews": job.total, "source": source})
+        return job
+
+    def get(self, job_id: str) -> ParseJob:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundError(f"Unknown job: {job_id}")
+        return job
+
+    def list_jobs(self) -> list[ParseJob]:
+        with self._lock:
+            self._prune()
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> ParseJob:
+        job = self.get(job_id)
+        job.cancel_event.set()
+        if job.status == JOB_QUEUED:
+            job.set_status(JOB_CANCELLED)
+        return job
+
+    def delete(self, job_id: str) -> ParseJob:
+        job = self.cancel(job_id)
+        with self._lock:
+            self._jobs.pop(job.job_id, None)
+        return job
+
+    def iter_results(
+        self, job_id: str, start: int = 0, poll_seconds: float = 1.0
+    ) -> Iterator[tuple[int, ReviewOutcome] | None]:
+        """Yield outcomes in completion order from ``start`` until the job finishes.
+
+        ``None`` is yielded whenever ``poll_seconds`` pass without a new
+        outcome, so callers can send progress or keep-alive messages.
+        """
+        job = self.get(job_id)
+        seen = max(0, start)
+        while True:
+            results, finished = job.wait_for_results(seen, poll_seconds)
+            seen += len(results)
+            yield from results
+            if finished and not results:
+                return
+            if not results:
+                yield None
+
+    def shutdown(self) -> None:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job.cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job: ParseJob, produce: OutcomeSource, source: str) -> None:
+        if job.cancel_event.is_set():
+            return
+        job.set_status(JOB_RUNNING)
+        try:
+            for position, outcome in produce(job.cancel_event):
+                job.add_result(position, outcome)
+        except Exception as exc:  # noqa: BLE001
+            self._logger.error("Parse/validate job %s failed: %s", job.job_id, str(exc))
+            job.set_status(JOB_FAILED, error=str(exc))
+            return
+
+        outcomes = job.outcomes()
+        self._result_store.save(
+            [outcome.row for outcome in outcomes],
+            job.selected_fields,
+            available_fields=[field for outcome in outcomes for field in outcome.available_fields],
+            source=source,
+            run_id=job.job_id,
+        )
+        progress = job.progress()
+        status = JOB_CANCELLED if job.cancel_event.is_set() and progress.completed < job.total else JOB_COMPLETED
+        job.set_status(status)
+        self._logger.info(
+            "Finished parse/validate job.",
+            extra={
+                "job_id": job.job_id,
+                "status": status,
+                "completed": progress.completed,
+                "total": progress.total,
+                "avg_review_ms": progress.avg_review_ms,
+            },
+        )
+
+    def _prune(self) -> None:
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and job.finished_for() > self._retention_seconds:
+                del self._jobs[job_id]
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self._max_retained)]:
+            del self._jobs[job_id]
@@ -11,17 +11,14 @@ class KeysService:
 
     def load_keys(self, file_path: Path) -> list[str]:
         keys = load_issue_keys(file_path, self.ISSUE_KEY_COLUMN)
-        with DATA_STORE.lock:
-            DATA_STORE.issue_keys = keys
+        DATA_STORE.publish(issue_keys=keys)
         return keys
 
     def set_keys_from_text(self, keys_text: str) -> list[str]:
         keys = [key.strip() for key in keys_text.split(",")]
         keys = [key for key in keys if key]
-        with DATA_STORE.lock:
-            DATA_STORE.issue_keys = keys
+        DATA_STORE.publish(issue_keys=keys)
         return keys
 
     def get_keys(self) -> list[str]:
-        with DATA_STORE.lock:
-            return list(DATA_STORE.issue_keys)
+        return list(DATA_STORE.snapshot().issue_keys)
@@ -0,0 +1,387 @@
+﻿from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from itertools import chain, islice
+import logging
+from threading import Event, Lock
+from time import perf_counter
+from typing import Iterable, Iterator, Sequence
+
+from backend.config import PARSE_CHUNK_SIZE, PARSE_MAX_WORKERS, PARSE_PARALLEL_MIN_REVIEWS
+from backend.repositories.disk_cache import DiskCacheStats
+from backend.repositories.extraction_plans import EXTRACTION_PLANS, ExtractionPlanStats
+from backend.repositories.parse_cache import PARSE_CACHE
+from backend.services.parser_engines import ParsedReview
+from backend.services.parser_service import ParserService
+from backend.services.config_service import ConfigService
+from backend.services.validation_service import ValidationRow, ValidationRules, ValidationService
+from backend.utils.metrics import REVIEWS_PARSED, STAGE_SECONDS
+
+
+@dataclass
+class ReviewOutcome:
+    review_id: str
+    available_fields: list[str]
+    row: ValidationRow
+    elapsed_ms: float
+    error: str | None = None
+    cache_hit: bool = False
+    plan_hits: int = 0
+    plan_fallbacks: int = 0
+    # Split of ``elapsed_ms``; validation time is the review's share of its chunk's batch pass.
+    parse_ms: float = 0.0
+    validate_ms: float = 0.0
+
+
+_parser = ParserService()
+_validator = ValidationService()
+
+
+def parse_and_validate(
+    review_id: str,
+    html: str,
+    selected_fields: list[str],
+    use_cache: bool = True,
+    rules: ValidationRules | None = None,
+) -> ReviewOutcome:
+    """Parse and validate one review, turning any failure into an Incomplete row.
+
+    Module-level so it can run inside worker processes.
+    """
+    return _parse_and_validate_chunk([(review_id, html, selected_fields, use_cache, rules)])[0]
+
+
+def failed_outcome(
+    review_id: str, selected_fields: list[str], comment: str, error: str, elapsed_ms: float
+) -> ReviewOutcome:
+    """An Incomplete outcome for a review whose page could not be obtained or parsed."""
+    return ReviewOutcome(
+        review_id=review_id,
+        available_fields=[],
+        row=ValidationRow(
+            review_id=review_id,
+            field_values={field: "" for field in selected_fields},
+            missing_fields=list(selected_fields),
+            comment=comment,
+            status="Incomplete",
+        ),
+        elapsed_ms=elapsed_ms,
+        error=error,
+    )
+
+
+def _parse_cached(html: str, selected_fields: list[str]) -> tuple[ParsedReview, bool]:
+    """Parse ``html`` through ``PARSE_CACHE``; the flag is True when no parsing was needed.
+
+    A cached page that lacks some newly selected fields is re-parsed for just
+    those fields and its entry is extended.
+    """
+    key = PARSE_CACHE.key_for(html, _parser.version)
+    cached = PARSE_CACHE.get(key)
+    if cached is None:
+        parsed = _parser.parse_selected_fields(html, selected_fields)
+        PARSE_CACHE.put(key, parsed.fields, parsed.available_fields)
+        return parsed, False
+
+    fields, available_fields = cached
+    available = set(available_fields)
+    missing = [field for field in selected_fields if field in available and field not in fields]
+    if not missing:
+        return ParsedReview(fields, available_fields), True
+    fields.update(_parser.parse_review_html(html, missing))
+    PARSE_CACHE.put(key, fields, available_fields)
+    return ParsedReview(fields, available_fields), False
+
+
+ParseTask = tuple[str, str, list[str], bool, ValidationRules | None]
+
+
+def _parse_and_validate_task(task: ParseTask) -> ReviewOutcome:
+    return parse_and_validate(*task)
+
+
+def _parse_and_validate_chunk(tasks: list[ParseTask]) -> list[ReviewOutcome]:
+    """Parse each review on its own, then validate the parsed ones in one batch pass.
+
+    All tasks of a chunk come from the same batch, so they share the selected
+    fields and compiled rules. If the batch validation fails, the chunk's
+    parsed reviews become Incomplete rows.
+    """
+    outcomes: list[ReviewOutcome | None] = []
+    parsed_reviews: list[tuple[int, str, ParsedReview, bool, float]] = []
+    for index, (review_id, html, selected_fields, use_cache, rules) in enumerate(tasks):
+        started = perf_counter()
+        fields = [*selected_fields, *rules.condition_fields] if rules is not None else selected_fields
+        try:
+            if use_cache:
+                parsed, cache_hit = _parse_cached(html, fields)
+            else:
+                parsed, cache_hit = _parser.parse_selected_fields(html, fields), False
+        except Exception as exc:  # noqa: BLE001
+            outcomes.append(
+                failed_outcome(
+                    review_id,
+                    selected_fields,
+                    f"Failed to parse review page: {exc}",
+                    str(exc),
+                    (perf_counter() - started) * 1000,
+                )
+            )
+            continue
+        outcomes.append(None)
+        parsed_reviews.append((index, review_id, parsed, cache_hit, (perf_counter() - started) * 1000))
+
+    if parsed_reviews:
+        _, _, selected_fields, _, rules = tasks[0]
+        started = perf_counter()
+        try:
+            rows = _validator.validate_batch(
+                [review_id for _, review_id, _, _, _ in parsed_reviews],
+                selected_fields,
+                [parsed.fields for _, _, parsed, _, _ in parsed_reviews],
+                rules,
+            )
+        except Exception as exc:  # noqa: BLE001
+            validate_ms = (perf_counter() - started) * 1000 / len(parsed_reviews)
+            for index, review_id, _, _, parse_ms in parsed_reviews:
+                outcomes[index] = failed_outcome(
+                    review_id,
+                    selected_fields,
+                    f"Failed to validate review: {exc}",
+                    str(exc),
+                    parse_ms + validate_ms,
+                )
+            return outcomes
+        validate_ms = (perf_counter() - started) * 1000 / len(parsed_reviews)
+        for (index, review_id, parsed, cache_hit, parse_ms), row in zip(parsed_reviews, rows):
+            outcomes[index] = ReviewOutcome(
+                review_id=review_id,
+                available_fields=parsed.available_fields,
+                row=row,
+                elapsed_ms=parse_ms + validate_ms,
+                cache_hit=cache_hit,
+                plan_hits=parsed.plan_hits,
+                plan_fallbacks=parsed.plan_fallbacks,
+                parse_ms=parse_ms,
+                validate_ms=validate_ms,
+            )
+    return outcomes
+
+
+def _record_metrics(outcome: ReviewOutcome) -> None:
+    if outcome.error is not None:
+        REVIEWS_PARSED.inc(status="failed", cache="miss")
+        return
+    REVIEWS_PARSED.inc(status=outcome.row.status.lower(), cache="hit" if outcome.cache_hit else "miss")
+    STAGE_SECONDS.observe(outcome.parse_ms / 1000, stage="parse_review")
+    STAGE_SECONDS.observe(outcome.validate_ms / 1000, stage="validate_review")
+
+
+@dataclass
+class ParseCacheStats:
+    disk: DiskCacheStats
+    hits: int
+    misses: int
+
+
+@dataclass
+class PlanStats:
+    store: ExtractionPlanStats
+    hits: int
+    fallbacks: int
+
+
+class ParseEngine:
+    """Runs parse + validate for a batch of reviews, in parallel when it pays off.
+
+    Batches smaller than ``parallel_threshold`` (or with a single worker) run
+    serially in-process. Larger batches go to a lazily created process pool
+    in chunks of ``chunk_size``, with only a small window of chunks in flight
+    so streamed input is consumed as workers free up. Each review is isolated
+    by ``parse_and_validate``, and if the pool itself breaks the unfinished
+    reviews are re-run serially.
+
+    Validation rules come from the Collaborator config and are compiled once
+    per batch; each chunk is validated in one ``validate_batch`` pass.
+
+    With ``use_cache`` each page's parse goes through ``PARSE_CACHE``; hits
+    and misses are counted here because worker processes keep their own
+    cache counters. Extraction plan hits and fallbacks are totalled here for
+    the same reason, and so are the per-review parse and validation timings
+    reported to ``/metrics``.
+    """
+
+    # Chunks kept in flight per worker.
+    WINDOW_PER_WORKER = 2
+    CANCEL_POLL_SECONDS = 0.2
+
+    def __init__(
+        self,
+        max_workers: int = PARSE_MAX_WORKERS,
+        chunk_size: int = PARSE_CHUNK_SIZE,
+        parallel_threshold: int = PARSE_PARALLEL_MIN_REVIEWS,
+        use_cache: bool = True,
+        config_service: ConfigService | None = None,
+    ) -> None:
+        self._max_workers = max(1, max_workers)
+        self._chunk_size = max(1, chunk_size)
+        self._parallel_threshold = parallel_threshold
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = Lock()
+        self._use_cache = use_cache
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._plan_hits = 0
+        self._plan_fallbacks = 0
+        self._config_service = config_service or ConfigService()
+        self._logger = logging.getLogger("collaborator")
+
+    def run(self, reviews: Sequence[tuple[str, str]], selected_fields: list[str]) -> list[ReviewOutcome]:
+        outcomes: list[ReviewOutcome | None] = [None] * len(reviews)
+        for position, outcome in self.iter_outcomes(reviews, selected_fields):
+            outcomes[position] = outcome
+        return outcomes
+
+    def iter_outcomes(
+        self,
+        reviews: Iterable[tuple[str, str]],
+        selected_fields: list[str],
+        cancelled: Event | None = None,
+    ) -> Iterator[tuple[int, ReviewOutcome]]:
+        """Yield ``(input position, outcome)`` pairs as reviews finish.
+
+        ``reviews`` is consumed lazily. Once ``cancelled`` is set no further
+        reviews are started and iteration stops.
+        """
+        rules = self.compile_rules(selected_fields)
+        tasks = (
+            (position, (review_id, html, selected_fields, self._use_cache, rules))
+            for position, (review_id, html) in enumerate(reviews)
+        )
+        if self._max_workers == 1:
+            source = self._iter_serial(tasks, cancelled)
+        else:
+            head = list(islice(tasks, max(self._parallel_threshold, 1)))
+            if len(head) < self._parallel_threshold:
+                source = self._iter_serial(head, cancelled)
+            else:
+                source = self._iter_pool(chain(head, tasks), cancelled)
+
+        hits = misses = plan_hits = plan_fallbacks = 0
+        try:
+            for position, outcome in source:
+                if outcome.cache_hit:
+                    hits += 1
+                else:
+                    misses += 1
+                plan_hits += outcome.plan_hits
+                plan_fallbacks += outcome.plan_fallbacks
+                _record_metrics(outcome)
+                yield position, outcome
+        finally:
+            self._record_cache(hits, misses)
+            with self._pool_lock:
+                self._plan_hits += plan_hits
+                self._plan_fallbacks += plan_fallbacks
+
+    def cache_stats(self) -> ParseCacheStats:
+        with self._pool_lock:
+            return ParseCacheStats(disk=PARSE_CACHE.disk.stats(), hits=self._cache_hits, misses=self._cache_misses)
+
+    def clear_cache(self) -> int:
+        return PARSE_CACHE.disk.clear()
+
+    def compile_rules(self, selected_fields: list[str]) -> ValidationRules:
+        """Compile the configured validation rules once for a batch."""
+        config = self._config_service.get_collaborator_config()
+        return _validator.compile_rules(config.validation_rules, selected_fields)
+
+    def plan_stats(self) -> PlanStats:
+        with self._pool_lock:
+            return PlanStats(store=EXTRACTION_PLANS.stats(), hits=self._plan_hits, fallbacks=self._plan_fallbacks)
+
+    def clear_plans(self) -> int:
+        return EXTRACTION_PLANS.clear()
+
+    def _record_cache(self, hits: int, misses: int) -> None:
+        if not self._use_cache:
+            return
+        with self._pool_lock:
+            self._cache_hits += hits
+            self._cache_misses += misses
+        if misses:
+            PARSE_CACHE.evict()
+
+    def _iter_serial(
+        self, tasks: Iterable[tuple[int, ParseTask]], cancelled: Event | None
+    ) -> Iterator[tuple[int, ReviewOutcome]]:
+        for position, task in tasks:
+            if cancelled is not None and cancelled.is_set():
+                return
+            yield position, _parse_and_validate_task(task)
+
+    def _iter_pool(
+        self, tasks: Iterator[tuple[int, ParseTask]], cancelled: Event | None
+    ) -> Iterator[tuple[int, ReviewOutcome]]:
+        pool = self._get_pool()
+        pending: dict[Future, list[tuple[int, ParseTask]]] = {}
+
+        def submit_next() -> bool:
+            chunk = list(islice(tasks, self._chunk_size))
+            if not chunk:
+                return False
+            pending[pool.submit(_parse_and_validate_chunk, [task for _, task in chunk])] = chunk
+            return True
+
+        try:
+            while len(pending) < self._max_workers * self.WINDOW_PER_WORKER and submit_next():
+                pass
+            while pending:
+                if cancelled is not None and cancelled.is_set():
+                    return
+                done, _ = wait(list(pending), timeout=self.CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = pending.pop(future)
+                    try:
+                        outcomes = future.result()
+                    except BrokenProcessPool as exc:
+                        self._logger.error("Parse worker pool failed, finishing batch serially: %s", str(exc))
+                        self._reset_pool()
+                        unfinished = chain(chunk, *(pending.pop(other) for other in list(pending)), tasks)
+                        yield from self._iter_serial(unfinished, cancelled)
+                        return
+                    except Exception as exc:  # noqa: BLE001
+                        # Only this chunk is lost; the pool and the rest of the batch carry on.
+                        self._logger.error("Parse worker failed on a chunk: %s", str(exc))
+                        for position, (review_id, _, selected_fields, _, _) in chunk:
+                            yield position, failed_outcome(
+                                review_id, selected_fields, f"Failed to parse review page: {exc}", str(exc), 0.0
+                            )
+                        submit_next()
+                        continue
+                    for (position, _), outcome in zip(chunk, outcomes):
+                        yield position, outcome
+                    submit_next()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+            return self._pool
+
+    def _reset_pool(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
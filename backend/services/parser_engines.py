@@ -0,0 +1,551 @@
+﻿from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+from itertools import islice
+from typing import TYPE_CHECKING, Collection, Protocol
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml is optional at runtime
+    etree = None
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+    from backend.repositories.extraction_plans import ExtractionPlanStore
+
+
+REVIEW_TITLE_FIELD = "Review Title"
+
+# Bump when any engine changes what it extracts; cached parses are keyed on it.
+PARSER_VERSION = "1"
+
+
+@dataclass
+class ParsedReview:
+    fields: dict[str, str]
+    available_fields: list[str]
+    # Selected fields read through a learned extraction plan, and those that
+    # needed the generic heuristics instead.
+    plan_hits: int = 0
+    plan_fallbacks: int = 0
+
+
+class ParserEngine(Protocol):
+    name: str
+
+    def parse(self, html: str, fields: Collection[str] | None = None) -> dict[str, str]:
+        ...
+
+    def discover_fields(self, html: str) -> list[str]:
+        ...
+
+    def parse_selected(self, html: str, fields: Collection[str]) -> ParsedReview:
+        ...
+
+
+class SoupParserEngine:
+    """Reference engine: BeautifulSoup with the pure-Python ``html.parser``.
+
+    It extracts generic key/value metadata from labeled table rows, dt/dd lists,
+    and heading-based sections so field names can vary by template.
+    """
+
+    name = "bs4"
+
+    def parse(self, html: str, fields: Collection[str] | None = None) -> dict[str, str]:
+        parsed = self._parse_all(html)
+        if fields is None:
+            return parsed
+        return {field: parsed[field] for field in fields if field in parsed}
+
+    def discover_fields(self, html: str) -> list[str]:
+        return list(self._parse_all(html))
+
+    def parse_selected(self, html: str, fields: Collection[str]) -> ParsedReview:
+        parsed = self._parse_all(html)
+        return ParsedReview(
+            fields={field: parsed[field] for field in fields if field in parsed},
+            available_fields=list(parsed),
+        )
+
+    def _parse_all(self, html: str) -> dict[str, str]:
+        # Imported here so processes using the lxml engine never load bs4.
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+        fields: dict[str, str] = {}
+
+        title = self._extract_title(soup)
+        if title:
+            fields[REVIEW_TITLE_FIELD] = title
+
+        fields.update(self._extract_table_fields(soup))
+        fields.update(self._extract_definition_fields(soup))
+        fields.update(self._extract_section_fields(soup))
+
+        return {key: value.strip() for key, value in fields.items() if key.strip()}
+
+    def _extract_title(self, soup: BeautifulSoup) -> str:
+        for selector in ["h1", "title", "[data-review-title]"]:
+            tag = soup.select_one(selector)
+            if tag and tag.get_text(strip=True):
+                return tag.get_text(" ", strip=True)
+        return ""
+
+    def _extract_table_fields(self, soup: BeautifulSoup) -> dict[str, str]:
+        result: dict[str, str] = {}
+        for row in soup.select("tr"):
+            header = row.find(["th", "td"], recursive=False)
+            if not header:
+                continue
+            cells = row.find_all(["td", "th"], recursive=False)
+            if len(cells) < 2:
+                continue
+
+            key = header.get_text(" ", strip=True).rstrip(":")
+            value = " ".join(cell.get_text(" ", strip=True) for cell in cells[1:]).strip()
+            if key and value:
+                result.setdefault(key, value)
+        return result
+
+    def _extract_definition_fields(self, soup: BeautifulSoup) -> dict[str, str]:
+        result: dict[str, str] = {}
+        for term in soup.select("dt"):
+            key = term.get_text(" ", strip=True).rstrip(":")
+            value_tag = term.find_next_sibling("dd")
+            if not value_tag:
+                continue
+            value = value_tag.get_text(" ", strip=True)
+            if key and value:
+                result.setdefault(key, value)
+        return result
+
+    def _extract_section_fields(self, soup: BeautifulSoup) -> dict[str, str]:
+        result: dict[str, str] = {}
+        headings = soup.select("h2, h3, h4")
+        for heading in headings:
+            key = heading.get_text(" ", strip=True).rstrip(":")
+            if not key:
+                continue
+
+            content_parts: list[str] = []
+            for sibling in heading.find_next_siblings(limit=5):
+                if sibling.name in {"h1", "h2", "h3", "h4"}:
+                    break
+                text = sibling.get_text(" ", strip=True)
+                if text:
+                    content_parts.append(text)
+
+            value = " ".join(content_parts).strip()
+            if value:
+                result.setdefault(key, value)
+        return result
+
+
+# BeautifulSoup stores text under these tags as special string types that
+# get_text() on an ancestor skips; the lxml engine mirrors that.
+_HIDDEN_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4"})
+_SECTION_TAGS = frozenset({"h2", "h3", "h4"})
+_CELL_TAGS = frozenset({"td", "th"})
+_SECTION_SIBLING_LIMIT = 5
+
+# Template fingerprints look at the first children of the page skeleton
+# down to this depth, so their cost does not grow with long tables or lists.
+_FINGERPRINT_DEPTH = 4
+_FINGERPRINT_CHILDREN = 16
+_FINGERPRINT_MAX_NODES = 256
+
+
+class LxmlParserEngine:
+    """Single-pass engine on libxml2's C HTML parser.
+
+    A full ``parse`` makes one ``iter()`` over the tree that collects title
+    candidates, table rows, dt/dd pairs and heading sections at once, and
+    applies the same rules and precedence as ``SoupParserEngine``.
+
+    When only some fields are wanted, the sources are instead walked in
+    precedence order (sections, definitions, table rows, title). A field found
+    in a higher source is final, so each walk stops as soon as every pending
+    field is resolved, and value text is only built for requested keys.
+    ``discover_fields`` lists the keys that would be extracted while only
+    checking that their values are non-empty.
+
+    With ``plans``, selected fields are first looked up through the plan
+    learned for the page's template fingerprint: the recorded child-index
+    path is followed straight to the element, which is accepted only if it
+    still holds the field's key and a non-empty value and no higher source or
+    earlier element of its own source holds the field. Fields the plan misses
+    fall back to the walks above, and where they were found is recorded for
+    the next page.
+    """
+
+    name = "lxml"
+
+    def __init__(self, plans: ExtractionPlanStore | None = None) -> None:
+        if etree is None:
+            raise RuntimeError("lxml is not installed.")
+        self._parser = etree.HTMLParser(remove_comments=False, recover=True)
+        self._plans = plans
+        # Keyed sources in precedence order: name -> (tags, collector).
+        self._sources = {
+            "section": (_SECTION_TAGS, self._collect_section),
+            "dt": (("dt",), self._collect_definition),
+            "tr": (("tr",), self._collect_table_row),
+        }
+
+    def parse(self, html: str, fields: Collection[str] | None = None) -> dict[str, str]:
+        root = self._parse_tree(html)
+        if root is None:
+            return {}
+        if fields is None:
+            return self._extract_all(root)
+        return self._extract_planned(root, set(fields))[0]
+
+    def discover_fields(self, html: str) -> list[str]:
+        root = self._parse_tree(html)
+        if root is None:
+            return []
+        return self._discover(root)
+
+    def parse_selected(self, html: str, fields: Collection[str]) -> ParsedReview:
+        root = self._parse_tree(html)
+        if root is None:
+            return ParsedReview(fields={}, available_fields=[])
+        selected, plan_hits, plan_fallbacks = self._extract_planned(root, set(fields))
+        return ParsedReview(
+            fields=selected,
+            available_fields=self._discover(root),
+            plan_hits=plan_hits,
+            plan_fallbacks=plan_fallbacks,
+        )
+
+    def _parse_tree(self, html: str):
+        if not html.strip():
+            return None
+        try:
+            return etree.fromstring(html, self._parser)
+        except ValueError:
+            # lxml rejects str input that carries an XML encoding declaration.
+            return etree.fromstring(html.encode("utf-8"), self._parser)
+
+    def _extract_all(self, root) -> dict[str, str]:
+        title_candidates: dict[str, object] = {}
+        table_fields: dict[str, str] = {}
+        definition_fields: dict[str, str] = {}
+        section_fields: dict[str, str] = {}
+
+        for element in root.iter():
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue
+
+            if tag in {"h1", "title"}:
+                title_candidates.setdefault(tag, element)
+            if "data-review-title" in element.attrib:
+                title_candidates.setdefault("data-review-title", element)
+
+            if tag == "tr":
+                self._collect_table_row(element, table_fields)
+            elif tag == "dt":
+                self._collect_definition(element, definition_fields)
+            elif tag in _SECTION_TAGS:
+                self._collect_section(element, section_fields)
+
+        fields: dict[str, str] = {}
+        title = self._extract_title(root, title_candidates)
+        if title:
+            fields[REVIEW_TITLE_FIELD] = title
+
+        fields.update(table_fields)
+        fields.update(definition_fields)
+        fields.update(section_fields)
+        return {key: value.strip() for key, value in fields.items() if key.strip()}
+
+    def _extract_planned(self, root, pending: set[str]) -> tuple[dict[str, str], int, int]:
+        """Extract ``pending`` via the template's plan; return ``(fields, plan hits, fallbacks)``."""
+        if self._plans is None or not pending:
+            return self._extract_selected(root, pending), 0, 0
+
+        fingerprint = _fingerprint(root)
+        steps: dict[str, tuple[str, object, str]] = {}
+        for field, (kind, path) in self._plans.get(fingerprint).items():
+            if field in pending:
+                element, value = self._apply_step(root, field, kind, path)
+                if value:
+                    steps[field] = (kind, element, value)
+        fields = self._confirm_steps(root, steps)
+        pending.difference_update(fields)
+        plan_hits, plan_fallbacks = len(fields), len(pending)
+        if pending:
+            locations: dict[str, tuple[str, object]] = {}
+            fields.update(self._extract_selected(root, pending, locations))
+            self._plans.learn(
+                fingerprint,
+                {field: (kind, _index_path(root, element)) for field, (kind, element) in locations.items()},
+            )
+        return fields, plan_hits, plan_fallbacks
+
+    def _apply_step(self, root, field: str, kind: str, path: str) -> tuple[object | None, str]:
+        element = root
+        try:
+            for index in path.split("/"):
+                element = element[int(index)]
+        except (IndexError, ValueError):
+            return None, ""
+        if not isinstance(element.tag, str):
+            return None, ""
+        if kind == "title":
+            return element, _text(element)
+        source = self._sources.get(kind)
+        if source is None or element.tag not in source[0]:
+            return None, ""
+        collect = source[1]
+        found: dict[str, str] = {}
+        collect(element, found, (field,))
+        return element, found.get(field, "")
+
+    def _confirm_steps(self, root, steps: dict[str, tuple[str, object, str]]) -> dict[str, str]:
+        """Keep the plan values the generic walk would also have picked.
+
+        A step is dropped when a higher source, or an earlier element of its
+        own source, holds the field; a title step only holds if its element is
+        still the first title candidate. The sources are walked in precedence
+        order, each only until every step it could override is settled.
+        """
+        unsettled = dict(steps)
+        confirmed: dict[str, str] = {}
+        for kind, (tags, collect) in self._sources.items():
+            if not unsettled:
+                break
+            for element in root.iter(*tags):
+                for field, (step_kind, step_element, value) in list(unsettled.items()):
+                    if step_kind == kind and step_element is element:
+                        confirmed[field] = value
+                        del unsettled[field]
+                if not unsettled:
+                    break
+                found: dict[str, str] = {}
+                collect(element, found, unsettled)
+                for field in found:
+                    del unsettled[field]
+        for field, (step_kind, step_element, value) in unsettled.items():
+            if step_kind == "title" and self._find_title(root)[1] is step_element:
+                confirmed[field] = value
+        return confirmed
+
+    def _extract_selected(
+        self, root, pending: set[str], locations: dict[str, tuple[str, object]] | None = None
+    ) -> dict[str, str]:
+        """Walk the sources in precedence order; ``locations`` records each field's source and key element."""
+        fields: dict[str, str] = {}
+        for kind, (tags, collect) in self._sources.items():
+            if not pending:
+                break
+            found: dict[str, str] = {}
+            for element in root.iter(*tags):
+                before = len(found)
+                collect(element, found, pending)
+                if len(found) > before and locations is not None:
+                    locations[next(reversed(found))] = (kind, element)
+                if len(found) == len(pending):
+                    break
+            fields.update(found)
+            pending.difference_update(found)
+
+        if REVIEW_TITLE_FIELD in pending:
+            title, element = self._find_title(root)
+            if title:
+                fields[REVIEW_TITLE_FIELD] = title
+                if locations is not None:
+                    locations[REVIEW_TITLE_FIELD] = ("title", element)
+        return fields
+
+    def _discover(self, root) -> list[str]:
+        table_keys: dict[str, None] = {}
+        definition_keys: dict[str, None] = {}
+        section_keys: dict[str, None] = {}
+
+        for element in root.iter():
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue
+            if tag == "tr":
+                cells = [child for child in element if child.tag in _CELL_TAGS]
+                if len(cells) < 2:
+                    continue
+                key = _text(cells[0]).rstrip(":")
+                if key and key not in table_keys and any(_has_text(cell) for cell in cells[1:]):
+                    table_keys[key] = None
+            elif tag == "dt":
+                key = _text(element).rstrip(":")
+                if key and key not in definition_keys:
+                    value_tag = next(element.itersiblings("dd"), None)
+                    if value_tag is not None and _has_text(value_tag):
+                        definition_keys[key] = None
+            elif tag in _SECTION_TAGS:
+                key = _text(element).rstrip(":")
+                if key and key not in section_keys and any(_has_text(sibling) for sibling in _section_siblings(element)):
+                    section_keys[key] = None
+
+        has_title = any(_has_text(candidate) for candidate in self._title_candidates(root))
+        keys: dict[str, None] = {REVIEW_TITLE_FIELD: None} if has_title else {}
+        keys.update(table_keys)
+        keys.update(definition_keys)
+        keys.update(section_keys)
+        return [key for key in keys if key.strip()]
+
+    def _extract_title(self, root, candidates: dict[str, object] | None = None) -> str:
+        return self._find_title(root, candidates)[0]
+
+    def _find_title(self, root, candidates: dict[str, object] | None = None) -> tuple[str, object | None]:
+        for candidate in self._title_candidates(root) if candidates is None else _ordered_titles(candidates):
+            title = _text(candidate)
+            if title:
+                return title, candidate
+        return "", None
+
+    def _title_candidates(self, root):
+        """Yield the title candidates in selector order, locating each only when needed."""
+        candidates: dict[str, object] = {}
+        for element in root.iter("h1", "title"):
+            candidates.setdefault(element.tag, element)
+            if len(candidates) == 2:
+                break
+        yield from _ordered_titles(candidates)
+        yield from root.xpath("(//*[@data-review-title])[1]")
+
+    def _collect_table_row(self, row, result: dict[str, str], wanted: Collection[str] | None = None) -> None:
+        cells = [child for child in row if child.tag in _CELL_TAGS]
+        if len(cells) < 2:
+            return
+        key = _text(cells[0]).rstrip(":")
+        if not key or key in result or (wanted is not None and key not in wanted):
+            return
+        value = " ".join(_text(cell) for cell in cells[1:]).strip()
+        if value:
+            result[key] = value
+
+    def _collect_definition(self, term, result: dict[str, str], wanted: Collection[str] | None = None) -> None:
+        key = _text(term).rstrip(":")
+        if not key or key in result or (wanted is not None and key not in wanted):
+            return
+        value_tag = next(term.itersiblings("dd"), None)
+        if value_tag is None:
+            return
+        value = _text(value_tag)
+        if value:
+            result[key] = value
+
+    def _collect_section(self, heading, result: dict[str, str], wanted: Collection[str] | None = None) -> None:
+        key = _text(heading).rstrip(":")
+        if not key or key in result or (wanted is not None and key not in wanted):
+            return
+
+        content_parts = [text for text in (_text(sibling) for sibling in _section_siblings(heading)) if text]
+        value = " ".join(content_parts).strip()
+        if value:
+            result[key] = value
+
+
+def _fingerprint(root) -> str:
+    """Hash of the page skeleton: tag, id and class of the top levels.
+
+    Runs of siblings with the same signature count once, so pages of one
+    template with more or fewer table rows or list items still match.
+    """
+    parts: list[str] = []
+
+    def walk(element, depth: int) -> None:
+        previous = None
+        for child in islice(element, _FINGERPRINT_CHILDREN):
+            if not isinstance(child.tag, str) or len(parts) >= _FINGERPRINT_MAX_NODES:
+                continue
+            signature = f"{child.tag}#{child.get('id', '')}.{child.get('class', '')}"
+            if signature == previous:
+                continue
+            previous = signature
+            parts.append(f"{depth}:{signature}")
+            if depth < _FINGERPRINT_DEPTH:
+                walk(child, depth + 1)
+
+    walk(root, 1)
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _index_path(root, element) -> str:
+    """Child indexes leading from ``root`` to ``element``, e.g. ``"1/0/3"``."""
+    indexes: list[str] = []
+    while element is not root:
+        parent = element.getparent()
+        indexes.append(str(parent.index(element)))
+        element = parent
+    return "/".join(reversed(indexes))
+
+
+def _ordered_titles(candidates: dict[str, object]) -> list:
+    return [candidates[selector] for selector in ("h1", "title", "data-review-title") if selector in candidates]
+
+
+def _section_siblings(heading):
+    """The element siblings a section may draw its value from."""
+    seen = 0
+    for sibling in heading.itersiblings():
+        if not isinstance(sibling.tag, str):
+            continue
+        seen += 1
+        if seen > _SECTION_SIBLING_LIMIT or sibling.tag in _HEADING_TAGS:
+            return
+        yield sibling
+
+
+def _has_text(element) -> bool:
+    """Whether ``_text(element)`` would be non-empty, without building it."""
+    if not len(element):
+        return bool(element.text and element.text.strip())
+    if element.tag in _HIDDEN_TEXT_TAGS or next(element.iter(*_HIDDEN_TEXT_TAGS), None) is None:
+        strings = element.itertext()
+    else:
+        strings = _visible_strings(element)
+    return any(text.strip() for text in strings)
+
+
+def _text(element) -> str:
+    """Equivalent of BeautifulSoup's ``get_text(" ", strip=True)``."""
+    if not len(element):
+        return element.text.strip() if element.text else ""
+    if element.tag in _HIDDEN_TEXT_TAGS or next(element.iter(*_HIDDEN_TEXT_TAGS), None) is None:
+        strings = element.itertext()
+    else:
+        strings = _visible_strings(element)
+    return " ".join(stripped for stripped in (text.strip() for text in strings) if stripped)
+
+
+def _visible_strings(element):
+    if element.text:
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str) and child.tag not in _HIDDEN_TEXT_TAGS:
+            yield from _visible_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+PARSER_ENGINES = {
+    SoupParserEngine.name: SoupParserEngine,
+    LxmlParserEngine.name: LxmlParserEngine,
+}
+
+
+def create_parser_engine(name: str = "auto", plans: ExtractionPlanStore | None = None) -> ParserEngine:
+    """Build the named engine; ``plans`` is used by engines that support extraction plans."""
+    if name == "auto":
+        name = LxmlParserEngine.name if etree is not None else SoupParserEngine.name
+    engine_class = PARSER_ENGINES.get(name)
+    if engine_class is None:
+        raise ValueError(f"Unknown parser engine: {name}")
+    if engine_class is LxmlParserEngine:
+        return LxmlParserEngine(plans)
+    return engine_class()
@@ -1,66 +1,205 @@
 ﻿from __future__ import annotations
 
+import base64
+from dataclasses import dataclass
+import hashlib
+import json
 from typing import Iterable
+import numpy as np
 import pandas as pd
 
-from backend.repositories.data_store import DATA_STORE
+from backend.repositories.data_store import DATA_STORE, DumpSnapshot
+from backend.repositories.preview_cache import PREVIEW_CACHE, PreviewCacheStats
+from backend.utils.headers import HeaderIndex
+from backend.utils.metrics import ROWS_PROCESSED, stage_timer
+
+
+@dataclass
+class PreviewPage:
+    total: int
+    offset: int
+    limit: int
+    columns: list[str]
+    rows: pd.DataFrame
+    next_cursor: str | None
+    version: int
 
 
 class PreviewService:
     ISSUE_KEY_COLUMN = "Issue Key"
     SUMMARY_COLUMN = "Summary"
+    COMPLETED_COMMENT = "Review completed"
+
+    def build_preview(self, filters: Iterable[str], snapshot: DumpSnapshot | None = None) -> pd.DataFrame:
+        """Return the preview frame, served from ``PREVIEW_CACHE`` when possible.
+
+        The returned frame may be shared with other callers; do not modify it.
+        """
+        filters = self._normalize_filters(filters)
+        snapshot = snapshot or DATA_STORE.snapshot()
+        if snapshot.dump_df is None:
+            raise ValueError("No dump loaded. Upload the dump file first.")
+
+        key = (snapshot.dump_version, snapshot.keys_digest, tuple(filters))
+        preview = PREVIEW_CACHE.get(key)
+        if preview is None:
+            with stage_timer("build_preview"):
+                preview = self._build_preview(filters, snapshot)
+            ROWS_PROCESSED.inc(len(snapshot.dump_df), stage="build_preview")
+            PREVIEW_CACHE.put(key, preview)
+        return preview
+
+    def get_cache_stats(self) -> PreviewCacheStats:
+        return PREVIEW_CACHE.stats()
 
-    def build_preview(self, filters: Iterable[str]) -> pd.DataFrame:
-        filters = [name.strip() for name in filters if name.strip()]
-        with DATA_STORE.lock:
-            if DATA_STORE.dump_df is None:
-                raise ValueError("No dump loaded. Upload the dump file first.")
-            dump_df = DATA_STORE.dump_df.copy()
-            issue_keys = list(DATA_STORE.issue_keys)
+    def _build_preview(self, filters: list[str], snapshot: DumpSnapshot) -> pd.DataFrame:
+        dump_df = snapshot.dump_df
+        issue_keys = snapshot.issue_keys
+        header_index = snapshot.header_index or HeaderIndex.for_frame(dump_df)
 
-        issue_col = self._find_column(dump_df, self.ISSUE_KEY_COLUMN)
+        issue_col, summary_col = header_index.find_many([self.ISSUE_KEY_COLUMN, self.SUMMARY_COLUMN]).values()
         if issue_col is None:
             raise ValueError(f"Missing required column: {self.ISSUE_KEY_COLUMN}")
 
-        summary_col = self._find_column(dump_df, self.SUMMARY_COLUMN)
-        if summary_col is None:
-            dump_df[self.SUMMARY_COLUMN] = ""
-            summary_col = self.SUMMARY_COLUMN
-
         if issue_keys:
             normalized_keys = {key.strip() for key in issue_keys if key.strip()}
             dump_df = dump_df[dump_df[issue_col].astype(str).isin(normalized_keys)]
 
-        column_map = {}
-        for name in filters:
-            column = self._find_column(dump_df, name)
-            if column is None:
-                dump_df[name] = ""
-                column = name
-            column_map[name] = column
-
-        output_rows = []
-        for _, row in dump_df.iterrows():
-            row_data = {
-                "Issue Key": row.get(issue_col, ""),
-                "Summary": row.get(summary_col, ""),
-            }
-
-            blanks = []
-            for display_name, col_name in column_map.items():
-                value = str(row.get(col_name, "")).strip()
-                row_data[display_name] = value
-                if value == "":
-                    blanks.append(f"{display_name} is blank")
-
-            row_data["Comment"] = ", ".join(blanks) if blanks else "Review completed"
-            output_rows.append(row_data)
-
-        return pd.DataFrame(output_rows)
-
-    def _find_column(self, df: pd.DataFrame, name: str) -> str | None:
-        target = name.strip().lower()
-        for col in df.columns:
-            if str(col).strip().lower() == target:
-                return col
-        return None
+        column_map = header_index.find_many(filters)
+
+        blank_column = pd.Series("", index=dump_df.index, dtype=object)
+        output: dict[str, pd.Series] = {
+            "Issue Key": dump_df[issue_col],
+            "Summary": dump_df[summary_col] if summary_col is not None else blank_column,
+        }
+        comment = np.full(len(dump_df), "", dtype=object)
+        for display_name, col_name in column_map.items():
+            values = blank_column if col_name is None else dump_df[col_name].astype(str).str.strip()
+            output[display_name] = values
+
+            blank = values.to_numpy() == ""
+            if blank.any():
+                label = f"{display_name} is blank"
+                has_comment = comment != ""
+                append = blank & has_comment
+                comment[append] = comment[append] + f", {label}"
+                comment[blank & ~has_comment] = label
+
+        comment[comment == ""] = self.COMPLETED_COMMENT
+        output["Comment"] = pd.Series(comment, index=dump_df.index, dtype=object)
+        return pd.DataFrame(output).reset_index(drop=True)
+
+    def build_preview_page(
+        self,
+        filters: Iterable[str],
+        offset: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        sort_by: str | None = None,
+        sort_desc: bool = False,
+        search: str | None = None,
+        incomplete_only: bool = False,
+    ) -> PreviewPage:
+        """Slice one page from the preview.
+
+        The row order after the incomplete filter, the search and the sort is
+        kept in ``PREVIEW_CACHE`` next to the preview itself, so following
+        pages of the same query only cost their own rows.
+        """
+        filters = self._normalize_filters(filters)
+        term = (search or "").strip()
+        snapshot = DATA_STORE.snapshot()
+        preview = self.build_preview(filters, snapshot=snapshot)
+
+        sort_col = None
+        if sort_by:
+            sort_col = HeaderIndex.for_frame(preview).find(sort_by)
+            if sort_col is None:
+                raise ValueError(f"Cannot sort by unknown column: {sort_by}")
+
+        query = self._query_digest(filters, sort_col, sort_desc, term, incomplete_only)
+        if cursor:
+            offset = self._decode_cursor(cursor, snapshot.version, query)
+
+        order = self._row_order(preview, snapshot, filters, sort_col, sort_desc, term, incomplete_only)
+        if order is None:
+            total = len(preview)
+            page = preview.iloc[offset : offset + limit]
+        else:
+            total = len(order)
+            page = preview.iloc[order[offset : offset + limit]]
+        page = page.reset_index(drop=True)
+        next_offset = offset + len(page)
+        next_cursor = self._encode_cursor(next_offset, snapshot.version, query) if next_offset < total else None
+
+        return PreviewPage(
+            total=total,
+            offset=offset,
+            limit=limit,
+            columns=[str(column) for column in preview.columns],
+            rows=page,
+            next_cursor=next_cursor,
+            version=snapshot.version,
+        )
+
+    def _row_order(
+        self,
+        preview: pd.DataFrame,
+        snapshot: DumpSnapshot,
+        filters: list[str],
+        sort_col: str | None,
+        sort_desc: bool,
+        term: str,
+        incomplete_only: bool,
+    ) -> np.ndarray | None:
+        """Positions of the matching preview rows in page order, or ``None`` for all rows as they are."""
+        if not (sort_col or term or incomplete_only):
+            return None
+        key = (snapshot.dump_version, snapshot.keys_digest, tuple(filters), "rows", sort_col, sort_desc, term, incomplete_only)
+        order = PREVIEW_CACHE.get(key)
+        if order is not None:
+            return order
+
+        matches = np.ones(len(preview), dtype=bool)
+        if incomplete_only:
+            matches &= preview["Comment"].to_numpy() != self.COMPLETED_COMMENT
+        if term:
+            found = np.zeros(len(preview), dtype=bool)
+            for column in preview.columns:
+                found |= preview[column].astype(str).str.contains(term, case=False, regex=False).to_numpy()
+            matches &= found
+        order = np.flatnonzero(matches)
+
+        if sort_col:
+            values = preview[sort_col].iloc[order].astype(str).str.lower().reset_index(drop=True)
+            order = order[values.sort_values(ascending=not sort_desc, kind="stable").index.to_numpy()]
+
+        PREVIEW_CACHE.put(key, order)
+        return order
+
+    def _normalize_filters(self, filters: Iterable[str]) -> list[str]:
+        return list(dict.fromkeys(name.strip() for name in filters if name.strip()))
+
+    def _query_digest(
+        self, filters: list[str], sort_col: str | None, sort_desc: bool, term: str, incomplete_only: bool
+    ) -> str:
+        query = json.dumps([filters, sort_col, sort_desc, term, incomplete_only])
+        return hashlib.sha1(query.encode("utf-8")).hexdigest()[:16]
+
+    def _encode_cursor(self, offset: int, version: int, query: str) -> str:
+        payload = json.dumps({"offset": offset, "version": version, "query": query}).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii")
+
+    def _decode_cursor(self, cursor: str, version: int, query: str) -> int:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            offset = int(payload["offset"])
+            cursor_version = int(payload["version"])
+            cursor_query = str(payload["query"])
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ValueError("Invalid preview cursor.") from exc
+        if cursor_version != version or offset < 0:
+            raise ValueError("Preview data changed since this cursor was issued. Reload the first page.")
+        if cursor_query != query:
+            raise ValueError("Preview cursor was issued for different filters, sort or search. Reload the first page.")
+        return offset
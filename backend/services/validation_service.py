@@ -1,6 +1,13 @@
 ﻿from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import re
+from typing import Iterable, Mapping, Sequence
+
+from backend.services.config_service import ValidationRuleConfig
+
+
+COMPLETE_COMMENT = "All required fields present"
 
 
 @dataclass
@@ -10,30 +17,175 @@ class ValidationRow:
     missing_fields: list[str]
     comment: str
     status: str
+    rule_failures: list[str] = field(default_factory=list)
 
 
-class ValidationService:
-    def validate(self, review_id: str, selected_fields: list[str], parsed_fields: dict[str, str]) -> ValidationRow:
-        missing_fields: list[str] = []
-        normalized_values: dict[str, str] = {}
-
-        for field in selected_fields:
-            value = str(parsed_fields.get(field, "")).strip()
-            normalized_values[field] = value
-            if not value:
-                missing_fields.append(field)
-
-        if missing_fields:
-            comment = f"Missing: {', '.join(missing_fields)}"
-            status = "Incomplete"
+@dataclass(frozen=True)
+class CompiledRule:
+    """One check on one field, ready to run over a whole column of values.
+
+    Exactly one of ``pattern``, ``allowed_values`` and ``min_length`` is set.
+    Empty values are never checked; they are already reported as missing.
+    With ``when_field`` the check only applies to rows where that field
+    equals one of ``when_equals`` (or is non-empty when ``when_equals`` is
+    ``None``).
+    """
+
+    field: str
+    message: str
+    pattern: re.Pattern | None = None
+    allowed_values: frozenset[str] | None = None
+    min_length: int | None = None
+    ignore_case: bool = False
+    when_field: str | None = None
+    when_equals: frozenset[str] | None = None
+
+    def failing_rows(self, columns: Mapping[str, list[str]]) -> list[int]:
+        values = columns[self.field]
+        rows: Iterable[int]
+        if self.when_field is None:
+            rows = (index for index, value in enumerate(values) if value)
+        elif self.when_equals is None:
+            rows = (
+                index for index, (value, other) in enumerate(zip(values, columns[self.when_field])) if value and other
+            )
         else:
-            comment = "All required fields present"
-            status = "Complete"
-
-        return ValidationRow(
-            review_id=review_id,
-            field_values=normalized_values,
-            missing_fields=missing_fields,
-            comment=comment,
-            status=status,
-        )
+            wanted = self.when_equals
+            rows = (
+                index
+                for index, (value, other) in enumerate(zip(values, columns[self.when_field]))
+                if value and other in wanted
+            )
+
+        if self.pattern is not None:
+            fullmatch = self.pattern.fullmatch
+            return [index for index in rows if fullmatch(values[index]) is None]
+        if self.allowed_values is not None:
+            allowed = self.allowed_values
+            if self.ignore_case:
+                return [index for index in rows if values[index].casefold() not in allowed]
+            return [index for index in rows if values[index] not in allowed]
+        if self.min_length is not None:
+            min_length = self.min_length
+            return [index for index in rows if len(values[index]) < min_length]
+        return []
+
+
+@dataclass(frozen=True)
+class ValidationRules:
+    """Rules compiled for one batch's selected fields."""
+
+    rules: tuple[CompiledRule, ...] = ()
+
+    @property
+    def condition_fields(self) -> list[str]:
+        """Fields the rule conditions read; they must be extracted even when not selected."""
+        return list(dict.fromkeys(rule.when_field for rule in self.rules if rule.when_field is not None))
+
+
+class ValidationService:
+    """Checks parsed review fields.
+
+    Every selected field is required: an empty value makes the review
+    Incomplete with a ``Missing: ...`` comment. Configured rules (regex
+    patterns, allowed values, minimum length, optionally conditional on
+    another field) are compiled once per batch with ``compile_rules`` and
+    ``validate_batch`` applies them column by column over all reviews.
+    """
+
+    def compile_rules(self, configs: Iterable[ValidationRuleConfig], selected_fields: Sequence[str]) -> ValidationRules:
+        selected = set(selected_fields)
+        compiled: list[CompiledRule] = []
+        for config in configs:
+            if config.field not in selected:
+                continue
+            condition = {}
+            if config.when is not None:
+                equals = config.when.equals
+                condition = {
+                    "when_field": config.when.field,
+                    "when_equals": None if equals is None else frozenset(value.strip() for value in equals),
+                }
+            if config.pattern is not None:
+                flags = re.IGNORECASE if config.ignore_case else 0
+                compiled.append(
+                    CompiledRule(
+                        field=config.field,
+                        message=config.message or f"{config.field} does not match the expected format",
+                        pattern=re.compile(config.pattern, flags),
+                        **condition,
+                    )
+                )
+            if config.allowed_values is not None:
+                values = [value.strip() for value in config.allowed_values]
+                compiled.append(
+                    CompiledRule(
+                        field=config.field,
+                        message=config.message or f"{config.field} must be one of: {', '.join(values)}",
+                        allowed_values=frozenset(value.casefold() if config.ignore_case else value for value in values),
+                        ignore_case=config.ignore_case,
+                        **condition,
+                    )
+                )
+            if config.min_length is not None:
+                compiled.append(
+                    CompiledRule(
+                        field=config.field,
+                        message=config.message or f"{config.field} is shorter than {config.min_length} characters",
+                        min_length=config.min_length,
+                        **condition,
+                    )
+                )
+        return ValidationRules(tuple(compiled))
+
+    def validate(
+        self,
+        review_id: str,
+        selected_fields: list[str],
+        parsed_fields: dict[str, str],
+        rules: ValidationRules | None = None,
+    ) -> ValidationRow:
+        return self.validate_batch([review_id], selected_fields, [parsed_fields], rules)[0]
+
+    def validate_batch(
+        self,
+        review_ids: Sequence[str],
+        selected_fields: list[str],
+        parsed_fields: Sequence[Mapping[str, str]],
+        rules: ValidationRules | None = None,
+    ) -> list[ValidationRow]:
+        rules = rules or ValidationRules()
+        names = list(dict.fromkeys([*selected_fields, *rules.condition_fields]))
+        columns = {name: [str(fields.get(name, "")).strip() for fields in parsed_fields] for name in names}
+
+        missing: dict[int, list[str]] = {}
+        for name in selected_fields:
+            for index in [index for index, value in enumerate(columns[name]) if not value]:
+                missing.setdefault(index, []).append(name)
+
+        failures: dict[int, list[str]] = {}
+        for rule in rules.rules:
+            if rule.field not in columns:
+                continue
+            for index in rule.failing_rows(columns):
+                messages = failures.setdefault(index, [])
+                if rule.message not in messages:
+                    messages.append(rule.message)
+
+        # Build every row as Complete first, then patch the few with problems;
+        # most reviews pass, so the per-row work stays allocation-only.
+        selected_columns = [columns[name] for name in selected_fields]
+        row_values = zip(*selected_columns) if selected_columns else [()] * len(review_ids)
+        rows = [
+            ValidationRow(review_id, dict(zip(selected_fields, values)), [], COMPLETE_COMMENT, "Complete", [])
+            for review_id, values in zip(review_ids, row_values)
+        ]
+        for index in sorted(missing.keys() | failures.keys()):
+            row = rows[index]
+            row.missing_fields = missing.get(index, [])
+            row.rule_failures = failures.get(index, [])
+            problems = [f"Missing: {', '.join(row.missing_fields)}"] if row.missing_fields else []
+            problems.extend(row.rule_failures)
+            row.comment = "; ".join(problems)
+            row.status = "Incomplete"
+        return rows
@@ -0,0 +1,74 @@
+﻿from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from threading import Lock, Thread
+from time import perf_counter
+from typing import Sequence
+
+from backend.utils.lazy import LazyService
+
+
+WARMUP_IDLE = "idle"
+WARMUP_RUNNING = "running"
+WARMUP_DONE = "done"
+WARMUP_FAILED = "failed"
+
+
+@dataclass
+class WarmupStatus:
+    state: str
+    built: list[str]
+    pending: list[str]
+    elapsed_ms: float | None
+    error: str | None
+
+
+class WarmupService:
+    """Builds the lazy services on a background thread.
+
+    Electron calls this once the health check answers, so pandas, openpyxl
+    and the parser libraries are imported while the user is still looking at
+    the first screen instead of on their first upload. Starting it again
+    while it runs or after it finished is a no-op.
+    """
+
+    def __init__(self, services: Sequence[LazyService]) -> None:
+        self._services = list(services)
+        self._lock = Lock()
+        self._state = WARMUP_IDLE
+        self._elapsed_ms: float | None = None
+        self._error: str | None = None
+        self._logger = logging.getLogger("collaborator")
+
+    def start(self) -> WarmupStatus:
+        with self._lock:
+            if self._state == WARMUP_IDLE:
+                self._state = WARMUP_RUNNING
+                Thread(target=self.run, name="service-warmup", daemon=True).start()
+        return self.status()
+
+    def run(self) -> None:
+        started = perf_counter()
+        try:
+            for service in self._services:
+                service.instance()
+        except Exception as exc:  # noqa: BLE001
+            self._logger.exception("Service warm-up failed.")
+            state, error = WARMUP_FAILED, str(exc)
+        else:
+            state, error = WARMUP_DONE, None
+        elapsed_ms = round((perf_counter() - started) * 1000, 3)
+        with self._lock:
+            self._state, self._error, self._elapsed_ms = state, error, elapsed_ms
+        self._logger.info("Service warm-up finished.", extra={"state": state, "elapsed_ms": elapsed_ms})
+
+    def status(self) -> WarmupStatus:
+        with self._lock:
+            return WarmupStatus(
+                state=self._state,
+                built=[service.service_name for service in self._services if service.is_built],
+                pending=[service.service_name for service in self._services if not service.is_built],
+                elapsed_ms=self._elapsed_ms,
+                error=self._error,
+            )
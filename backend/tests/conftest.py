@@ -0,0 +1,14 @@
+﻿import pytest
+
+from backend.repositories.extraction_plans import ExtractionPlanStore
+from backend.services import parse_engine
+from backend.services.parser_service import ParserService
+
+
+@pytest.fixture(autouse=True)
+def _isolated_extraction_plans(tmp_path, monkeypatch):
+    """Keep ParseEngine's parser off the shared plan file in backend/data.
+
+    Pool workers are forked after the patch, so they inherit the tmp store.
+    """
+    monkeypatch.setattr(parse_engine, "_parser", ParserService(plans=ExtractionPlanStore(tmp_path / "extraction_plans.json")))
@@ -0,0 +1,44 @@
+﻿from backend.benchmarks.bench_suite import compare
+from backend.benchmarks.synthetic import build_dump_frame, build_fixture_page, write_dump
+from backend.services.parser_service import ParserService
+from backend.utils.file_loader import load_table
+
+
+def test_synthetic_dump_keeps_duplicate_headers_and_blank_rate(tmp_path):
+    df = build_dump_frame(2_000, duplicate_columns=2, copies=3, blank_rate=0.25)
+
+    assert list(df.columns).count("Summary") == 3
+    assert list(df.columns).count("Review Info") == 3
+    assert (df["Issue Key"] != "").all()
+    blank_share = (df.drop(columns="Issue Key") == "").to_numpy().mean()
+    assert 0.2 < blank_share < 0.3
+
+    loaded = load_table(write_dump(df, tmp_path / "dump.csv"))
+    assert list(loaded.columns).count("Summary") == 1
+    assert len(loaded) == 2_000
+
+
+def test_synthetic_page_keeps_fixture_fields():
+    html = build_fixture_page("CR-7", target_kb=40, extra_fields=5)
+
+    fields = ParserService(plans=None).parse_review_html(html)
+    assert len(html) >= 40 * 1024
+    assert fields["Project"] == "Core Banking"
+    assert fields["Custom Field 5"] == "Value 5 for CR-7"
+
+
+def test_compare_reports_only_slowdowns_past_both_limits():
+    baseline = [
+        {"key": "load_table/10000-rows/csv", "min_seconds": 0.100},
+        {"key": "parse_review_html/fixture/lxml", "min_seconds": 0.0001},
+    ]
+    results = [
+        {"key": "load_table/10000-rows/csv", "min_seconds": 0.150},
+        {"key": "parse_review_html/fixture/lxml", "min_seconds": 0.0003},
+        {"key": "export/10000-rows/csv", "min_seconds": 0.5},
+    ]
+
+    regressions = compare(results, baseline, threshold=0.25, min_delta_seconds=0.005)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("load_table/10000-rows/csv")
@@ -1,5 +1,7 @@
 ﻿from pathlib import Path
 
+import pytest
+
 from backend.services.parser_service import ParserService
 
 
@@ -7,7 +9,7 @@ def test_parse_review_html_extracts_flexible_fields():
     fixture = Path(__file__).resolve().parent / "fixtures" / "collaborator_mock.html"
     html = fixture.read_text(encoding="utf-8")
 
-    parser = ParserService()
+    parser = ParserService(plans=None)
     fields = parser.parse_review_html(html)
 
     assert fields["Review Title"] == "Payments API Review"
@@ -16,3 +18,137 @@ def test_parse_review_html_extracts_flexible_fields():
     assert fields["Overview"] == "Validate transaction posting flow."
     assert fields["Participants"] == "Alice, Bob"
     assert fields["Defects"] == "None"
+
+
+TRICKY_HTML = """
+<html><head><title>Fallback title</title><style>.x { color: red }</style></head>
+<body>
+  <h1> </h1>
+  <table>
+    <tr><th>Role:</th><td>Author <script>track()</script></td><td><!-- hidden --> Lead</td></tr>
+    <tr><th>Role</th><td>Reviewer</td></tr>
+    <tr><td>Only one cell</td></tr>
+  </table>
+  <dl><dt>Participants</dt><dt>Defects</dt><dd>Alice &amp; Bob</dd></dl>
+  <h3>Notes:</h3>
+  <!-- skipped -->
+  <p>First</p><p> </p><div>Second <b>bold</b></div><p>3</p><p>4</p><p>5 is too far</p>
+  <h4>Role</h4><p>Section wins</p>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize("html_source", ["fixture", "tricky"])
+def test_lxml_engine_matches_soup_engine(html_source):
+    pytest.importorskip("lxml")
+    if html_source == "fixture":
+        html = (Path(__file__).resolve().parent / "fixtures" / "collaborator_mock.html").read_text(encoding="utf-8")
+    else:
+        html = TRICKY_HTML
+
+    soup_fields = ParserService(engine="bs4", plans=None).parse_review_html(html)
+    lxml_fields = ParserService(engine="lxml", plans=None).parse_review_html(html)
+
+    assert lxml_fields == soup_fields
+    if html_source == "tricky":
+        assert soup_fields["Review Title"] == "Fallback title"
+        assert soup_fields["Role"] == "Section wins"
+        assert soup_fields["Participants"] == "Alice & Bob"
+        assert soup_fields["Notes"] == "First Second bold 3 4"
+
+
+@pytest.mark.parametrize("engine", ["bs4", "lxml"])
+@pytest.mark.parametrize("html_source", ["fixture", "tricky"])
+def test_selected_fields_and_discovery_match_full_parse(engine, html_source, tmp_path):
+    if engine == "lxml":
+        pytest.importorskip("lxml")
+    if html_source == "fixture":
+        html = (Path(__file__).resolve().parent / "fixtures" / "collaborator_mock.html").read_text(encoding="utf-8")
+    else:
+        html = TRICKY_HTML
+
+    from backend.repositories.extraction_plans import ExtractionPlanStore
+
+    parser = ParserService(engine=engine, plans=ExtractionPlanStore(tmp_path / "plans.json"))
+    full = parser.parse_review_html(html)
+    selected = ["Role", "Review Title", "Notes", "Participants", "Unknown field"]
+
+    assert parser.parse_review_html(html, selected) == {key: full[key] for key in selected if key in full}
+    assert parser.discover_fields(html) == list(full)
+
+    parsed = parser.parse_selected_fields(html, selected)
+    assert parsed.fields == {key: full[key] for key in selected if key in full}
+    assert parsed.available_fields == list(full)
+
+
+def _template_page(title, role, extra_rows=0):
+    rows = "".join(f"<tr><th>Item {index}</th><td>value {index}</td></tr>" for index in range(extra_rows))
+    return f"""
+    <html><body><div id="main">
+      <h1>{title}</h1>
+      <table class="meta">{rows}<tr><th>Role</th><td>{role}</td></tr><tr><th>Project</th><td>Core</td></tr></table>
+      <h3>Overview</h3><p>Overview of {title}</p>
+    </div></body></html>
+    """
+
+
+def test_extraction_plans_are_learned_reused_and_persisted(tmp_path):
+    pytest.importorskip("lxml")
+    from backend.repositories.extraction_plans import ExtractionPlanStore
+
+    plans_path = tmp_path / "plans.json"
+    parser = ParserService(engine="lxml", plans=ExtractionPlanStore(plans_path))
+    reference = ParserService(engine="lxml", plans=None)
+    selected = ["Review Title", "Role", "Overview", "Absent"]
+
+    first = parser.parse_selected_fields(_template_page("First", "Author"), selected)
+    assert (first.plan_hits, first.plan_fallbacks) == (0, 4)
+
+    # Same template, different values: everything but the absent field comes from the plan.
+    html = _template_page("Second", "Reviewer")
+    second = ParserService(engine="lxml", plans=ExtractionPlanStore(plans_path)).parse_selected_fields(html, selected)
+    assert second.fields == reference.parse_selected_fields(html, selected).fields
+    assert second.fields["Role"] == "Reviewer"
+    assert (second.plan_hits, second.plan_fallbacks) == (3, 1)
+
+    # Extra rows keep the fingerprint but move the Role row, so that step misses and is relearned.
+    html = _template_page("Third", "Moderator", extra_rows=3)
+    third = parser.parse_selected_fields(html, selected)
+    assert third.fields == reference.parse_selected_fields(html, selected).fields
+    assert (third.plan_hits, third.plan_fallbacks) == (2, 2)
+    assert parser.parse_selected_fields(_template_page("Fourth", "Author", extra_rows=3), selected).plan_hits == 3
+
+    assert ExtractionPlanStore(plans_path).stats().templates == 1
+    assert ExtractionPlanStore(plans_path).clear() == 1
+    assert not plans_path.exists()
+
+
+@pytest.mark.parametrize(
+    "notes",
+    ["<h2>Status</h2><p>Closed in section</p>", "<dl><dt>Status</dt><dd>Closed in list</dd></dl>"],
+)
+def test_extraction_plan_defers_to_higher_precedence_sources(tmp_path, notes):
+    pytest.importorskip("lxml")
+    from backend.repositories.extraction_plans import ExtractionPlanStore
+
+    def page(inner):
+        # The notes sit below the fingerprint depth, so both pages share a template.
+        return f"""
+        <html><body><div id="main">
+          <h1>Status page</h1>
+          <table class="meta"><tr><th>Role</th><td>Author</td></tr><tr><th>Status</th><td>Open</td></tr></table>
+          <div class="notes"><div class="inner">{inner}</div></div>
+        </div></body></html>
+        """
+
+    parser = ParserService(engine="lxml", plans=ExtractionPlanStore(tmp_path / "plans.json"))
+    reference = ParserService(engine="lxml", plans=None)
+    selected = ["Role", "Status"]
+    parser.parse_selected_fields(page(""), selected)
+
+    html = page(notes)
+    planned = parser.parse_selected_fields(html, selected)
+
+    assert planned.fields == reference.parse_selected_fields(html, selected).fields
+    assert planned.fields["Status"].startswith("Closed")
+    assert (planned.plan_hits, planned.plan_fallbacks) == (1, 1)
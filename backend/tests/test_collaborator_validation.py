@@ -1,4 +1,8 @@
-﻿from backend.services.validation_service import ValidationService
+﻿import pytest
+from pydantic import ValidationError
+
+from backend.services.config_service import ValidationRuleConfig
+from backend.services.validation_service import ValidationService
 
 
 def test_validation_incomplete_when_required_field_missing():
@@ -25,3 +29,65 @@ def test_validation_complete_when_all_fields_present():
     assert row.status == "Complete"
     assert row.missing_fields == []
     assert row.comment == "All required fields present"
+
+
+def _rules(service, selected_fields, rules):
+    return service.compile_rules([ValidationRuleConfig.model_validate(rule) for rule in rules], selected_fields)
+
+
+def test_batch_validation_matches_single_review_validation_for_default_rule():
+    service = ValidationService()
+    selected = ["Role", "Overview"]
+    parsed = [{"Role": "Author", "Overview": " Filled "}, {"Role": ""}, {}, {"Role": "x", "Overview": "y", "Other": ""}]
+    review_ids = [f"CR-{index}" for index in range(len(parsed))]
+
+    rows = service.validate_batch(review_ids, selected, parsed)
+
+    assert rows == [service.validate(review_id, selected, fields) for review_id, fields in zip(review_ids, parsed)]
+    assert [row.comment for row in rows] == [
+        "All required fields present",
+        "Missing: Role, Overview",
+        "Missing: Role, Overview",
+        "All required fields present",
+    ]
+    assert rows[0].field_values == {"Role": "Author", "Overview": "Filled"}
+
+
+def test_configured_rules_mark_reviews_incomplete():
+    service = ValidationService()
+    selected = ["Review ID", "Role", "Overview", "Defects"]
+    rules = _rules(
+        service,
+        selected,
+        [
+            {"field": "Review ID", "pattern": r"CR-\d+"},
+            {"field": "Role", "allowedValues": ["Author", "Reviewer"], "ignoreCase": True},
+            {"field": "Overview", "minLength": 10, "message": "Overview is too short"},
+            {"field": "Defects", "pattern": "None", "when": {"field": "Status", "equals": ["Closed"]}},
+            {"field": "Not selected", "minLength": 100},
+        ],
+    )
+    parsed = [
+        {"Review ID": "CR-1", "Role": "author", "Overview": "A long overview", "Defects": "None", "Status": "Closed"},
+        {"Review ID": "1", "Role": "Lead", "Overview": "Short", "Defects": "2 open", "Status": "Closed"},
+        {"Review ID": "CR-3", "Role": "Reviewer", "Overview": "", "Defects": "2 open", "Status": "Open"},
+    ]
+
+    rows = service.validate_batch(["a", "b", "c"], selected, parsed, rules)
+
+    assert rules.condition_fields == ["Status"]
+    assert rows[0].status == "Complete"
+    assert rows[0].field_values == {field: parsed[0][field] for field in selected}
+    assert rows[1].status == "Incomplete"
+    assert rows[1].missing_fields == []
+    assert rows[1].comment == (
+        "Review ID does not match the expected format; Role must be one of: Author, Reviewer; "
+        "Overview is too short; Defects does not match the expected format"
+    )
+    assert rows[2].comment == "Missing: Overview"
+    assert rows[2].rule_failures == []
+
+
+def test_invalid_rule_pattern_is_rejected():
+    with pytest.raises(ValidationError):
+        ValidationRuleConfig.model_validate({"field": "Role", "pattern": "("})
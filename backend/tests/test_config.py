@@ -0,0 +1,14 @@
+﻿from backend import config
+
+
+def test_env_int_falls_back_on_bad_values(monkeypatch, caplog):
+    monkeypatch.setenv("REVIEWPACKETS_TEST_INT", "4")
+    assert config._env_int("REVIEWPACKETS_TEST_INT", 0) == 4
+
+    for value in ("four", "-1", "2.5"):
+        monkeypatch.setenv("REVIEWPACKETS_TEST_INT", value)
+        assert config._env_int("REVIEWPACKETS_TEST_INT", 7) == 7
+    assert "REVIEWPACKETS_TEST_INT" in caplog.text
+
+    monkeypatch.delenv("REVIEWPACKETS_TEST_INT")
+    assert config._env_int("REVIEWPACKETS_TEST_INT", 7) == 7
@@ -0,0 +1,60 @@
+﻿import json
+import os
+
+import pytest
+
+from backend.services.config_service import DEFAULT_COLLABORATOR_CONFIG, ConfigService, ReviewUrlBuilder
+
+
+def _write_config(path, base_url, template="/review/{reviewId}", mtime_ns=None):
+    path.write_text(json.dumps({"baseUrl": base_url, "reviewPathTemplate": template}), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_config_is_cached_until_the_file_changes(tmp_path):
+    path = tmp_path / "collaborator_config.json"
+    _write_config(path, "https://one.example", mtime_ns=1_000_000_000)
+    service = ConfigService(path)
+
+    first = service.get_collaborator_config()
+    for _ in range(50):
+        assert service.get_collaborator_config() is first
+    assert service.stats().loads == 1
+
+    _write_config(path, "https://two.example", mtime_ns=2_000_000_000)
+    assert service.get_collaborator_config().base_url == "https://two.example"
+
+    os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+    service.get_collaborator_config()
+
+    stats = service.stats()
+    assert stats.source == str(path)
+    assert (stats.loads, stats.reloads, stats.unchanged, stats.failures) == (2, 1, 1, 0)
+
+
+def test_invalid_config_falls_back_to_defaults(tmp_path):
+    path = tmp_path / "collaborator_config.json"
+    _write_config(path, "https://one.example", template="/review/{id}")
+    service = ConfigService(path)
+
+    assert service.get_collaborator_config() is DEFAULT_COLLABORATOR_CONFIG
+    assert service.stats().failures == 1
+    assert service.stats().source is None
+
+
+@pytest.mark.parametrize(
+    "template",
+    ["/review/{reviewId}", "/ui#review:id={reviewId}&tab={{files}}", "/r/{reviewId}/x/{reviewId}", "/r/{reviewId:>6}"],
+)
+def test_url_builder_matches_str_format(template):
+    builder = ReviewUrlBuilder("https://collab.example/", template)
+    review_ids = ["CR-1", " 42 ", "", "  "]
+
+    urls = builder.build_many(review_ids)
+
+    assert urls == {
+        review_id: "https://collab.example" + template.format(reviewId=review_id.strip())
+        for review_id in review_ids
+        if review_id.strip()
+    }
@@ -0,0 +1,31 @@
+﻿import pandas as pd
+
+from backend.repositories.data_store import DataStore
+
+
+def test_publish_creates_new_versioned_snapshot():
+    store = DataStore()
+    first_df = pd.DataFrame({"Issue Key": ["ABC-1"]})
+    second_df = pd.DataFrame({"Issue Key": ["ABC-2"]})
+
+    first = store.publish(dump_df=first_df)
+    keys = store.publish(issue_keys=["ABC-1"])
+    second = store.publish(dump_df=second_df)
+
+    assert first.version < keys.version < second.version
+    assert keys.dump_version == first.version
+    assert keys.dump_df is first_df
+    assert first.issue_keys == ()
+    assert store.snapshot() is second
+    assert second.issue_keys == ("ABC-1",)
+
+
+def test_held_snapshot_is_not_affected_by_later_publish():
+    store = DataStore()
+    store.dump_df = pd.DataFrame({"Issue Key": ["ABC-1"]})
+    held = store.snapshot()
+
+    store.dump_df = pd.DataFrame({"Issue Key": ["ABC-9"]})
+
+    assert held.dump_df["Issue Key"].tolist() == ["ABC-1"]
+    assert store.dump_df["Issue Key"].tolist() == ["ABC-9"]
@@ -0,0 +1,51 @@
+﻿import os
+
+import pandas as pd
+
+from backend.repositories.disk_cache import DiskCache
+from backend.repositories.dump_cache import DumpCache
+from backend.repositories.parse_cache import ParseCache
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=25, suffix=".bin")
+    cache.put_bytes("a", b"x" * 10)
+    cache.put_bytes("b", b"y" * 10)
+    os.utime(tmp_path / "a.bin", (1, 1))
+    os.utime(tmp_path / "b.bin", (2, 2))
+
+    cache.put_bytes("c", b"z" * 10)
+
+    assert cache.get_bytes("a") is None
+    assert cache.get_bytes("b") == b"y" * 10
+    assert cache.get_bytes("c") == b"z" * 10
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.hits == 2
+    assert stats.misses == 1
+
+
+def test_dump_cache_round_trip_and_clear(tmp_path):
+    cache = DumpCache(DiskCache(tmp_path, max_bytes=10_000_000, suffix=".pkl"))
+    df = pd.DataFrame({"Issue Key": ["ABC-1"], "Summary": ["One"]})
+
+    assert cache.get("abc123", ".xlsx") is None
+    cache.put("abc123", ".xlsx", df)
+
+    assert cache.get("abc123", ".csv") is None
+    pd.testing.assert_frame_equal(cache.get("abc123", ".xlsx"), df)
+    assert cache.disk.clear() == 1
+    assert cache.get("abc123", ".xlsx") is None
+
+
+def test_parse_cache_round_trip_and_drops_corrupt_entries(tmp_path):
+    cache = ParseCache(DiskCache(tmp_path, max_bytes=1_000_000, suffix=".json.z"))
+    key = cache.key_for("<h1>Review</h1>", "lxml.1")
+    assert key != cache.key_for("<h1>Review</h1>", "lxml.2")
+
+    cache.put(key, {"Owner": "Zoë"}, ["Review Title", "Owner"])
+    assert cache.get(key) == ({"Owner": "Zoë"}, ["Review Title", "Owner"])
+
+    (tmp_path / f"{key}.json.z").write_bytes(b"not zlib")
+    assert cache.get(key) is None
+    assert cache.disk.stats().entries == 0
@@ -0,0 +1,39 @@
+﻿import io
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from backend.services.export_service import ExportService
+
+
+def test_csv_stream_sends_header_first_and_batches_rows():
+    service = ExportService()
+    rows = (["ABC-%d" % index, "x"] for index in range(5))
+
+    chunks = list(service.iter_csv(["Issue Key", "Summary"], rows, batch_rows=2))
+
+    assert chunks[0] == b"Issue Key,Summary\n"
+    assert len(chunks) == 4
+    assert b"".join(chunks).decode("utf-8").count("\n") == 6
+
+
+def test_csv_stream_quote_all_and_frame_rows_match_to_csv():
+    service = ExportService()
+    df = pd.DataFrame([["ABC-1", 'say "hi", ok'], ["ABC-2", None]], columns=["Issue Key", "Comment"])
+
+    minimal = b"".join(service.iter_csv(list(df.columns), service.frame_rows(df))).decode("utf-8")
+    quoted = b"".join(service.iter_csv(["Review ID"], [['A"1']], quote_all=True)).decode("utf-8")
+
+    assert minimal == df.to_csv(index=False, lineterminator="\n")
+    assert quoted == '"Review ID"\n"A""1"\n'
+
+
+def test_xlsx_stream_keeps_formula_like_values_as_text():
+    service = ExportService()
+
+    content = b"".join(service.stream(["Issue Key", "Note"], [["ABC-1", "=SUM(A1:A2)"]], export_format="xlsx"))
+
+    sheet = load_workbook(io.BytesIO(content)).active
+    assert [cell.value for cell in sheet[1]] == ["Issue Key", "Note"]
+    assert sheet["B2"].value == "=SUM(A1:A2)"
+    assert sheet["B2"].data_type == "s"
@@ -0,0 +1,202 @@
+﻿import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Event, Lock, Thread
+from time import perf_counter, sleep
+
+import pytest
+
+from backend.services.config_service import ConfigService
+from backend.services.fetch_service import FetchService, ReviewFetcher
+from backend.services.parse_engine import ParseEngine
+from backend.utils.http_client import HttpFetchError, PooledHttpClient
+
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "collaborator_mock.html"
+
+
+class _ReviewServer(ThreadingHTTPServer):
+    """Stand-in Collaborator server serving the fixture page at /review/<id>."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _ReviewHandler)
+        self.page = FIXTURE.read_bytes()
+        self.lock = Lock()
+        self.requests = []
+        self.connections = 0
+        self.flaky = {}
+        self.delay_seconds = {}
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _ReviewHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            failures_left = server.flaky.get(self.path, 0)
+            if failures_left:
+                server.flaky[self.path] = failures_left - 1
+            delay = server.delay_seconds.get(self.path, 0)
+        sleep(delay)
+
+        if self.headers.get("Cookie") != "session=abc; token=xyz":
+            self._reply(401, b"login required")
+        elif failures_left:
+            self._reply(503, b"busy")
+        elif self.path == "/review/missing":
+            self._reply(404, b"not found")
+        else:
+            self._reply(200, server.page)
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    server = _ReviewServer()
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _config_service(tmp_path, base_url, batch_size=4):
+    path = tmp_path / "collaborator_config.json"
+    path.write_text(
+        json.dumps(
+            {
+                "baseUrl": base_url,
+                "reviewPathTemplate": "/review/{reviewId}",
+                "requestTimeoutSeconds": 5,
+                "maxRetries": 2,
+                "batchSize": batch_size,
+                "retryBackoffSeconds": 0.01,
+            }
+        ),
+        encoding="utf-8",
+    )
+    return ConfigService(path)
+
+
+def test_client_reuses_connections_and_retries_busy_responses(server):
+    server.flaky["/review/1"] = 2
+    headers = {"Cookie": "session=abc; token=xyz"}
+    with PooledHttpClient(5, max_retries=2, max_connections=1, backoff_seconds=0, headers=headers) as client:
+        first = client.get(f"{server.base_url}/review/1")
+        second = client.get(f"{server.base_url}/review/2")
+        stats = client.stats()
+
+    assert first.status == second.status == 200
+    assert first.attempts == 3
+    assert second.text() == server.page.decode("utf-8")
+    assert stats.retries == 2
+    assert stats.connections_opened == 1
+    assert server.connections == 1
+
+
+def test_client_does_not_retry_client_errors(server):
+    client = PooledHttpClient(5, max_retries=3, max_connections=1, backoff_seconds=0)
+    with pytest.raises(HttpFetchError) as excinfo:
+        client.get(f"{server.base_url}/review/1")
+    client.close()
+
+    assert excinfo.value.status == 401
+    assert len(server.requests) == 1
+
+
+def test_fetch_service_parses_pages_as_they_arrive(server, tmp_path):
+    server.flaky["/review/CR-2"] = 1
+    review_ids = ["CR-1", "CR-2", "missing", "CR-3", "CR-4", "CR-5"]
+    review_urls = {review_id: f"{server.base_url}/review/{review_id}" for review_id in review_ids}
+    service = FetchService(ParseEngine(max_workers=1, use_cache=False), _config_service(tmp_path, server.base_url))
+
+    results = dict(service.iter_outcomes(review_urls, ["Role", "Missing"], {"session": "abc", "token": "xyz"}))
+
+    assert sorted(results) == list(range(len(review_ids)))
+    assert [results[position].review_id for position in sorted(results)] == review_ids
+    missing = results[2]
+    assert missing.row.status == "Incomplete"
+    assert missing.row.comment.startswith("Failed to fetch review page:")
+    assert "404" in missing.error
+    fetched = [outcome for position, outcome in results.items() if position != 2]
+    assert all(outcome.error is None and outcome.available_fields for outcome in fetched)
+    assert server.requests.count("/review/CR-2") == 2
+    assert server.connections <= 4
+
+
+def test_fetch_service_fails_malformed_urls_per_page(server, tmp_path):
+    review_urls = {
+        "CR-1": f"{server.base_url}/review/CR-1",
+        "bad-port": "http://127.0.0.1:notaport/review/bad-port",
+        "CR-2": f"{server.base_url}/review/CR-2",
+    }
+    service = FetchService(ParseEngine(max_workers=1, use_cache=False), _config_service(tmp_path, server.base_url))
+
+    results = dict(service.iter_outcomes(review_urls, ["Role"], {"session": "abc", "token": "xyz"}))
+
+    assert sorted(results) == [0, 1, 2]
+    assert results[1].row.status == "Incomplete"
+    assert results[1].row.comment.startswith("Failed to fetch review page:")
+    assert results[0].error is None and results[2].error is None
+
+
+def test_fetch_service_fails_rejected_cookie_values_per_page(server, tmp_path):
+    review_urls = {"CR-1": f"{server.base_url}/review/CR-1"}
+    service = FetchService(ParseEngine(max_workers=1, use_cache=False), _config_service(tmp_path, server.base_url))
+
+    results = dict(service.iter_outcomes(review_urls, ["Role"], {"session": "abc\r\nX-Injected: 1"}))
+
+    assert results[0].row.status == "Incomplete"
+    assert server.requests == []
+
+
+def test_fetcher_returns_promptly_when_cancelled(server):
+    server.delay_seconds.update({"/review/slow-1": 3, "/review/slow-2": 3})
+    review_urls = {review_id: f"{server.base_url}/review/{review_id}" for review_id in ["CR-1", "slow-1", "slow-2", "CR-4"]}
+    fetcher = ReviewFetcher(PooledHttpClient(5, 0, 3, headers={"Cookie": "session=abc; token=xyz"}), concurrency=3)
+    cancelled = Event()
+
+    pages = fetcher.iter_pages(review_urls, cancelled)
+    first = next(pages)
+    cancelled.set()
+    started = perf_counter()
+    rest = list(pages)
+    fetcher.client.close()
+
+    assert first.review_id == "CR-1"
+    assert rest == []
+    assert perf_counter() - started < 1
+    assert "/review/CR-4" not in server.requests
+
+
+def test_fetch_service_rejects_fragment_review_urls(tmp_path):
+    service = FetchService(ParseEngine(max_workers=1, use_cache=False), _config_service(tmp_path, "http://127.0.0.1:1"))
+    review_urls = {"CR-1": "https://collaborator.example.com/ui#review:id=CR-1"}
+
+    with pytest.raises(ValueError, match="server-rendered"):
+        service.check_review_urls(review_urls)
+    with pytest.raises(ValueError, match="server-rendered"):
+        next(service.iter_outcomes(review_urls, ["Role"], {"session": "abc"}))
+    service.check_review_urls({"CR-1": "https://collaborator.example.com/review/CR-1"})
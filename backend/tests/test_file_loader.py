@@ -0,0 +1,63 @@
+﻿import datetime
+
+import pandas as pd
+from openpyxl import Workbook
+
+from backend.utils.excel_stream import read_xlsx_streaming
+from backend.utils.file_loader import load_table
+
+
+def _write_workbook(path, rows):
+    workbook = Workbook()
+    sheet = workbook.active
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+def test_streaming_reader_matches_read_excel(tmp_path):
+    path = tmp_path / "dump.xlsx"
+    _write_workbook(
+        path,
+        [
+            ["Issue Key", "Summary", None, "Summary", 5],
+            ["ABC-1", "One", None, "Uno", 1.0],
+            [],
+            ["ABC-2", 2.5, True, datetime.datetime(2024, 1, 2), None, None, "extra"],
+            ["#N/A", "=1+1"],
+            [],
+        ],
+    )
+
+    expected = pd.read_excel(path, dtype=str, keep_default_na=False, engine="openpyxl").fillna("")
+    streamed = read_xlsx_streaming(path, chunk_rows=2)
+
+    assert list(streamed.columns) == list(expected.columns)
+    assert streamed.values.tolist() == expected.values.tolist()
+
+
+def test_streaming_reader_reports_progress(tmp_path):
+    path = tmp_path / "dump.xlsx"
+    _write_workbook(path, [["Issue Key"], ["ABC-1"], ["ABC-2"], ["ABC-3"]])
+    calls = []
+
+    df = read_xlsx_streaming(path, progress=lambda rows, rate: calls.append(rows))
+
+    assert len(df) == 3
+    assert calls[-1] == 3
+
+
+def test_load_table_streaming_merges_duplicates(tmp_path):
+    path = tmp_path / "dump.xlsx"
+    _write_workbook(
+        path,
+        [
+            ["Issue Key", "Review Info", "Review Info"],
+            ["ABC-1", "", "Extra"],
+        ],
+    )
+
+    df = load_table(path, streaming=True)
+    assert df.loc[0, "Issue Key"] == "ABC-1"
+    assert list(df.columns).count("Review Info") == 1
+    assert df.loc[0, "Review Info"] == "Extra"
@@ -0,0 +1,24 @@
+﻿from backend.utils.headers import HeaderIndex
+
+
+def test_header_index_is_case_insensitive_and_first_match_wins():
+    index = HeaderIndex([" Summary ", "summary", "Review Info"])
+
+    assert index.find("SUMMARY") == " Summary "
+    assert index.find("review info ") == "Review Info"
+    assert index.find("Solution") is None
+
+
+def test_header_index_resolves_issue_key_aliases_in_batch():
+    index = HeaderIndex(["Key", "Summary"])
+
+    resolved = index.find_many(["Issue Key", "issue key", "Summary", "Priority"])
+
+    assert resolved == {"Issue Key": "Key", "issue key": "Key", "Summary": "Summary", "Priority": None}
+
+
+def test_header_index_prefers_exact_name_over_alias():
+    index = HeaderIndex(["Key", "Issue key"])
+
+    assert index.find("Issue Key") == "Issue key"
+    assert index.find("Key") == "Key"
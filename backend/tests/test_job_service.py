@@ -0,0 +1,81 @@
+﻿from pathlib import Path
+from threading import Event
+
+import pytest
+
+from backend.services.job_service import JOB_CANCELLED, JOB_COMPLETED, JobNotFoundError, JobService
+from backend.services.parse_engine import ParseEngine
+
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "collaborator_mock.html"
+
+
+class _GatedReviews(list):
+    """Hands out the first review, then blocks until the gate opens."""
+
+    def __init__(self, reviews, gate):
+        super().__init__(reviews)
+        self._gate = gate
+
+    def __iter__(self):
+        for index, review in enumerate(list.__iter__(self)):
+            if index == 1:
+                self._gate.wait(5)
+            yield review
+
+
+def _wait_until_finished(service, job_id):
+    for _ in service.iter_results(job_id, poll_seconds=0.05):
+        pass
+    return service.get(job_id)
+
+
+def test_job_streams_results_and_keeps_them_in_input_order():
+    html = FIXTURE.read_text(encoding="utf-8")
+    service = JobService(ParseEngine(max_workers=1, use_cache=False))
+    try:
+        job = service.submit([(f"CR-{index}", html) for index in range(4)], ["Role", "Missing"])
+        streamed = [item for item in service.iter_results(job.job_id, poll_seconds=0.05) if item is not None]
+
+        assert sorted(position for position, _ in streamed) == [0, 1, 2, 3]
+        assert job.status == JOB_COMPLETED
+        assert [outcome.review_id for outcome in job.outcomes()] == ["CR-0", "CR-1", "CR-2", "CR-3"]
+        progress = job.progress()
+        assert (progress.completed, progress.incomplete, progress.total) == (4, 4, 4)
+        assert progress.avg_review_ms > 0
+    finally:
+        service.shutdown()
+
+
+def test_job_cancellation_stops_remaining_reviews():
+    html = FIXTURE.read_text(encoding="utf-8")
+    gate = Event()
+    service = JobService(ParseEngine(max_workers=1, use_cache=False))
+    try:
+        job = service.submit(_GatedReviews([(f"CR-{index}", html) for index in range(5)], gate), ["Role"])
+        first = next(item for item in service.iter_results(job.job_id, poll_seconds=0.05) if item is not None)
+        service.cancel(job.job_id)
+        gate.set()
+        job = _wait_until_finished(service, job.job_id)
+
+        assert first[0] == 0
+        assert job.status == JOB_CANCELLED
+        assert job.progress().completed < 5
+    finally:
+        service.shutdown()
+
+
+def test_finished_jobs_beyond_the_retention_limit_are_dropped():
+    html = FIXTURE.read_text(encoding="utf-8")
+    service = JobService(ParseEngine(max_workers=1, use_cache=False), max_retained=1)
+    try:
+        first = service.submit([("CR-1", html)], ["Role"])
+        _wait_until_finished(service, first.job_id)
+        second = service.submit([("CR-2", html)], ["Role"])
+        _wait_until_finished(service, second.job_id)
+
+        assert [job.job_id for job in service.list_jobs()] == [second.job_id]
+        with pytest.raises(JobNotFoundError):
+            service.get(first.job_id)
+    finally:
+        service.shutdown()
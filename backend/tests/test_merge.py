@@ -23,3 +23,21 @@ def test_merge_duplicate_columns_concat():
     df = pd.DataFrame(data, columns=columns)
     merged = merge_duplicate_columns(df)
     assert merged.loc[0, "Solution"] in ("A | B", "B | A")
+
+
+def test_vectorized_merge_matches_python_engine():
+    data = [
+        ["ABC-1", "A", "A", "", None],
+        ["ABC-2", " ab ", "b", "ab", "c"],
+        ["ABC-3", "", "", float("nan"), ""],
+        ["ABC-4", None, "x", "x", "y"],
+        ["ABC-5", 7, "7", 1.5, pd.NA],
+    ]
+    columns = ["Issue Key", "Solution", "Solution.1", "Solution.2", "Solution.3"]
+    df = pd.DataFrame(data, columns=columns)
+
+    expected = merge_duplicate_columns(df, engine="python")
+    actual = merge_duplicate_columns(df, engine="vectorized")
+
+    assert list(actual.columns) == list(expected.columns) == ["Issue Key", "Solution"]
+    assert actual["Solution"].tolist() == expected["Solution"].tolist()
@@ -0,0 +1,48 @@
+﻿import logging
+
+import pytest
+
+from backend.utils.logger import ExtraFormatter
+from backend.utils.metrics import MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("stage_seconds", "Stage time.", labelnames=("stage",), buckets=(0.1, 1))
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.observe(value, stage="load")
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE stage_seconds histogram" in lines
+    assert 'stage_seconds_bucket{stage="load",le="0.1"} 2' in lines
+    assert 'stage_seconds_bucket{stage="load",le="1.0"} 3' in lines
+    assert 'stage_seconds_bucket{stage="load",le="+Inf"} 4' in lines
+    assert 'stage_seconds_sum{stage="load"} 3.65' in lines
+    assert 'stage_seconds_count{stage="load"} 4' in lines
+
+
+def test_counters_require_their_labels_and_escape_values():
+    registry = MetricsRegistry()
+    counter = registry.counter("rows_total", "Rows.", labelnames=("stage",))
+    counter.inc(10, stage='say "hi"')
+    registry.gauge("memory_bytes", "Memory.", lambda: None)
+
+    with pytest.raises(ValueError):
+        counter.inc(stage="load", extra="x")
+    with pytest.raises(ValueError):
+        registry.counter("rows_total", "Again.")
+
+    rendered = registry.render()
+    assert 'rows_total{stage="say \\"hi\\""} 10' in rendered
+    assert not [line for line in rendered.splitlines() if line.startswith("memory_bytes")]
+
+
+def test_log_formatter_appends_extra_fields():
+    formatter = ExtraFormatter("%(levelname)s | %(message)s")
+    record = logging.LogRecord("collaborator", logging.INFO, __file__, 1, "Done.", (), None)
+    record.reviews = 3
+    plain = logging.LogRecord("collaborator", logging.INFO, __file__, 1, "Plain %s", ("text",), None)
+
+    assert formatter.format(record) == 'INFO | Done. | {"reviews": 3}'
+    assert formatter.format(plain) == "INFO | Plain text"
@@ -0,0 +1,107 @@
+﻿import asyncio
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from backend.services.ingest_service import IngestService
+from backend.services.parse_engine import ParseEngine
+from backend.utils import ndjson as ndjson_module
+from backend.utils.ndjson import NdjsonDecodeError, NdjsonDecoder, UnsupportedEncodingError
+
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "collaborator_mock.html"
+
+
+def _ndjson(records):
+    return "".join(json.dumps(record) + "\n" for record in records).encode("utf-8")
+
+
+def _decode(decoder, body, chunk_size=7):
+    records = []
+    for start in range(0, len(body), chunk_size):
+        records.extend(decoder.feed(body[start : start + chunk_size]))
+    records.extend(decoder.close())
+    return records
+
+
+def test_decoder_handles_split_lines_and_concatenated_gzip_members():
+    records = [{"review_id": f"CR-{index}", "html": "<p>é</p>" * index} for index in range(5)]
+    body = _ndjson(records)
+
+    assert _decode(NdjsonDecoder("identity"), body.rstrip(b"\n")) == records
+    assert _decode(NdjsonDecoder("gzip"), gzip.compress(body[:30]) + gzip.compress(body[30:])) == records
+
+
+def test_decoder_reads_zstd_bodies():
+    zstandard = pytest.importorskip("zstandard")
+    records = [{"review_id": "CR-1", "html": "<h1>Review</h1>"}]
+
+    body = zstandard.ZstdCompressor().compress(_ndjson(records))
+
+    assert _decode(NdjsonDecoder("zstd"), body) == records
+
+
+def test_decoder_bounds_zstd_output_per_step(monkeypatch):
+    zstandard = pytest.importorskip("zstandard")
+    monkeypatch.setattr(ndjson_module, "ZSTD_MAX_STEP_OUTPUT_BYTES", 4 * 1024 * 1024)
+    records = [{"review_id": f"CR-{index}", "html": "<td>same</td>" * 2000} for index in range(200)]
+    body = zstandard.ZstdCompressor().compress(_ndjson(records))
+    decoder = NdjsonDecoder("zstd")
+
+    # A highly compressible body is inflated in small steps instead of at once.
+    decoded = []
+    largest_buffer = 0
+    for record in decoder.feed(body):
+        decoded.append(record)
+        largest_buffer = max(largest_buffer, len(decoder._buffer))
+    assert decoded + decoder.close() == records
+    assert largest_buffer < 2 * ndjson_module.DECOMPRESS_STEP_BYTES
+
+    bomb = zstandard.ZstdCompressor().compress(b" " * (64 * 1024 * 1024))
+    with pytest.raises(NdjsonDecodeError, match="expands"):
+        _decode(NdjsonDecoder("zstd"), bomb, chunk_size=len(bomb))
+
+
+def test_decoder_rejects_truncated_zstd_bodies():
+    zstandard = pytest.importorskip("zstandard")
+    records = [{"review_id": f"CR-{index}", "html": f"<p>{index}</p>" * 500} for index in range(40)]
+    body = _ndjson(records)
+    skippable = (0x184D2A5E).to_bytes(4, "little") + (3).to_bytes(4, "little") + b"abc"
+    frames = (
+        skippable
+        + zstandard.ZstdCompressor(write_checksum=True).compress(body[:1000])
+        + zstandard.ZstdCompressor(level=1).compress(body[1000:])
+    )
+    assert _decode(NdjsonDecoder("zstd"), frames) == records
+
+    for cut in (3, len(skippable) + 2, len(skippable) + 12, len(frames) // 2, len(frames) - 1):
+        with pytest.raises(NdjsonDecodeError, match="Truncated zstd body"):
+            _decode(NdjsonDecoder("zstd"), frames[:cut])
+
+
+def test_decoder_rejects_bad_input():
+    with pytest.raises(UnsupportedEncodingError):
+        NdjsonDecoder("br")
+    with pytest.raises(NdjsonDecodeError, match="Line 2"):
+        _decode(NdjsonDecoder(), b'{"review_id": "CR-1"}\n{oops\n')
+    with pytest.raises(NdjsonDecodeError, match="Truncated"):
+        _decode(NdjsonDecoder("gzip"), gzip.compress(b'{"review_id": "CR-1"}\n' * 50)[:-12])
+    with pytest.raises(NdjsonDecodeError, match="exceeds"):
+        _decode(NdjsonDecoder(max_line_bytes=10), b'{"review_id": "CR-1"}\n')
+
+
+def test_ingest_service_parses_reviews_from_a_compressed_stream():
+    html = FIXTURE.read_text(encoding="utf-8")
+    body = gzip.compress(_ndjson([{"review_id": f"CR-{index}", "html": html} for index in range(12)]))
+
+    async def chunks():
+        for start in range(0, len(body), 512):
+            yield body[start : start + 512]
+
+    service = IngestService(ParseEngine(max_workers=1, use_cache=False), queue_size=2)
+    outcomes = asyncio.run(service.parse_stream(chunks(), "gzip", ["Role", "Overview"]))
+
+    assert [outcome.review_id for outcome in outcomes] == [f"CR-{index}" for index in range(12)]
+    assert all(outcome.row.status == "Complete" for outcome in outcomes)
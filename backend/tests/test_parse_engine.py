@@ -0,0 +1,147 @@
+﻿import json
+from pathlib import Path
+
+from backend.repositories.disk_cache import DiskCache
+from backend.repositories.parse_cache import ParseCache
+from backend.services import parse_engine as parse_engine_module
+from backend.services.config_service import ConfigService
+from backend.services.parse_engine import ParseEngine
+from backend.services.validation_service import ValidationService
+
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "collaborator_mock.html"
+
+
+def test_parse_engine_keeps_order_and_isolates_failures():
+    html = FIXTURE.read_text(encoding="utf-8")
+    reviews = [(f"CR-{index}", html) for index in range(6)]
+    reviews[2] = ("CR-bad", None)
+
+    engine = ParseEngine(max_workers=2, chunk_size=2, parallel_threshold=0, use_cache=False)
+    try:
+        outcomes = engine.run(reviews, ["Role", "Overview"])
+    finally:
+        engine.shutdown()
+
+    assert [outcome.review_id for outcome in outcomes] == [review_id for review_id, _ in reviews]
+    assert outcomes[0].row.status == "Complete"
+    assert "Role" in outcomes[0].available_fields
+    assert outcomes[2].error
+    assert outcomes[2].row.status == "Incomplete"
+    assert outcomes[2].row.missing_fields == ["Role", "Overview"]
+    assert outcomes[3].row.status == "Complete"
+
+
+class _FailingValidator(ValidationService):
+    def validate_batch(self, *args):
+        raise RuntimeError("rules exploded")
+
+
+def test_parse_engine_turns_validation_errors_into_incomplete_rows(monkeypatch):
+    monkeypatch.setattr(parse_engine_module, "_validator", _FailingValidator())
+    html = FIXTURE.read_text(encoding="utf-8")
+    engine = ParseEngine(max_workers=1, use_cache=False)
+
+    outcomes = engine.run([("CR-1", html), ("CR-2", html)], ["Role"])
+
+    assert [outcome.row.status for outcome in outcomes] == ["Incomplete", "Incomplete"]
+    assert outcomes[0].row.comment == "Failed to validate review: rules exploded"
+    assert outcomes[1].row.missing_fields == ["Role"]
+
+
+_parse_chunk = parse_engine_module._parse_and_validate_chunk
+
+
+def _chunk_failing_on_bad_reviews(tasks):
+    if any(review_id == "CR-bad" for review_id, *_ in tasks):
+        raise RuntimeError("worker exploded")
+    return _parse_chunk(tasks)
+
+
+def test_parse_engine_isolates_worker_errors_per_chunk(monkeypatch):
+    # Forked workers inherit the patched chunk function.
+    monkeypatch.setattr(parse_engine_module, "_parse_and_validate_chunk", _chunk_failing_on_bad_reviews)
+    html = FIXTURE.read_text(encoding="utf-8")
+    reviews = [(f"CR-{index}", html) for index in range(6)]
+    reviews[3] = ("CR-bad", html)
+
+    engine = ParseEngine(max_workers=2, chunk_size=2, parallel_threshold=0, use_cache=False)
+    try:
+        outcomes = engine.run(reviews, ["Role"])
+    finally:
+        engine.shutdown()
+
+    assert [outcome.row.status for outcome in outcomes] == [
+        "Complete", "Complete", "Incomplete", "Incomplete", "Complete", "Complete"
+    ]
+    assert outcomes[2].error == "worker exploded"
+    assert outcomes[3].row.comment == "Failed to parse review page: worker exploded"
+
+
+def test_parse_engine_runs_small_batches_serially():
+    html = FIXTURE.read_text(encoding="utf-8")
+    engine = ParseEngine(max_workers=4, parallel_threshold=10, use_cache=False)
+
+    outcomes = engine.run([("CR-1", html)], ["Defects"])
+
+    assert engine._pool is None
+    assert outcomes[0].row.field_values == {"Defects": "None"}
+
+
+def test_parse_engine_reuses_cached_parses_across_field_selections(tmp_path, monkeypatch):
+    cache = ParseCache(DiskCache(tmp_path, max_bytes=1_000_000, suffix=".json.z"))
+    monkeypatch.setattr(parse_engine_module, "PARSE_CACHE", cache)
+    html = FIXTURE.read_text(encoding="utf-8")
+    engine = ParseEngine(max_workers=1)
+
+    first = engine.run([("CR-1", html), ("CR-2", html)], ["Role"])
+    second = engine.run([("CR-1", html)], ["Overview", "Missing"])
+    third = engine.run([("CR-1", html)], ["Role", "Overview", "Missing"])
+
+    assert [outcome.cache_hit for outcome in first] == [False, True]
+    assert not second[0].cache_hit
+    assert second[0].row.field_values == {"Overview": "Validate transaction posting flow.", "Missing": ""}
+    assert second[0].available_fields == first[0].available_fields
+    assert third[0].cache_hit
+    assert third[0].row.status == "Incomplete"
+    assert third[0].row.missing_fields == ["Missing"]
+    stats = engine.cache_stats()
+    assert (stats.hits, stats.misses, stats.disk.entries) == (2, 2, 1)
+
+
+def test_parse_engine_applies_configured_rules_with_condition_fields(tmp_path):
+    config_path = tmp_path / "collaborator_config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "baseUrl": "https://collaborator.example.com",
+                "reviewPathTemplate": "/review/{reviewId}",
+                "validationRules": [
+                    {
+                        "field": "Role",
+                        "allowedValues": ["Reviewer"],
+                        "when": {"field": "Project", "equals": ["Core Banking"]},
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    html = FIXTURE.read_text(encoding="utf-8")
+    reviews = [(f"CR-{index}", html) for index in range(10)]
+
+    engine = ParseEngine(
+        max_workers=2,
+        chunk_size=4,
+        parallel_threshold=0,
+        use_cache=False,
+        config_service=ConfigService(config_path),
+    )
+    try:
+        outcomes = engine.run(reviews, ["Role", "Overview"])
+    finally:
+        engine.shutdown()
+
+    assert {outcome.row.comment for outcome in outcomes} == {"Role must be one of: Reviewer"}
+    expected_values = {"Role": "Author", "Overview": "Validate transaction posting flow."}
+    assert all(outcome.row.field_values == expected_values for outcome in outcomes)
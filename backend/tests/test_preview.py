@@ -1,5 +1,8 @@
 ﻿import pandas as pd
+import pytest
+
 from backend.repositories.data_store import DATA_STORE
+from backend.repositories.preview_cache import PREVIEW_CACHE
 from backend.services.preview_service import PreviewService
 
 
@@ -38,3 +41,86 @@ def test_preview_all_complete():
     preview = service.build_preview(["Review Info", "Solution"])
     rows = preview.to_dict(orient="records")
     assert rows[0]["Comment"] == "Review completed"
+
+
+def test_preview_joins_blank_comments_in_filter_order():
+    df = pd.DataFrame(
+        [
+            ["ABC-4", "Sum4", " ", "", "ok"],
+            ["ABC-5", "Sum5", "x", "y", "z"],
+        ],
+        columns=["Issue Key", "Summary", "Review Info", "Solution", "Status"],
+    )
+
+    with DATA_STORE.lock:
+        DATA_STORE.dump_df = df
+        DATA_STORE.issue_keys = ["ABC-4"]
+
+    service = PreviewService()
+    preview = service.build_preview(["Solution", "Priority", "Review Info"])
+    rows = preview.to_dict(orient="records")
+
+    assert list(preview.columns) == ["Issue Key", "Summary", "Solution", "Priority", "Review Info", "Comment"]
+    assert len(rows) == 1
+    assert rows[0]["Comment"] == "Solution is blank, Priority is blank, Review Info is blank"
+
+
+def test_preview_page_sorts_filters_and_pages():
+    df = pd.DataFrame(
+        [
+            ["ABC-1", "alpha", ""],
+            ["ABC-2", "Bravo", "done"],
+            ["ABC-3", "charlie", ""],
+            ["ABC-4", "delta", ""],
+        ],
+        columns=["Issue Key", "Summary", "Solution"],
+    )
+
+    with DATA_STORE.lock:
+        DATA_STORE.dump_df = df
+        DATA_STORE.issue_keys = []
+
+    service = PreviewService()
+    page = service.build_preview_page(
+        ["Solution"], limit=2, sort_by="summary", sort_desc=True, incomplete_only=True
+    )
+
+    assert page.total == 3
+    assert page.rows["Issue Key"].tolist() == ["ABC-4", "ABC-3"]
+    assert page.next_cursor is not None
+
+    last = service.build_preview_page(
+        ["Solution"], limit=2, cursor=page.next_cursor, sort_by="summary", sort_desc=True, incomplete_only=True
+    )
+    assert last.rows["Issue Key"].tolist() == ["ABC-1"]
+    assert last.next_cursor is None
+
+    searched = service.build_preview_page(["Solution"], search="BRAV")
+    assert searched.total == 1
+    assert searched.rows.loc[0, "Issue Key"] == "ABC-2"
+
+
+def test_preview_page_reuses_row_order_and_binds_cursor_to_query():
+    df = pd.DataFrame(
+        [[f"ABC-{index}", f"item {index % 3}", "" if index % 2 else "done"] for index in range(10)],
+        columns=["Issue Key", "Summary", "Solution"],
+    )
+
+    with DATA_STORE.lock:
+        DATA_STORE.dump_df = df
+        DATA_STORE.issue_keys = []
+
+    service = PreviewService()
+    first = service.build_preview_page(["Solution"], limit=2, sort_by="Summary", search="item", incomplete_only=True)
+    hits = PREVIEW_CACHE.stats().hits
+    second = service.build_preview_page(
+        ["Solution"], limit=2, cursor=first.next_cursor, sort_by="Summary", search="item", incomplete_only=True
+    )
+
+    # The preview and the row order are both served from the cache.
+    assert PREVIEW_CACHE.stats().hits == hits + 2
+    assert first.total == second.total == 5
+    assert first.rows["Issue Key"].tolist() + second.rows["Issue Key"].tolist() == ["ABC-3", "ABC-9", "ABC-1", "ABC-7"]
+
+    with pytest.raises(ValueError, match="different filters"):
+        service.build_preview_page(["Solution"], limit=2, cursor=first.next_cursor, sort_by="Summary")
@@ -0,0 +1,61 @@
+﻿import pandas as pd
+
+from backend.repositories.data_store import DATA_STORE, DumpSnapshot
+from backend.repositories.preview_cache import PREVIEW_CACHE, PreviewCache
+from backend.services.preview_service import PreviewService
+
+
+def test_preview_cache_evicts_least_recently_used_by_size():
+    frame = pd.DataFrame({"Issue Key": ["ABC-1"] * 10})
+    size = int(frame.memory_usage(index=True, deep=True).sum())
+    cache = PreviewCache(max_bytes=size * 2)
+
+    cache.put((1, "", ("a",)), frame)
+    cache.put((1, "", ("b",)), frame)
+    assert cache.get((1, "", ("a",))) is frame
+    cache.put((1, "", ("c",)), frame)
+
+    assert cache.get((1, "", ("b",))) is None
+    assert cache.get((1, "", ("a",))) is frame
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.evictions == 1
+    assert stats.hits == 2
+    assert stats.misses == 1
+
+
+def test_preview_cache_drops_entries_of_replaced_dump_and_keys():
+    cache = PreviewCache(max_bytes=10_000_000)
+    cache.put((1, "", ("a",)), pd.DataFrame({"x": [1]}))
+    cache.put((2, "", ("a",)), pd.DataFrame({"x": [2]}))
+    cache.put((2, "old-keys", ("a",)), pd.DataFrame({"x": [3]}))
+
+    cache.invalidate(DumpSnapshot(version=3, dump_version=2))
+
+    assert cache.get((1, "", ("a",))) is None
+    assert cache.get((2, "", ("a",))) is not None
+    assert cache.get((2, "old-keys", ("a",))) is None
+    assert cache.stats().entries == 1
+
+    cache.put((2, "new-keys", ("a",)), pd.DataFrame({"x": [4]}))
+    cache.invalidate(DumpSnapshot(version=4, dump_version=2, keys_digest="new-keys"))
+
+    assert cache.get((2, "", ("a",))) is None
+    assert cache.get((2, "new-keys", ("a",))) is not None
+
+
+def test_build_preview_is_memoized_until_data_changes():
+    df = pd.DataFrame([["ABC-1", "Sum1", ""]], columns=["Issue Key", "Summary", "Solution"])
+    DATA_STORE.dump_df = df
+    DATA_STORE.issue_keys = []
+    service = PreviewService()
+
+    first = service.build_preview(["Solution"])
+    hits = PREVIEW_CACHE.stats().hits
+    assert service.build_preview([" Solution ", "Solution"]) is first
+    assert PREVIEW_CACHE.stats().hits == hits + 1
+
+    DATA_STORE.issue_keys = ["ABC-2"]
+    assert service.build_preview(["Solution"]).empty
+    # Entries for the previous key set were dropped, not left to age out.
+    assert all(key[1] == DATA_STORE.snapshot().keys_digest for key in PREVIEW_CACHE._entries)
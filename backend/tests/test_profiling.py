@@ -0,0 +1,56 @@
+﻿import cProfile
+import pstats
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from backend.api import profiling
+from backend.repositories.profile_store import ProfileNotFoundError, ProfileStore
+
+
+def _busy_work():
+    return sum(index * index for index in range(20_000))
+
+
+def _stats():
+    profile = cProfile.Profile()
+    profile.runcall(_busy_work)
+    return pstats.Stats(profile)
+
+
+def test_store_keeps_newest_profiles_with_summary(tmp_path):
+    store = ProfileStore(tmp_path, max_kept=2, top_functions=5)
+    records = [store.save(_stats(), "POST", "/api/preview", "/api/preview", 200, 12.5) for _ in range(3)]
+
+    listed = store.list_profiles()
+    assert [record.profile_id for record in listed] == sorted((r.profile_id for r in records[1:]), reverse=True)
+    summary = store.file_path(listed[0].profile_id, "txt").read_text(encoding="utf-8")
+    assert summary.startswith("POST /api/preview")
+    assert "_busy_work" in summary
+    assert pstats.Stats(str(store.file_path(listed[0].profile_id, "prof"))).total_calls > 0
+    with pytest.raises(ProfileNotFoundError):
+        store.get(records[0].profile_id)
+    with pytest.raises(ProfileNotFoundError):
+        store.file_path("../../etc/passwd", "prof")
+
+
+def test_route_profiles_only_when_asked(tmp_path, monkeypatch):
+    store = ProfileStore(tmp_path)
+    monkeypatch.setattr(profiling, "PROFILE_STORE", store)
+    router = APIRouter(route_class=profiling.ProfiledRoute)
+    router.get("/work")(lambda: {"total": _busy_work()})
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    client = TestClient(app)
+
+    plain = client.get("/api/work")
+    profiled = client.get("/api/work", headers={"X-ReviewPackets-Profile": "1"})
+
+    assert profiling.PROFILE_ID_HEADER not in plain.headers
+    profile_id = profiled.headers[profiling.PROFILE_ID_HEADER]
+    assert [record.profile_id for record in store.list_profiles()] == [profile_id]
+    record = store.get(profile_id)
+    assert (record.method, record.route, record.status) == ("GET", "/api/work", 200)
+    # The sync endpoint runs in a worker thread; its profile is merged in.
+    assert "_busy_work" in store.file_path(profile_id, "txt").read_text(encoding="utf-8")
@@ -0,0 +1,50 @@
+﻿import pytest
+
+from backend.repositories.result_store import ResultStore, RunNotFoundError
+from backend.services.validation_service import ValidationRow
+
+
+def _row(review_id, status="Complete", missing=()):
+    return ValidationRow(
+        review_id=review_id,
+        field_values={"Role": "" if missing else "Author"},
+        missing_fields=list(missing),
+        comment="Missing: Role" if missing else "All required fields present",
+        status=status,
+    )
+
+
+def test_run_filters_by_status_and_missing_field():
+    store = ResultStore()
+    run = store.save(
+        [_row("CR-1"), _row("CR-2", "Incomplete", ["Role"]), _row("CR-3")],
+        ["Role"],
+        available_fields=["Role", "Project", "Role"],
+    )
+
+    stored = store.get(run.run_id)
+    assert stored.available_fields == ("Project", "Role")
+    assert [row.review_id for row in stored.select(status="Incomplete")] == ["CR-2"]
+    assert [row.review_id for row in stored.select(missing_field="Role")] == ["CR-2"]
+    assert stored.complete == 2
+
+
+def test_store_drops_oldest_runs_beyond_limits():
+    store = ResultStore(max_runs=2, max_rows=2)
+    first = store.save([_row("CR-1")], ["Role"])
+    second = store.save([_row("CR-2")], ["Role"])
+    third = store.save([_row("CR-3"), _row("CR-4")], ["Role"])
+
+    assert [run.run_id for run in store.list_runs()] == [third.run_id]
+    assert store.stats().rows == 2
+    for run in (first, second):
+        with pytest.raises(RunNotFoundError):
+            store.get(run.run_id)
+
+
+def test_store_expires_runs_after_retention():
+    store = ResultStore(retention_seconds=-1)
+    store.save([_row("CR-1")], ["Role"])
+
+    assert store.list_runs() == []
+    assert store.stats().rows == 0
@@ -0,0 +1,129 @@
+﻿import csv
+import io
+
+from fastapi.testclient import TestClient
+from openpyxl import load_workbook
+import pytest
+
+from backend.api.uploads import MULTIPART_OVERHEAD_BYTES
+from backend.main import app
+from backend.repositories.data_store import DATA_STORE
+from backend.repositories.disk_cache import DiskCache
+from backend.repositories.dump_cache import DumpCache
+from backend.repositories.preview_cache import PREVIEW_CACHE
+from backend.services import dump_service
+from backend.utils.uploads import MAX_UPLOAD_BYTES
+
+
+DUMP_CSV = (
+    "Issue Key,Summary,Review Info,Review Info\n"
+    "ABC-1,Login fails,Reviewed,\n"
+    "ABC-2,Export CSV,,See CR-1042\n"
+    "ABC-3,Large files,,\n"
+)
+
+
+@pytest.fixture()
+def client(tmp_path, monkeypatch):
+    """The app with the dump cache in ``tmp_path``, a fresh preview cache and no issue keys left behind."""
+    monkeypatch.setattr(dump_service, "DUMP_CACHE", DumpCache(DiskCache(tmp_path / "dump_cache", 1024 * 1024, ".pkl")))
+    PREVIEW_CACHE.clear()
+    yield TestClient(app)
+    DATA_STORE.publish(issue_keys=[])
+    PREVIEW_CACHE.clear()
+
+
+def _upload_dump(client):
+    response = client.post("/api/dump", files={"file": ("dump.csv", DUMP_CSV.encode("utf-8"), "text/csv")})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_dump_preview_and_export_routes(client):
+    uploaded = _upload_dump(client)
+    assert uploaded == {"rows": 3, "columns": ["Issue Key", "Summary", "Review Info"]}
+    assert client.post("/api/keys/text", json={"keys": "ABC-1, ABC-2"}).json() == {"count": 2}
+
+    filters = ["Summary", "Review Info"]
+    preview = client.post("/api/preview", json={"filters": filters})
+    assert preview.status_code == 200
+    rows = preview.json()["rows"]
+    assert [row["Issue Key"] for row in rows] == ["ABC-1", "ABC-2"]
+    assert rows[1]["Review Info"] == "See CR-1042"
+
+    exported = client.post("/api/export", params={"format": "csv"}, json={"filters": filters})
+    assert exported.status_code == 200
+    assert exported.headers["content-type"].startswith("text/csv")
+    exported_rows = list(csv.reader(io.StringIO(exported.content.decode("utf-8-sig"))))
+    assert exported_rows[0] == list(rows[0])
+    assert [row[0] for row in exported_rows[1:]] == ["ABC-1", "ABC-2"]
+
+    workbook = client.post("/api/export", params={"format": "xlsx"}, json={"filters": filters})
+    assert workbook.status_code == 200
+    sheet = load_workbook(io.BytesIO(workbook.content), read_only=True).active
+    values = [list(row) for row in sheet.iter_rows(values_only=True)]
+    assert values[0] == list(rows[0])
+    assert [row[0] for row in values[1:]] == ["ABC-1", "ABC-2"]
+
+
+def test_dump_upload_rejects_missing_issue_key_column(client):
+    response = client.post("/api/dump", files={"file": ("dump.csv", b"Summary\nLogin fails\n", "text/csv")})
+
+    assert response.status_code == 400
+    assert "Issue Key" in response.json()["detail"]
+
+
+def test_collaborator_export_route(client):
+    payload = {
+        "selected_fields": ["Role"],
+        "results": [
+            {
+                "review_id": "CR-1",
+                "field_values": {"Role": "Author"},
+                "missing_fields": [],
+                "comment": "",
+                "status": "Complete",
+            },
+            {
+                "review_id": "CR-2",
+                "field_values": {"Role": ""},
+                "missing_fields": ["Role"],
+                "comment": "Missing: Role",
+                "status": "Incomplete",
+            },
+        ],
+    }
+
+    response = client.post("/api/collaborator/export-csv", json=payload)
+
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert rows[0] == ["Review ID", "Role", "Missing Fields", "Comment", "Status"]
+    assert rows[1][0] == "CR-1" and rows[1][-1] == "Complete"
+    assert rows[2][2:] == ["Role", "Missing: Role", "Incomplete"]
+
+
+def test_fetch_job_rejects_the_shipped_fragment_review_template(client):
+    # backend/collaborator_config.json routes reviews through "/ui#review:id=...".
+    response = client.post(
+        "/api/collaborator/fetch-jobs",
+        json={"selected_fields": ["Role"], "review_ids": ["CR-1"], "cookies": {"session": "abc"}},
+    )
+
+    assert response.status_code == 400
+    assert "server-rendered" in response.json()["detail"]
+
+
+def test_upload_limit_response_passes_through_cors(client):
+    response = client.post(
+        "/api/dump",
+        content=b"--x--\r\n",
+        headers={
+            "Content-Type": "multipart/form-data; boundary=x",
+            "Content-Length": str(MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES + 1),
+            "Origin": "http://localhost:4200",
+        },
+    )
+
+    assert response.status_code == 413
+    assert response.headers["access-control-allow-origin"] == "http://localhost:4200"
@@ -0,0 +1,80 @@
+﻿import hashlib
+import io
+
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+import pytest
+
+from backend.api.uploads import MULTIPART_OVERHEAD_BYTES, UploadLimitMiddleware
+from backend.utils.uploads import UploadTooLargeError, received_upload, save_upload
+
+
+def test_save_upload_hashes_and_keeps_only_suffix(tmp_path):
+    payload = b"Issue Key\nABC-1\n" * 100
+
+    first = save_upload(io.BytesIO(payload), "../keys.CSV", chunk_size=7, upload_dir=tmp_path)
+    second = save_upload(io.BytesIO(payload), "../keys.CSV", chunk_size=7, upload_dir=tmp_path)
+
+    assert first.path != second.path
+    assert first.path.parent == tmp_path
+    assert first.path.suffix == ".csv"
+    assert first.size_bytes == len(payload)
+    assert first.sha256 == hashlib.sha256(payload).hexdigest()
+    assert first.path.read_bytes() == payload
+
+
+def test_save_upload_aborts_over_limit_and_cleans_up(tmp_path):
+    with pytest.raises(UploadTooLargeError):
+        save_upload(io.BytesIO(b"x" * 50), "dump.xlsx", max_bytes=20, chunk_size=8, upload_dir=tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_received_upload_removes_file_afterwards(tmp_path):
+    with received_upload(io.BytesIO(b"data"), "dump.csv", upload_dir=tmp_path) as upload:
+        assert upload.path.exists()
+
+    assert not upload.path.exists()
+
+
+def _limited_app(calls):
+    app = FastAPI()
+    app.add_middleware(UploadLimitMiddleware, max_bytes=1024)
+
+    @app.post("/upload")
+    def upload(file: UploadFile = File(...)):
+        calls.append(file.filename)
+        return {"size": len(file.file.read())}
+
+    return app
+
+
+def test_upload_limit_rejects_declared_length_without_reading_body():
+    calls = []
+    client = TestClient(_limited_app(calls))
+
+    small = client.post("/upload", files={"file": ("dump.csv", b"x" * 100)})
+    large = client.post("/upload", files={"file": ("dump.csv", b"x" * (MULTIPART_OVERHEAD_BYTES + 2048))})
+
+    assert small.json() == {"size": 100}
+    assert large.status_code == 413
+    assert calls == ["dump.csv"]
+
+
+def test_upload_limit_stops_chunked_body_while_receiving():
+    calls = []
+    client = TestClient(_limited_app(calls))
+    boundary = "limit-test"
+    head = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"dump.csv\"\r\n\r\n"
+    ).encode()
+    chunks = [head, *([b"x" * 16 * 1024] * 8), f"\r\n--{boundary}--\r\n".encode()]
+
+    response = client.post(
+        "/upload",
+        content=iter(chunks),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+
+    assert response.status_code == 413
+    assert calls == []
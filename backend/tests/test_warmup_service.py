@@ -0,0 +1,49 @@
+﻿import subprocess
+import sys
+from pathlib import Path
+
+from backend.services.warmup_service import WARMUP_DONE, WARMUP_FAILED, WarmupService
+from backend.utils.lazy import LazyService
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_lazy_service_builds_once_and_forwards_attributes():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return {"answer": 42}
+
+    service = LazyService("answers", factory)
+    assert not service.is_built
+
+    assert service.get("answer") == 42
+    assert service.instance() is service.instance()
+    assert service.is_built
+    assert len(calls) == 1
+
+
+def test_warmup_builds_every_service_and_reports_failures():
+    ok = LazyService("ok", dict)
+    broken = LazyService("broken", lambda: 1 / 0)
+    warmup = WarmupService([ok, broken])
+
+    warmup.run()
+    status = warmup.status()
+
+    assert status.state == WARMUP_FAILED
+    assert status.built == ["ok"]
+    assert status.pending == ["broken"]
+    assert "division by zero" in status.error
+
+    healthy = WarmupService([LazyService("ok", dict)])
+    healthy.run()
+    assert healthy.status().state == WARMUP_DONE
+
+
+def test_importing_routes_does_not_load_pandas_or_parsers():
+    code = "import sys, backend.api.routes; print(sorted({'pandas', 'openpyxl', 'bs4'} & set(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,176 @@
+﻿from __future__ import annotations
+
+from collections import defaultdict
+from itertools import zip_longest
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+
+
+DEFAULT_CHUNK_ROWS = 5_000
+PROGRESS_EVERY_ROWS = 50_000
+
+ProgressCallback = Callable[[int, float], None]
+
+_ERROR_CODES = frozenset(ERROR_CODES)
+
+
+def read_xlsx_streaming(
+    file_path: Path,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    progress: ProgressCallback | None = None,
+) -> pd.DataFrame:
+    """Read the first worksheet of an .xlsx file row by row.
+
+    Rows are pulled from openpyxl's read-only ``iter_rows`` and transposed in
+    chunks into per-column object arrays, so the full row list never exists in
+    memory. The result mirrors ``pd.read_excel(dtype=str, keep_default_na=False)``
+    followed by ``fillna("")``: numeric cells are rendered like pandas renders
+    them, duplicate headers are mangled to ``Name.1`` and trailing blank rows
+    are dropped.
+
+    ``progress`` is called with ``(rows_read, rows_per_second)`` every
+    ``PROGRESS_EVERY_ROWS`` rows and once more when the sheet is exhausted.
+    """
+    workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = workbook.worksheets[0]
+        sheet.reset_dimensions()
+        return _read_rows(sheet.iter_rows(values_only=True), chunk_rows, progress)
+    finally:
+        workbook.close()
+
+
+def _read_rows(rows: Iterable[tuple], chunk_rows: int, progress: ProgressCallback | None) -> pd.DataFrame:
+    iterator = iter(rows)
+    header = next(iterator, None)
+    if header is None:
+        return pd.DataFrame()
+
+    buffers: list[list[np.ndarray]] = []
+    total_rows = 0
+    pending_blank = 0
+    chunk: list[tuple] = []
+    started = perf_counter()
+    next_report = PROGRESS_EVERY_ROWS
+
+    def flush() -> None:
+        nonlocal total_rows
+        width = max(_trimmed_width(row) for row in chunk)
+        while len(buffers) < width:
+            buffers.append([np.full(total_rows, "", dtype=object)] if total_rows else [])
+        columns = list(zip_longest(*chunk, fillvalue=None))
+        for index, buffer in enumerate(buffers):
+            if index < len(columns):
+                buffer.append(_column_to_array(columns[index]))
+            else:
+                buffer.append(np.full(len(chunk), "", dtype=object))
+        total_rows += len(chunk)
+        chunk.clear()
+
+    for row in iterator:
+        if _is_blank(row):
+            # Blank rows only survive when data follows them, like pandas.
+            pending_blank += 1
+            continue
+        while pending_blank:
+            chunk.append(())
+            pending_blank -= 1
+            if len(chunk) >= chunk_rows:
+                flush()
+        chunk.append(row)
+        if len(chunk) >= chunk_rows:
+            flush()
+        rows_seen = total_rows + len(chunk)
+        if progress is not None and rows_seen >= next_report:
+            progress(rows_seen, _rate(rows_seen, started))
+            next_report += PROGRESS_EVERY_ROWS
+
+    if chunk:
+        flush()
+    if progress is not None:
+        progress(total_rows, _rate(total_rows, started))
+
+    width = max(len(buffers), _trimmed_width(header))
+    while len(buffers) < width:
+        buffers.append([np.full(total_rows, "", dtype=object)] if total_rows else [])
+
+    names = _build_header(header, width)
+    data = {
+        index: (np.concatenate(parts) if parts else np.empty(0, dtype=object))
+        for index, parts in enumerate(buffers)
+    }
+    df = pd.DataFrame(data, copy=False)
+    df.columns = names
+    return df
+
+
+def _column_to_array(values: tuple) -> np.ndarray:
+    array = np.empty(len(values), dtype=object)
+    array[:] = [
+        value if type(value) is str and value not in _ERROR_CODES else _cell_text(value)
+        for value in values
+    ]
+    return array
+
+
+def _cell_text(value: object) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else str(value)
+    if isinstance(value, str) and value in _ERROR_CODES:
+        return ""
+    return str(value)
+
+
+def _is_blank(row: tuple) -> bool:
+    return all(value is None or value == "" for value in row)
+
+
+def _trimmed_width(row: tuple) -> int:
+    width = len(row)
+    while width and (row[width - 1] is None or row[width - 1] == ""):
+        width -= 1
+    return width
+
+
+def _build_header(header: tuple, width: int) -> list[object]:
+    names: list[object] = []
+    for index in range(width):
+        value = header[index] if index < len(header) else None
+        if value is None or value == "":
+            names.append(f"Unnamed: {index}")
+        elif isinstance(value, float) and value.is_integer():
+            names.append(int(value))
+        elif isinstance(value, str) and value in _ERROR_CODES:
+            names.append(f"Unnamed: {index}")
+        else:
+            names.append(value)
+    return _dedup_names(names)
+
+
+def _dedup_names(names: list[object]) -> list[object]:
+    counts: dict[object, int] = defaultdict(int)
+    result: list[object] = []
+    for name in names:
+        current = counts[name]
+        while current > 0:
+            counts[name] = current + 1
+            name = f"{name}.{current}"
+            current = counts[name]
+        result.append(name)
+        counts[name] = current + 1
+    return result
+
+
+def _rate(rows: int, started: float) -> float:
+    elapsed = perf_counter() - started
+    return rows / elapsed if elapsed > 0 else float(rows)
@@ -1,20 +1,40 @@
 ﻿from __future__ import annotations
 
+import logging
 from pathlib import Path
 import pandas as pd
 
+from .excel_stream import ProgressCallback, read_xlsx_streaming
+from .headers import HeaderIndex
 from .merge import merge_duplicate_columns
+from .metrics import ROWS_PROCESSED, stage_timer
 
 
 SUPPORTED_EXTENSIONS = {".xlsx", ".xls", ".csv"}
 
+logger = logging.getLogger(__name__)
 
-def load_table(file_path: Path) -> pd.DataFrame:
-    if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+
+def load_table(
+    file_path: Path,
+    streaming: bool = False,
+    progress: ProgressCallback | None = None,
+) -> pd.DataFrame:
+    with stage_timer("load_table"):
+        df = _load_table(file_path, streaming, progress)
+    ROWS_PROCESSED.inc(len(df), stage="load_table")
+    return df
+
+
+def _load_table(file_path: Path, streaming: bool, progress: ProgressCallback | None) -> pd.DataFrame:
+    suffix = file_path.suffix.lower()
+    if suffix not in SUPPORTED_EXTENSIONS:
         raise ValueError("Unsupported file type. Use .xlsx, .xls, or .csv")
 
-    if file_path.suffix.lower() == ".csv":
+    if suffix == ".csv":
         df = pd.read_csv(file_path, dtype=str, keep_default_na=False)
+    elif suffix == ".xlsx" and streaming:
+        df = read_xlsx_streaming(file_path, progress=progress or _log_progress(file_path))
     else:
         df = pd.read_excel(file_path, dtype=str, keep_default_na=False, engine="openpyxl")
 
@@ -25,7 +45,7 @@ def load_table(file_path: Path) -> pd.DataFrame:
 
 def load_issue_keys(file_path: Path, issue_key_column: str = "Issue Key") -> list[str]:
     df = load_table(file_path)
-    column = _find_column(df, issue_key_column)
+    column = HeaderIndex.for_frame(df).find(issue_key_column)
     if column is None:
         raise ValueError(f"Missing required column: {issue_key_column}")
 
@@ -38,9 +58,8 @@ def load_issue_keys(file_path: Path, issue_key_column: str = "Issue Key") -> lis
     return [key for key in keys if key]
 
 
-def _find_column(df: pd.DataFrame, name: str) -> str | None:
-    target = name.strip().lower()
-    for col in df.columns:
-        if str(col).strip().lower() == target:
-            return col
-    return None
+def _log_progress(file_path: Path) -> ProgressCallback:
+    def report(rows: int, rows_per_second: float) -> None:
+        logger.info("Streaming %s: %d rows read (%.0f rows/s)", file_path.name, rows, rows_per_second)
+
+    return report
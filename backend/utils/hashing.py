@@ -0,0 +1,15 @@
+﻿from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(file_path: Path, chunk_size: int = HASH_CHUNK_BYTES) -> str:
+    digest = hashlib.sha256()
+    with file_path.open("rb") as source:
+        for chunk in iter(lambda: source.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
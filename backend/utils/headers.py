@@ -0,0 +1,57 @@
+﻿from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+import pandas as pd
+
+
+# Each group lists spellings that refer to the same dump column, in lookup order.
+DEFAULT_ALIAS_GROUPS: tuple[tuple[str, ...], ...] = (
+    ("issue key", "key", "issuekey", "issue_key", "issue-key"),
+)
+
+
+def normalize_header(name: object) -> str:
+    return str(name).strip().lower()
+
+
+class HeaderIndex:
+    """Case-insensitive lookup from header names to the columns of one frame.
+
+    Built once per frame. When several columns normalize to the same name the
+    first one wins, like a left-to-right scan would. A name that is missing
+    falls back to the other spellings in its alias group.
+    """
+
+    def __init__(
+        self,
+        columns: Iterable[object],
+        alias_groups: Sequence[Sequence[str]] = DEFAULT_ALIAS_GROUPS,
+    ) -> None:
+        self._columns: dict[str, object] = {}
+        for column in columns:
+            self._columns.setdefault(normalize_header(column), column)
+
+        self._aliases: dict[str, tuple[str, ...]] = {}
+        for group in alias_groups:
+            normalized = tuple(normalize_header(name) for name in group)
+            for name in normalized:
+                self._aliases[name] = normalized
+
+    @classmethod
+    def for_frame(cls, df: pd.DataFrame) -> HeaderIndex:
+        return cls(df.columns)
+
+    def find(self, name: str) -> object | None:
+        target = normalize_header(name)
+        column = self._columns.get(target)
+        if column is not None:
+            return column
+        for alias in self._aliases.get(target, ()):
+            column = self._columns.get(alias)
+            if column is not None:
+                return column
+        return None
+
+    def find_many(self, names: Iterable[str]) -> dict[str, object | None]:
+        return {name: self.find(name) for name in names}
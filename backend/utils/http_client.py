@@ -0,0 +1,244 @@
+﻿from __future__ import annotations
+
+from dataclasses import dataclass
+import email.utils
+import http.client
+from threading import Lock
+from time import perf_counter, sleep, time
+from typing import Callable, Mapping
+from urllib.parse import urljoin, urlsplit
+import zlib
+
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 5
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+# Raised by a kept-alive connection the server has already closed.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class HttpFetchError(Exception):
+    def __init__(self, message: str, status: int | None = None, attempts: int = 1) -> None:
+        super().__init__(message)
+        self.status = status
+        self.attempts = attempts
+
+
+@dataclass
+class HttpResponse:
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    attempts: int
+    elapsed_ms: float
+
+    def text(self) -> str:
+        charset = "utf-8"
+        for part in self.headers.get("content-type", "").split(";")[1:]:
+            name, _, value = part.partition("=")
+            if name.strip().lower() == "charset" and value.strip():
+                charset = value.strip().strip('"')
+        try:
+            return self.body.decode(charset, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+@dataclass
+class HttpClientStats:
+    requests: int
+    retries: int
+    connections_opened: int
+    idle_connections: int
+
+
+class PooledHttpClient:
+    """Small thread-safe GET client that keeps connections alive between requests.
+
+    Idle connections are pooled per origin (at most ``max_connections`` each)
+    and handed to one thread at a time, so concurrent callers reuse sockets
+    instead of reconnecting for every page. Connection errors, timeouts and
+    the statuses in ``RETRY_STATUSES`` are retried up to ``max_retries``
+    times with exponential backoff starting at ``backoff_seconds`` (or the
+    server's ``Retry-After``). Redirects are only followed within the same
+    origin so ``headers`` such as cookies never leak to another host.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float,
+        max_retries: int,
+        max_connections: int,
+        backoff_seconds: float = 1.0,
+        headers: Mapping[str, str] | None = None,
+        sleeper: Callable[[float], None] = sleep,
+    ) -> None:
+        self._timeout = timeout_seconds
+        self._max_retries = max(0, max_retries)
+        self._max_connections = max(1, max_connections)
+        self._backoff_seconds = max(0.0, backoff_seconds)
+        self._headers = {"Accept-Encoding": "gzip", "Connection": "keep-alive", **(headers or {})}
+        self._sleep = sleeper
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = Lock()
+        self._requests = 0
+        self._retries = 0
+        self._connections_opened = 0
+
+    def get(self, url: str) -> HttpResponse:
+        started = perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            retry_after: float | None = None
+            try:
+                status, headers, body, final_url = self._get_following_redirects(url)
+            except (OSError, http.client.HTTPException) as exc:
+                error = HttpFetchError(f"Request to {url} failed: {exc}", attempts=attempt)
+            else:
+                if 200 <= status < 300:
+                    return HttpResponse(
+                        url=final_url,
+                        status=status,
+                        headers=headers,
+                        body=body,
+                        attempts=attempt,
+                        elapsed_ms=(perf_counter() - started) * 1000,
+                    )
+                error = HttpFetchError(f"{url} returned HTTP {status}.", status=status, attempts=attempt)
+                if status not in RETRY_STATUSES:
+                    raise error
+                retry_after = _retry_after_seconds(headers.get("retry-after"))
+
+            if attempt > self._max_retries:
+                raise error
+            with self._lock:
+                self._retries += 1
+            delay = self._backoff_seconds * (2 ** (attempt - 1))
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, MAX_RETRY_AFTER_SECONDS))
+            self._sleep(delay)
+
+    def stats(self) -> HttpClientStats:
+        with self._lock:
+            return HttpClientStats(
+                requests=self._requests,
+                retries=self._retries,
+                connections_opened=self._connections_opened,
+                idle_connections=sum(len(connections) for connections in self._idle.values()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [connection for connections in self._idle.values() for connection in connections]
+            self._idle.clear()
+        for connection in idle:
+            connection.close()
+
+    def __enter__(self) -> PooledHttpClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _get_following_redirects(self, url: str) -> tuple[int, dict[str, str], bytes, str]:
+        origin = _origin(url)
+        for _ in range(MAX_REDIRECTS + 1):
+            status, headers, body = self._request(url)
+            location = headers.get("location")
+            if status not in REDIRECT_STATUSES or not location:
+                return status, headers, body, url
+            target = urljoin(url, location)
+            if _origin(target) != origin:
+                raise HttpFetchError(f"{url} redirected to another host ({target}); is the session still valid?", status)
+            url = target
+        raise HttpFetchError(f"{url} redirected more than {MAX_REDIRECTS} times.")
+
+    def _request(self, url: str) -> tuple[int, dict[str, str], bytes]:
+        parts = urlsplit(url)
+        origin = _origin(url)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        connection, reused = self._acquire(origin)
+        try:
+            try:
+                response = self._send(connection, path)
+            except _STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive socket; that is not a failed attempt.
+                connection.close()
+                connection = self._connect(origin)
+                response = self._send(connection, path)
+            body = response.read()
+        except BaseException:
+            connection.close()
+            raise
+
+        headers = {name.lower(): value for name, value in response.getheaders()}
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(origin, connection)
+        if headers.get("content-encoding", "").lower() in {"gzip", "x-gzip"}:
+            try:
+                body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+            except zlib.error as exc:
+                raise HttpFetchError(f"Invalid gzip response from {url}: {exc}", response.status) from exc
+        return response.status, headers, body
+
+    def _send(self, connection: http.client.HTTPConnection, path: str) -> http.client.HTTPResponse:
+        with self._lock:
+            self._requests += 1
+        connection.request("GET", path, headers=self._headers)
+        return connection.getresponse()
+
+    def _acquire(self, origin: tuple[str, str, int]) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(origin)
+            if idle:
+                return idle.pop(), True
+        return self._connect(origin), False
+
+    def _release(self, origin: tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(origin, [])
+            if len(idle) < self._max_connections:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _connect(self, origin: tuple[str, str, int]) -> http.client.HTTPConnection:
+        scheme, host, port = origin
+        with self._lock:
+            self._connections_opened += 1
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self._timeout)
+        return http.client.HTTPConnection(host, port, timeout=self._timeout)
+
+
+def _origin(url: str) -> tuple[str, str, int]:
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in {"http", "https"} or not parts.hostname:
+        raise HttpFetchError(f"Unsupported URL: {url}")
+    return scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80)
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time())
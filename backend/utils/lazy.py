@@ -0,0 +1,45 @@
+﻿from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Callable, Generic, TypeVar
+
+
+T = TypeVar("T")
+
+
+class LazyService(Generic[T]):
+    """Module-level service singleton that is only built on first use.
+
+    Attribute access is forwarded to the built service, so call sites keep
+    using it like the service itself; the wrapper's own members
+    (``instance``, ``is_built``, ``service_name``) must not clash with the
+    service's. The factory should import the service module itself, so that
+    importing the module holding the singleton does not pull in pandas,
+    openpyxl or the parser libraries.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], T]) -> None:
+        self._name = name
+        self._factory = factory
+        self._instance: T | None = None
+        self._lock = Lock()
+
+    @property
+    def service_name(self) -> str:
+        return self._name
+
+    @property
+    def is_built(self) -> bool:
+        return self._instance is not None
+
+    def instance(self) -> T:
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+                instance = self._instance
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.instance(), name)
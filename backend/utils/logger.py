@@ -1,9 +1,28 @@
 ﻿from pathlib import Path
+import json
 import logging
 import os
 from logging.handlers import RotatingFileHandler
 
 
+# Attributes every LogRecord has; anything else was passed through ``extra``.
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class ExtraFormatter(logging.Formatter):
+    """Appends the fields passed through ``extra`` as one JSON object.
+
+    Matches the Electron log lines: ``... | message | {"reviews": 120}``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        extra = {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES}
+        if not extra:
+            return line
+        return f"{line} | {json.dumps(extra, default=str, ensure_ascii=False)}"
+
+
 def _resolve_log_dir() -> Path:
     override = os.getenv("REVIEWPACKETS_LOG_DIR", "").strip()
     if override:
@@ -29,7 +48,7 @@ def setup_logging() -> None:
         return
     logger.setLevel(logging.INFO)
 
-    formatter = logging.Formatter(
+    formatter = ExtraFormatter(
         "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
     )
 
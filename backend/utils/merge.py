@@ -1,8 +1,13 @@
 ﻿from __future__ import annotations
 
-import pandas as pd
+import operator
 import re
 
+import numpy as np
+import pandas as pd
+
+from backend.utils.metrics import ROWS_PROCESSED, stage_timer
+
 
 def _normalize_value(value: object) -> str:
     if value is None:
@@ -13,37 +18,37 @@ def _normalize_value(value: object) -> str:
     return text
 
 
-def merge_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
+def merge_duplicate_columns(df: pd.DataFrame, engine: str = "vectorized") -> pd.DataFrame:
+    if engine not in MERGE_ENGINES:
+        raise ValueError(f"Unknown merge engine: {engine}")
+    with stage_timer("merge_duplicate_columns"):
+        merged = _merge_duplicate_columns(df, engine)
+    ROWS_PROCESSED.inc(len(df), stage="merge_duplicate_columns")
+    return merged
+
+
+def _merge_duplicate_columns(df: pd.DataFrame, engine: str) -> pd.DataFrame:
     if df.empty:
         return df
 
-    columns = list(df.columns)
-    normalized_columns = _normalize_duplicate_headers(columns)
-    seen = set()
+    normalized_columns = _normalize_duplicate_headers(list(df.columns))
+    groups: dict[str, list[int]] = {}
+    for index, name in enumerate(normalized_columns):
+        groups.setdefault(name, []).append(index)
+
+    merge_pair = MERGE_ENGINES[engine]
     merged_columns = []
     merged_data = []
-
-    for idx, name in enumerate(normalized_columns):
-        if name in seen:
-            continue
-        seen.add(name)
-        duplicate_indices = [i for i, col in enumerate(normalized_columns) if col == name]
-
+    for name, duplicate_indices in groups.items():
+        merged_columns.append(name)
         if len(duplicate_indices) == 1:
-            merged_columns.append(name)
             merged_data.append(df.iloc[:, duplicate_indices[0]])
             continue
 
         # Merge duplicate columns by concatenating non-empty values
-        merged_series = df.iloc[:, duplicate_indices[0]].copy()
+        merged_series = df.iloc[:, duplicate_indices[0]]
         for col_index in duplicate_indices[1:]:
-            next_series = df.iloc[:, col_index]
-            merged_series = merged_series.combine(
-                next_series,
-                lambda left, right: _merge_cell_values(left, right),
-            )
-
-        merged_columns.append(name)
+            merged_series = merge_pair(merged_series, df.iloc[:, col_index])
         merged_data.append(merged_series)
 
     merged_df = pd.concat(merged_data, axis=1)
@@ -51,11 +56,59 @@ def merge_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
     return merged_df
 
 
+def _merge_pair_python(left: pd.Series, right: pd.Series) -> pd.Series:
+    return left.combine(right, lambda left_value, right_value: _merge_cell_values(left_value, right_value))
+
+
+def _merge_pair_vectorized(left: pd.Series, right: pd.Series) -> pd.Series:
+    left_text = _normalize_array(left)
+    right_text = _normalize_array(right)
+
+    left_empty = left_text == ""
+    right_empty = right_text == ""
+    merged = np.where(left_empty, right_text, left_text)
+
+    both = ~(left_empty | right_empty)
+    if both.any():
+        left_both = left_text[both]
+        right_both = right_text[both]
+        contained = _contains(left_both, right_both).astype(bool)
+        concat = ~contained
+        joined = left_both[concat] + " | " + right_both[concat]
+        both_values = left_both.copy()
+        both_values[concat] = joined
+        merged[both] = both_values
+
+    return pd.Series(merged, index=left.index, name=left.name, dtype=object)
+
+
+def _normalize_array(series: pd.Series) -> np.ndarray:
+    """Vectorized equivalent of ``_normalize_value`` over a whole column."""
+    values = series.to_numpy(dtype=object)
+    text = pd.Series(values, dtype=object).astype(str).str.strip().to_numpy(dtype=object)
+
+    missing = pd.isna(values)
+    if missing.any():
+        # Only None and float NaN count as empty; pd.NA/NaT keep their text like str() does.
+        positions = np.flatnonzero(missing)
+        empty = [value is None or isinstance(value, float) for value in values[positions]]
+        text[positions[empty]] = ""
+    return text
+
+
+_contains = np.frompyfunc(operator.contains, 2, 1)
+
+MERGE_ENGINES = {
+    "python": _merge_pair_python,
+    "vectorized": _merge_pair_vectorized,
+}
+
+
 def _normalize_duplicate_headers(columns: list[object]) -> list[str]:
     normalized = []
     raw_names = [str(col).strip() for col in columns]
     base_set = set(raw_names)
-    pattern = re.compile(r"^(.*)\\.(\\d+)$")
+    pattern = re.compile(r"^(.*)\.(\d+)$")
     for name in raw_names:
         match = pattern.match(name)
         if match and match.group(1) in base_set:
@@ -0,0 +1,300 @@
+﻿from __future__ import annotations
+
+from bisect import bisect_left
+from contextlib import contextmanager
+import math
+import os
+import sys
+from threading import Lock
+from time import perf_counter
+from typing import Callable, ContextManager, Iterator, Sequence, TypeVar
+
+
+# Prometheus text exposition format served by ``GET /metrics``.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers a sub-millisecond page parse up to a multi-minute dump load.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+LabelValues = tuple[str, ...]
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterator[tuple[str, LabelValues, float]]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterator[tuple[str, LabelValues, float]]:
+        with self._lock:
+            values = dict(self._values)
+        for key, value in values.items():
+            yield self.name, key, value
+
+
+class Histogram(_Metric):
+    """Latency histogram; bucket counts are kept per bucket and summed when rendered."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: [count per bucket..., count above the last bucket], sum.
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return sum(series[0]) if series is not None else 0
+
+    def samples(self) -> Iterator[tuple[str, LabelValues, float]]:
+        with self._lock:
+            series = {key: (list(counts), total[0]) for key, (counts, total) in self._series.items()}
+        for key, (counts, total) in series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", (*key, _format_bound(bound)), cumulative
+            yield f"{self.name}_sum", key, total
+            yield f"{self.name}_count", key, cumulative
+
+
+class CallbackGauge(_Metric):
+    """Gauge read when the metrics are rendered; ``None`` from the callback skips the sample."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], float | None]) -> None:
+        super().__init__(name, documentation)
+        self._callback = callback
+
+    def samples(self) -> Iterator[tuple[str, LabelValues, float]]:
+        value = self._callback()
+        if value is not None:
+            yield self.name, (), value
+
+
+_MetricT = TypeVar("_MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    """In-process metrics rendered in the Prometheus text format.
+
+    Only the API process records into it. Parse work done in pool workers is
+    recorded by ``ParseEngine`` from the timings each ``ReviewOutcome``
+    carries back.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, callback: Callable[[], float | None]) -> CallbackGauge:
+        return self._register(CallbackGauge(name, documentation, callback))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            bucket_labelnames = (*metric.labelnames, "le")
+            for sample_name, values, value in metric.samples():
+                names = bucket_labelnames if sample_name.endswith("_bucket") else metric.labelnames
+                labels = ",".join(f'{name}="{_escape_label(label)}"' for name, label in zip(names, values))
+                series = f"{sample_name}{{{labels}}}" if labels else sample_name
+                lines.append(f"{series} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: _MetricT) -> _MetricT:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(float(bound))
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if value == math.inf:
+        return "+Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def process_memory() -> tuple[int | None, int | None]:
+    """Current and peak resident set size of this process in bytes, where the platform reports them."""
+    if sys.platform == "win32":
+        return _windows_memory()
+    rss = None
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes.
+        peak = peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        peak = None
+    if rss is not None and peak is not None:
+        # ru_maxrss is sampled by the kernel and can trail the current RSS.
+        peak = max(peak, rss)
+    return rss, peak
+
+
+def _windows_memory() -> tuple[int | None, int | None]:
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    kernel32 = ctypes.WinDLL("kernel32")
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    get_info = ctypes.WinDLL("psapi").GetProcessMemoryInfo
+    get_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+    if not get_info(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+        return None, None
+    return counters.WorkingSetSize, counters.PeakWorkingSetSize
+
+
+METRICS = MetricsRegistry()
+
+STAGE_SECONDS = METRICS.histogram(
+    "reviewpackets_stage_duration_seconds",
+    "Time spent in each processing stage. parse_review and validate_review are per review.",
+    labelnames=("stage",),
+)
+ROWS_PROCESSED = METRICS.counter(
+    "reviewpackets_rows_processed_total",
+    "Table rows handled by each stage.",
+    labelnames=("stage",),
+)
+BYTES_INGESTED = METRICS.counter(
+    "reviewpackets_bytes_ingested_total",
+    "Bytes received from uploads and NDJSON review streams.",
+    labelnames=("source",),
+)
+REVIEWS_PARSED = METRICS.counter(
+    "reviewpackets_reviews_parsed_total",
+    "Reviews parsed and validated, by resulting status and whether the parse cache answered.",
+    labelnames=("status", "cache"),
+)
+CONFIG_RELOADS = METRICS.counter(
+    "reviewpackets_config_reloads_total",
+    "Collaborator config changes picked up after the first load.",
+)
+HTTP_REQUEST_SECONDS = METRICS.histogram(
+    "reviewpackets_http_request_duration_seconds",
+    "API request latency by route template.",
+    labelnames=("method", "route", "status"),
+)
+METRICS.gauge(
+    "process_resident_memory_bytes",
+    "Resident set size of the API process.",
+    lambda: process_memory()[0],
+)
+METRICS.gauge(
+    "process_peak_resident_memory_bytes",
+    "Peak resident set size of the API process.",
+    lambda: process_memory()[1],
+)
+
+
+def stage_timer(stage: str) -> ContextManager[None]:
+    """Context manager recording the duration of ``stage`` in ``STAGE_SECONDS``."""
+    return STAGE_SECONDS.time(stage=stage)
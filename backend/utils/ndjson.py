@@ -0,0 +1,254 @@
+﻿from __future__ import annotations
+
+import json
+from typing import Iterator
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional at runtime
+    zstandard = None
+
+
+DECOMPRESS_STEP_BYTES = 1024 * 1024
+ZSTD_INPUT_STEP_BYTES = 16 * 1024
+ZSTD_MIN_INPUT_STEP_BYTES = 256
+ZSTD_MAX_STEP_OUTPUT_BYTES = 32 * DECOMPRESS_STEP_BYTES
+MAX_LINE_BYTES = 64 * 1024 * 1024
+
+_ZSTD_MAGIC = 0xFD2FB528
+_ZSTD_SKIPPABLE_MAGIC = 0x184D2A50
+_ZSTD_SKIPPABLE_MASK = 0xFFFFFFF0
+
+
+class NdjsonDecodeError(ValueError):
+    pass
+
+
+class UnsupportedEncodingError(ValueError):
+    pass
+
+
+class _GzipStream:
+    """Incremental gzip inflater that also handles concatenated members."""
+
+    def __init__(self) -> None:
+        self._inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._in_member = False
+
+    def decompress(self, data: bytes, max_length: int) -> tuple[bytes, bytes]:
+        """Inflate at most ``max_length`` bytes; return ``(output, input still to feed)``."""
+        self._in_member = True
+        output = self._inflater.decompress(data, max_length)
+        pending = self._inflater.unconsumed_tail
+        if self._inflater.eof:
+            pending = self._inflater.unused_data
+            self._inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            self._in_member = False
+            if not pending.strip(b"\0"):
+                pending = b""
+        return output, pending
+
+    def flush(self) -> bytes:
+        if self._in_member:
+            raise NdjsonDecodeError("Truncated gzip body.")
+        return b""
+
+
+class _ZstdStream:
+    """Incremental zstd inflater with bounded output per step.
+
+    zstandard has no output limit per call, so input is fed in steps sized
+    from the expansion seen so far to produce about ``max_length`` bytes, and
+    output goes through a sink that fails once one step passes
+    ``ZSTD_MAX_STEP_OUTPUT_BYTES``, which stops decompression bombs. The
+    writer does not report frame ends, so ``_ZstdFrameTracker`` follows the
+    frame layout of the input to catch a body cut off inside a frame.
+    """
+
+    def __init__(self) -> None:
+        if zstandard is None:
+            raise UnsupportedEncodingError("zstd request bodies need the zstandard package.")
+        self._sink = _ZstdSink()
+        self._writer = zstandard.ZstdDecompressor().stream_writer(
+            self._sink, write_size=DECOMPRESS_STEP_BYTES, write_return_read=True
+        )
+        self._frames = _ZstdFrameTracker()
+        # Expansion of the previous step; unknown at first, so start with the smallest step.
+        self._ratio = float("inf")
+
+    def decompress(self, data: bytes, max_length: int) -> tuple[bytes, bytes]:
+        step_size = max(ZSTD_MIN_INPUT_STEP_BYTES, min(ZSTD_INPUT_STEP_BYTES, int(max_length / self._ratio)))
+        step, pending = data[:step_size], data[step_size:]
+        try:
+            self._writer.write(step)
+        except zstandard.ZstdError as exc:
+            raise NdjsonDecodeError(f"Invalid zstd body: {exc}") from exc
+        self._frames.feed(step)
+        output = self._sink.take()
+        self._ratio = max(1.0, len(output) / len(step))
+        return output, pending
+
+    def flush(self) -> bytes:
+        if self._frames.in_frame:
+            raise NdjsonDecodeError("Truncated zstd body.")
+        return b""
+
+
+class _ZstdFrameTracker:
+    """Follows zstd frame and block headers without decoding block contents.
+
+    Only the headers are read: each block's 3-byte header gives its size and
+    whether it is the frame's last, and skippable frames carry their length.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._skip = 0
+        self._state = "magic"
+        self._checksum = False
+
+    @property
+    def in_frame(self) -> bool:
+        return self._state != "magic" or self._skip > 0 or bool(self._buffer)
+
+    def feed(self, data: bytes) -> None:
+        self._buffer += data
+        while True:
+            if self._skip:
+                skipped = min(self._skip, len(self._buffer))
+                del self._buffer[:skipped]
+                self._skip -= skipped
+                if self._skip:
+                    return
+            if self._state == "magic":
+                if len(self._buffer) < 5:
+                    return
+                magic = int.from_bytes(self._buffer[:4], "little")
+                if magic & _ZSTD_SKIPPABLE_MASK == _ZSTD_SKIPPABLE_MAGIC:
+                    if len(self._buffer) < 8:
+                        return
+                    self._skip = 8 + int.from_bytes(self._buffer[4:8], "little")
+                    continue
+                if magic != _ZSTD_MAGIC:
+                    # Not a frame; the decompressor reports it as invalid.
+                    self._buffer.clear()
+                    return
+                self._checksum = bool(self._buffer[4] & 0x04)
+                self._skip = zstandard.frame_header_size(bytes(self._buffer[:5]))
+                self._state = "block"
+            elif self._state == "block":
+                if len(self._buffer) < 3:
+                    return
+                header = int.from_bytes(self._buffer[:3], "little")
+                block_type, block_size = (header >> 1) & 0x3, header >> 3
+                # RLE blocks store one byte that is repeated block_size times.
+                self._skip = 3 + (1 if block_type == 1 else block_size)
+                if header & 0x1:
+                    self._state = "checksum"
+            else:
+                self._skip = 4 if self._checksum else 0
+                self._state = "magic"
+
+
+class _ZstdSink:
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._size = 0
+
+    def write(self, data: bytes) -> int:
+        self._size += len(data)
+        if self._size > ZSTD_MAX_STEP_OUTPUT_BYTES:
+            raise NdjsonDecodeError(
+                f"zstd body expands to more than {ZSTD_MAX_STEP_OUTPUT_BYTES} bytes from one input step."
+            )
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        output = b"".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        return output
+
+
+class _IdentityStream:
+    def decompress(self, data: bytes, max_length: int) -> tuple[bytes, bytes]:
+        return data, b""
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class NdjsonDecoder:
+    """Incrementally decompress and split an NDJSON body into objects.
+
+    ``feed`` takes raw body chunks as they arrive and lazily yields the
+    objects of every line completed so far. Decompression advances in bounded
+    steps between yields, so a highly compressed chunk never expands into
+    memory all at once; only the current partial line is buffered. Lines
+    longer than ``max_line_bytes`` are rejected.
+    """
+
+    def __init__(self, content_encoding: str = "identity", max_line_bytes: int = MAX_LINE_BYTES) -> None:
+        encoding = (content_encoding or "identity").strip().lower()
+        if encoding in {"gzip", "x-gzip"}:
+            self._stream = _GzipStream()
+        elif encoding == "zstd":
+            self._stream = _ZstdStream()
+        elif encoding == "identity":
+            self._stream = _IdentityStream()
+        else:
+            raise UnsupportedEncodingError(f"Unsupported content encoding: {content_encoding}")
+        self._max_line_bytes = max_line_bytes
+        self._buffer = bytearray()
+        self._scanned = 0
+        self._line_number = 0
+
+    def feed(self, data: bytes) -> Iterator[dict]:
+        pending = data
+        while pending:
+            try:
+                output, pending = self._stream.decompress(pending, DECOMPRESS_STEP_BYTES)
+            except zlib.error as exc:
+                raise NdjsonDecodeError(f"Invalid gzip body: {exc}") from exc
+            self._buffer += output
+            yield from self._split_lines()
+
+    def close(self) -> list[dict]:
+        self._buffer += self._stream.flush()
+        records = self._split_lines()
+        if self._buffer.strip():
+            self._line_number += 1
+            records.append(self._decode_line(bytes(self._buffer)))
+        self._buffer.clear()
+        self._scanned = 0
+        return records
+
+    def _split_lines(self) -> list[dict]:
+        records: list[dict] = []
+        start = 0
+        while True:
+            end = self._buffer.find(b"\n", max(start, self._scanned))
+            if end < 0:
+                break
+            self._line_number += 1
+            line = bytes(self._buffer[start:end])
+            start = end + 1
+            if line.strip():
+                records.append(self._decode_line(line))
+        del self._buffer[:start]
+        # The rest has no newline; the next search resumes after it.
+        self._scanned = len(self._buffer)
+        if len(self._buffer) > self._max_line_bytes:
+            raise NdjsonDecodeError(f"Line {self._line_number + 1} exceeds {self._max_line_bytes} bytes.")
+        return records
+
+    def _decode_line(self, line: bytes) -> dict:
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            raise NdjsonDecodeError(f"Line {self._line_number}: invalid JSON ({exc}).") from exc
+        if not isinstance(record, dict):
+            raise NdjsonDecodeError(f"Line {self._line_number}: expected a JSON object.")
+        return record
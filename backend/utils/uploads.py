@@ -0,0 +1,87 @@
+﻿from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+from typing import BinaryIO, Iterator
+
+from backend.config import MAX_UPLOAD_MB
+from backend.utils.metrics import BYTES_INGESTED, stage_timer
+
+
+UPLOAD_DIR = Path(__file__).resolve().parent.parent / "uploads"
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+MAX_UPLOAD_BYTES = MAX_UPLOAD_MB * 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class SavedUpload:
+    path: Path
+    sha256: str
+    size_bytes: int
+    filename: str
+
+
+def save_upload(
+    source: BinaryIO,
+    filename: str,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    chunk_size: int = UPLOAD_CHUNK_BYTES,
+    upload_dir: Path = UPLOAD_DIR,
+) -> SavedUpload:
+    """Copy ``source`` to a unique temp file in fixed-size chunks.
+
+    The SHA-256 of the content is computed during the copy, and the copy is
+    aborted with ``UploadTooLargeError`` as soon as ``max_bytes`` is exceeded.
+    Only the suffix of the client filename is kept, so concurrent uploads with
+    the same name never collide. The caller owns the returned file.
+    """
+    with stage_timer("upload"):
+        upload = _save_upload(source, filename, max_bytes, chunk_size, upload_dir)
+    BYTES_INGESTED.inc(upload.size_bytes, source="upload")
+    return upload
+
+
+def _save_upload(source: BinaryIO, filename: str, max_bytes: int, chunk_size: int, upload_dir: Path) -> SavedUpload:
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    suffix = Path(filename or "").suffix.lower()
+    handle, temp_name = tempfile.mkstemp(prefix="upload-", suffix=suffix, dir=upload_dir)
+    temp_path = Path(temp_name)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(handle, "wb") as target:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(upload_limit_message(max_bytes))
+                digest.update(chunk)
+                target.write(chunk)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return SavedUpload(path=temp_path, sha256=digest.hexdigest(), size_bytes=size, filename=filename)
+
+
+def upload_limit_message(max_bytes: int = MAX_UPLOAD_BYTES) -> str:
+    return f"File exceeds the {max_bytes // (1024 * 1024)} MB upload limit."
+
+
+@contextmanager
+def received_upload(source: BinaryIO, filename: str, **kwargs) -> Iterator[SavedUpload]:
+    upload = save_upload(source, filename, **kwargs)
+    try:
+        yield upload
+    finally:
+        upload.path.unlink(missing_ok=True)
@@ -8,6 +8,9 @@ let loginWindow = null;
 let collaboratorLogFile = null;
 
 const COLLAB_SESSION_PARTITION = 'persist:collaborator';
+const BACKEND_URL = 'http://127.0.0.1:8000/api';
+const BACKEND_HEALTH_POLL_MS = 250;
+const BACKEND_HEALTH_TIMEOUT_MS = 60000;
 
 function initCollaboratorLogs() {
   const logsDir = path.join(app.getPath('userData'), 'logs');
@@ -77,6 +80,35 @@ function startBackend() {
   backendProcess.on('exit', (code, signal) => {
     writeCollaboratorLog('backend:exit', 'Backend process exited.', { code, signal });
   });
+
+  warmUpBackend();
+}
+
+// The backend builds its services lazily; once it answers the health check,
+// ask it to preload them in the background so the first upload is not slowed
+// down by importing pandas and the parsers.
+async function warmUpBackend() {
+  const started = Date.now();
+  while (Date.now() - started < BACKEND_HEALTH_TIMEOUT_MS) {
+    if (!backendProcess || backendProcess.exitCode !== null) {
+      return;
+    }
+    try {
+      const health = await fetch(`${BACKEND_URL}/health`);
+      if (health.ok) {
+        writeCollaboratorLog('backend', 'Backend health check passed.', { elapsedMs: Date.now() - started });
+        const warmup = await fetch(`${BACKEND_URL}/warmup`, { method: 'POST' });
+        writeCollaboratorLog('backend', 'Requested backend warm-up.', { status: warmup.status });
+        return;
+      }
+    } catch (_err) {
+      // Not listening yet.
+    }
+    await new Promise((resolve) => setTimeout(resolve, BACKEND_HEALTH_POLL_MS));
+  }
+  writeCollaboratorLog('backend:error', 'Backend did not pass the health check in time.', {
+    timeoutMs: BACKEND_HEALTH_TIMEOUT_MS
+  });
 }
 
 function createWindow() {
@@ -239,6 +271,49 @@ ipcMain.handle('collaborator:has-session', async (_event, baseUrl) => {
   return { authenticated };
 });
 
+// Backend fetch jobs get the session cookies straight from the main process,
+// so HttpOnly cookies never reach the renderer. Only cookies for the
+// configured Collaborator origin are sent, and only to the local backend.
+ipcMain.handle('collaborator:start-fetch-job', async (_event, selectedFields, reviewIds) => {
+  const configResponse = await fetch(`${BACKEND_URL}/collaborator/config`);
+  if (!configResponse.ok) {
+    throw new Error(`Could not read Collaborator config (HTTP ${configResponse.status}).`);
+  }
+  const config = await configResponse.json();
+  const origin = new URL(config.base_url).origin;
+
+  const cookies = await getCollaboratorSession().cookies.get({ url: origin });
+  const values = {};
+  for (const cookie of cookies) {
+    values[cookie.name] = cookie.value;
+  }
+
+  const response = await fetch(`${BACKEND_URL}/collaborator/fetch-jobs`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({
+      selected_fields: Array.isArray(selectedFields) ? selectedFields : [],
+      review_ids: Array.isArray(reviewIds) ? reviewIds : null,
+      cookies: values
+    })
+  });
+  const body = await response.json().catch(() => ({}));
+  if (!response.ok) {
+    writeCollaboratorLog('fetch-job:error', 'Backend rejected fetch job.', {
+      origin,
+      status: response.status,
+      detail: body.detail
+    });
+    throw new Error(body.detail || `Backend fetch job failed (HTTP ${response.status}).`);
+  }
+  writeCollaboratorLog('fetch-job', 'Started backend fetch job.', {
+    origin,
+    cookieCount: cookies.length,
+    jobId: body.job_id
+  });
+  return body;
+});
+
 app.whenReady().then(() => {
   initCollaboratorLogs();
   startBackend();
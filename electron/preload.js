@@ -6,6 +6,8 @@ contextBridge.exposeInMainWorld('reviewpackets', {
     openLogin: (loginUrl) => ipcRenderer.invoke('collaborator:open-login', loginUrl),
     fetchHtml: (pageUrl) => ipcRenderer.invoke('collaborator:fetch-html', pageUrl),
     downloadPdfs: (jobs) => ipcRenderer.invoke('collaborator:download-pdfs', jobs),
-    hasSession: (baseUrl) => ipcRenderer.invoke('collaborator:has-session', baseUrl)
+    hasSession: (baseUrl) => ipcRenderer.invoke('collaborator:has-session', baseUrl),
+    startFetchJob: (selectedFields, reviewIds) =>
+      ipcRenderer.invoke('collaborator:start-fetch-job', selectedFields, reviewIds)
   }
 });
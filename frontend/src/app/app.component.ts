@@ -10,15 +10,16 @@ import { MatSelectModule } from '@angular/material/select';
 import { MatTableModule } from '@angular/material/table';
 import { MatSnackBar, MatSnackBarModule } from '@angular/material/snack-bar';
 import { MatProgressSpinnerModule } from '@angular/material/progress-spinner';
-import { finalize } from 'rxjs/operators';
-import { firstValueFrom } from 'rxjs';
+import { catchError, finalize } from 'rxjs/operators';
+import { defer, firstValueFrom, throwError } from 'rxjs';
 
 import { ApiService } from './services/api.service';
 import {
   CollaboratorConfigResponse,
   ValidationResultItem,
   ReviewHtmlItem,
-  PdfPlanItem
+  PdfPlanItem,
+  PdfPlanResponse
 } from './models/api.models';
 
 @Component({
@@ -56,6 +57,7 @@ export class AppComponent {
   availableCollaboratorFields: string[] = [];
   collaboratorSelectedFields: string[] = [];
   collaboratorResults: ValidationResultItem[] = [];
+  collaboratorRunId: string | null = null;
   collaboratorColumns: string[] = ['review_id', 'status', 'missing_fields', 'comment'];
   fetchProgress = 0;
 
@@ -250,6 +252,7 @@ export class AppComponent {
         this.collaboratorSelectedFields = [...this.availableCollaboratorFields];
       }
       this.collaboratorResults = parseResponse?.results || [];
+      this.collaboratorRunId = parseResponse?.run_id || null;
       this.showInfo(`Validated ${this.collaboratorResults.length} reviews.`);
     } catch (error: any) {
       this.showError(error?.message || 'Collaborator fetch/validation failed.');
@@ -264,7 +267,23 @@ export class AppComponent {
       return;
     }
 
-    this.api.exportCollaboratorCsv(this.collaboratorSelectedFields, this.collaboratorResults).subscribe({
+    const fromResults$ = defer(() =>
+      this.api.exportCollaboratorCsv(this.collaboratorSelectedFields, this.collaboratorResults)
+    );
+    const export$ = this.collaboratorRunId
+      ? this.api.exportCollaboratorRun(this.collaboratorRunId).pipe(
+          catchError((err) => {
+            if (err?.status !== 404) {
+              return throwError(() => err);
+            }
+            // The run expired or the backend restarted; export the results on screen instead.
+            this.collaboratorRunId = null;
+            return fromResults$;
+          })
+        )
+      : fromResults$;
+
+    export$.subscribe({
       next: (blob) => this.downloadBlob(blob, 'collaborator_validation.csv'),
       error: (err) => this.showError(err?.error?.detail || 'Failed to export Collaborator CSV.')
     });
@@ -286,10 +305,29 @@ export class AppComponent {
       return;
     }
 
-    const plan = await firstValueFrom(this.api.getPdfPlan(eligibleIds));
-    const jobs: PdfPlanItem[] = plan?.jobs || [];
-    const result = await api.downloadPdfs(jobs);
-    this.showInfo(`PDF complete: ${result.downloaded.length} success, ${result.failed.length} failed.`);
+    try {
+      const plan = await this.getCollaboratorPdfPlan(eligibleIds);
+      const jobs: PdfPlanItem[] = plan?.jobs || [];
+      const result = await api.downloadPdfs(jobs);
+      this.showInfo(`PDF complete: ${result.downloaded.length} success, ${result.failed.length} failed.`);
+    } catch (error: any) {
+      this.showError(error?.error?.detail || error?.message || 'PDF download failed.');
+    }
+  }
+
+  private async getCollaboratorPdfPlan(eligibleIds: string[]): Promise<PdfPlanResponse> {
+    if (this.collaboratorRunId) {
+      try {
+        return await firstValueFrom(this.api.getRunPdfPlan(this.collaboratorRunId));
+      } catch (error: any) {
+        if (error?.status !== 404) {
+          throw error;
+        }
+        // The run expired or the backend restarted; plan from the results on screen instead.
+        this.collaboratorRunId = null;
+      }
+    }
+    return firstValueFrom(this.api.getPdfPlan(eligibleIds));
   }
 
   private buildReviewUrl(reviewId: string): string {
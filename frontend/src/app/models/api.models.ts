@@ -21,6 +21,7 @@ export interface CollaboratorConfigResponse {
   request_timeout_seconds: number;
   max_retries: number;
   batch_size: number;
+  retry_backoff_seconds: number;
 }
 
 export interface ReviewIdsResponse {
@@ -38,11 +39,34 @@ export interface ValidationResultItem {
   missing_fields: string[];
   comment: string;
   status: string;
+  rule_failures?: string[];
 }
 
 export interface ParseValidateResponse {
   available_fields: string[];
   results: ValidationResultItem[];
+  cache_hits?: number;
+  cache_misses?: number;
+  cache_hit_ratio?: number;
+  plan_hits?: number;
+  plan_fallbacks?: number;
+  run_id?: string | null;
+}
+
+export interface ParseJobStatusResponse {
+  job_id: string;
+  status: string;
+  total: number;
+  completed: number;
+  complete: number;
+  incomplete: number;
+  failed: number;
+  cache_hits: number;
+  avg_review_ms: number;
+  max_review_ms: number;
+  created_at: string;
+  finished_at?: string | null;
+  error?: string | null;
 }
 
 export interface PdfPlanItem {
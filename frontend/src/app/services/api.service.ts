@@ -11,6 +11,7 @@ import {
   ReviewIdsResponse,
   ReviewHtmlItem,
   ParseValidateResponse,
+  ParseJobStatusResponse,
   ValidationResultItem,
   PdfPlanResponse
 } from '../models/api.models';
@@ -70,6 +71,10 @@ export class ApiService {
     });
   }
 
+  getParseJob(jobId: string): Observable<ParseJobStatusResponse> {
+    return this.http.get<ParseJobStatusResponse>(`${this.baseUrl}/collaborator/jobs/${encodeURIComponent(jobId)}`);
+  }
+
   exportCollaboratorCsv(selectedFields: string[], results: ValidationResultItem[]): Observable<Blob> {
     return this.http.post(`${this.baseUrl}/collaborator/export-csv`, {
       selected_fields: selectedFields,
@@ -77,6 +82,18 @@ export class ApiService {
     }, { responseType: 'blob' });
   }
 
+  exportCollaboratorRun(runId: string, status?: string): Observable<Blob> {
+    const params: Record<string, string> = status ? { status } : {};
+    return this.http.get(`${this.baseUrl}/collaborator/runs/${encodeURIComponent(runId)}/export`, {
+      params,
+      responseType: 'blob'
+    });
+  }
+
+  getRunPdfPlan(runId: string): Observable<PdfPlanResponse> {
+    return this.http.post<PdfPlanResponse>(`${this.baseUrl}/collaborator/runs/${encodeURIComponent(runId)}/pdf-plan`, null);
+  }
+
   getPdfPlan(eligibleReviewIds: string[]): Observable<PdfPlanResponse> {
     return this.http.post<PdfPlanResponse>(`${this.baseUrl}/collaborator/pdf-plan`, {
       eligible_review_ids: eligibleReviewIds